@@ -10,8 +10,15 @@ from airport.models import (
     Crew,
     Flight,
     Order,
+    OrderSummary,
     Ticket,
+    FareClass,
+    Fare,
+    DailyLowestFare,
+    DailyRouteStats,
+    ImportedFixture,
 )
+from airport.orders import save_order_summaries
 
 
 @admin.register(Country)
@@ -60,7 +67,8 @@ class AirplaneAdmin(admin.ModelAdmin):
         "airplane_type",
         "name",
         "rows",
-        "seats_in_row"
+        "seats_in_row",
+        "airplane_capacity"
     ]
     search_fields = ["name"]
     list_filter = ["airplane_type"]
@@ -79,7 +87,8 @@ class FlightAdmin(admin.ModelAdmin):
         "route",
         "airplane",
         "departure_time",
-        "arrival_time"
+        "arrival_time",
+        "flight_duration"
     ]
     search_fields = [
         "route__source__closest_big_city__name",
@@ -87,6 +96,56 @@ class FlightAdmin(admin.ModelAdmin):
     ]
 
 
+@admin.register(FareClass)
+class FareClassAdmin(admin.ModelAdmin):
+    list_display = ["id", "airplane", "name", "first_row", "last_row"]
+    list_filter = ["name"]
+    search_fields = ["airplane__name"]
+
+
+@admin.register(Fare)
+class FareAdmin(admin.ModelAdmin):
+    list_display = ["id", "flight", "fare_class", "price"]
+    list_filter = ["fare_class__name"]
+    search_fields = [
+        "flight__route__source__closest_big_city__name",
+        "flight__route__destination__closest_big_city__name"
+    ]
+
+
+@admin.register(DailyLowestFare)
+class DailyLowestFareAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "source_city",
+        "destination_city",
+        "date",
+        "price"
+    ]
+    search_fields = ["source_city__name", "destination_city__name"]
+
+
+@admin.register(DailyRouteStats)
+class DailyRouteStatsAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "date",
+        "route",
+        "airplane_type",
+        "flights_count",
+        "seats",
+        "tickets_sold",
+        "revenue"
+    ]
+    list_filter = ["airplane_type"]
+
+
+@admin.register(ImportedFixture)
+class ImportedFixtureAdmin(admin.ModelAdmin):
+    list_display = ["id", "name", "checksum", "objects_count", "imported_at"]
+    search_fields = ["name"]
+
+
 class TicketInLine(admin.TabularInline):
     model = Ticket
     extra = 1
@@ -102,6 +161,15 @@ class OrderAdmin(admin.ModelAdmin):
     ]
     search_fields = ["user"]
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        save_order_summaries(Order.objects.filter(pk=form.instance.pk))
+
+
+@admin.register(OrderSummary)
+class OrderSummaryAdmin(admin.ModelAdmin):
+    list_display = ["order", "tickets_count", "first_departure", "cities"]
+
 
 @admin.register(Ticket)
 class TicketAdmin(admin.ModelAdmin):
@@ -0,0 +1,285 @@
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from airport.models import DailyRouteStats, Fare, Flight, Ticket
+
+ANALYTICS_BATCH_SIZE = 1000
+
+ANALYTICS_GROUPS = {
+    "date": ("date",),
+    "route": ("route_id",),
+    "airplane_type": ("airplane_type_id", "airplane_type__name"),
+}
+
+
+def get_stats_key(route_id: int, airplane_type_id: int, departure_time):
+    return (
+        timezone.localtime(departure_time).date(),
+        route_id,
+        airplane_type_id,
+    )
+
+
+def get_flight_stats_keys(flights) -> dict:
+    return {
+        flight_id: get_stats_key(route_id, airplane_type_id, departure_time)
+        for flight_id, route_id, airplane_type_id, departure_time
+        in flights.values_list(
+            "id",
+            "route_id",
+            "airplane__airplane_type_id",
+            "departure_time",
+        ).iterator()
+    }
+
+
+def get_ticket_prices(flight_ids):
+    """
+    Loads the fares of the flights once and returns a function
+    giving the price of a (flight id, row) by the fare class of the row
+    """
+    fares = defaultdict(list)
+
+    for flight_id, first_row, last_row, price in Fare.objects.filter(
+        flight_id__in=flight_ids
+    ).values_list(
+        "flight_id", "fare_class__first_row", "fare_class__last_row", "price"
+    ).iterator():
+        fares[flight_id].append((first_row, last_row, price))
+
+    def get_price(flight_id: int, row: int) -> Decimal:
+        for first_row, last_row, price in fares[flight_id]:
+            if first_row <= row <= last_row:
+                return price
+
+        return Decimal(0)
+
+    return get_price
+
+
+def compute_route_stats(flights) -> dict:
+    flight_keys = {}
+    stats = defaultdict(lambda: [0, 0, 0, Decimal(0)])
+
+    for (
+        flight_id, route_id, airplane_type_id, capacity, departure_time
+    ) in flights.values_list(
+        "id",
+        "route_id",
+        "airplane__airplane_type_id",
+        "airplane__airplane_capacity",
+        "departure_time",
+    ).iterator():
+        key = get_stats_key(route_id, airplane_type_id, departure_time)
+        flight_keys[flight_id] = key
+        stats[key][0] += 1
+        stats[key][1] += capacity
+
+    get_price = get_ticket_prices(flights.values("id"))
+
+    for flight_id, row, sold in Ticket.objects.filter(
+        flight__in=flights.values("id")
+    ).values("flight_id", "row").annotate(
+        sold=Count("id")
+    ).values_list("flight_id", "row", "sold").iterator():
+        stats[flight_keys[flight_id]][2] += sold
+        stats[flight_keys[flight_id]][3] += sold * get_price(flight_id, row)
+
+    return stats
+
+
+def get_keys_filter(keys) -> Q:
+    return reduce(or_, (
+        Q(
+            route_id=route_id,
+            airplane__airplane_type_id=airplane_type_id,
+            departure_time__gte=timezone.make_aware(
+                datetime.combine(day, time.min)
+            ),
+            departure_time__lt=timezone.make_aware(
+                datetime.combine(day, time.min)
+            ) + timedelta(days=1),
+        )
+        for day, route_id, airplane_type_id in keys
+    ))
+
+
+def refresh_route_stats(keys):
+    """Recount the rollup rows of (date, route id, airplane type id) keys"""
+    keys = set(keys)
+
+    if not keys:
+        return
+
+    stats = compute_route_stats(Flight.objects.filter(get_keys_filter(keys)))
+
+    with transaction.atomic():
+        for day, route_id, airplane_type_id in keys:
+            key = (day, route_id, airplane_type_id)
+            rows = DailyRouteStats.objects.filter(
+                date=day,
+                route_id=route_id,
+                airplane_type_id=airplane_type_id,
+            )
+
+            if key not in stats:
+                rows.delete()
+                continue
+
+            flights_count, seats, tickets_sold, revenue = stats[key]
+            values = {
+                "flights_count": flights_count,
+                "seats": seats,
+                "tickets_sold": tickets_sold,
+                "revenue": revenue,
+            }
+
+            if not rows.update(**values):
+                DailyRouteStats.objects.create(
+                    date=day,
+                    route_id=route_id,
+                    airplane_type_id=airplane_type_id,
+                    **values
+                )
+
+
+def refresh_route_stats_on_commit(flights):
+    keys = set(get_flight_stats_keys(flights).values())
+
+    if keys:
+        transaction.on_commit(lambda: refresh_route_stats(keys))
+
+
+def rebuild_route_stats(
+        date_from=None,
+        date_to=None,
+        batch_size: int = ANALYTICS_BATCH_SIZE
+) -> int:
+    flights = Flight.objects.all()
+    rows = DailyRouteStats.objects.all()
+
+    if date_from:
+        flights = flights.filter(
+            departure_time__gte=timezone.make_aware(
+                datetime.combine(date_from, time.min)
+            )
+        )
+        rows = rows.filter(date__gte=date_from)
+
+    if date_to:
+        flights = flights.filter(
+            departure_time__lt=timezone.make_aware(
+                datetime.combine(date_to, time.min)
+            ) + timedelta(days=1)
+        )
+        rows = rows.filter(date__lte=date_to)
+
+    stats = compute_route_stats(flights)
+
+    with transaction.atomic():
+        rows.delete()
+        DailyRouteStats.objects.bulk_create(
+            (
+                DailyRouteStats(
+                    date=day,
+                    route_id=route_id,
+                    airplane_type_id=airplane_type_id,
+                    flights_count=flights_count,
+                    seats=seats,
+                    tickets_sold=tickets_sold,
+                    revenue=revenue,
+                )
+                for (day, route_id, airplane_type_id), (
+                    flights_count, seats, tickets_sold, revenue
+                ) in stats.items()
+            ),
+            batch_size=batch_size,
+        )
+
+    return len(stats)
+
+
+def record_order_stats(tickets: list):
+    """Add the tickets of a new order to the rollup rows"""
+    flight_ids = {ticket.flight_id for ticket in tickets}
+    flight_keys = get_flight_stats_keys(
+        Flight.objects.filter(id__in=flight_ids)
+    )
+    get_price = get_ticket_prices(flight_ids)
+    increments = defaultdict(lambda: [0, Decimal(0)])
+
+    for ticket in tickets:
+        key = flight_keys[ticket.flight_id]
+        increments[key][0] += 1
+        increments[key][1] += get_price(ticket.flight_id, ticket.row)
+
+    missing = []
+
+    for (day, route_id, airplane_type_id), (sold, revenue) in (
+        increments.items()
+    ):
+        updated = DailyRouteStats.objects.filter(
+            date=day,
+            route_id=route_id,
+            airplane_type_id=airplane_type_id,
+        ).update(
+            tickets_sold=F("tickets_sold") + sold,
+            revenue=F("revenue") + revenue,
+        )
+
+        if not updated:
+            missing.append((day, route_id, airplane_type_id))
+
+    refresh_route_stats(missing)
+
+
+def get_route_stats(date_from, date_to, group_by: str):
+    group_fields = ANALYTICS_GROUPS[group_by]
+
+    return DailyRouteStats.objects.filter(
+        date__gte=date_from,
+        date__lte=date_to,
+    ).values(*group_fields).annotate(
+        flights=Sum("flights_count"),
+        total_seats=Sum("seats"),
+        total_tickets_sold=Sum("tickets_sold"),
+        total_revenue=Sum("revenue"),
+    ).order_by(*group_fields)
+
+
+def get_load_factors(date_from, date_to, group_by: str) -> list:
+    return [
+        {
+            **{field: stats[field] for field in ANALYTICS_GROUPS[group_by]},
+            "flights": stats["flights"],
+            "seats": stats["total_seats"],
+            "tickets_sold": stats["total_tickets_sold"],
+            "load_factor": (
+                round(stats["total_tickets_sold"] / stats["total_seats"], 4)
+                if stats["total_seats"] else None
+            ),
+        }
+        for stats in get_route_stats(date_from, date_to, group_by)
+    ]
+
+
+def get_revenue(date_from, date_to, group_by: str) -> list:
+    return [
+        {
+            **{field: stats[field] for field in ANALYTICS_GROUPS[group_by]},
+            "tickets_sold": stats["total_tickets_sold"],
+            "revenue": stats["total_revenue"],
+            "average_fare": (
+                round(stats["total_revenue"] / stats["total_tickets_sold"], 2)
+                if stats["total_tickets_sold"] else None
+            ),
+        }
+        for stats in get_route_stats(date_from, date_to, group_by)
+    ]
@@ -0,0 +1,191 @@
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views import View
+from rest_framework.exceptions import (
+    APIException,
+    AuthenticationFailed,
+    NotAuthenticated,
+    NotFound,
+    Throttled,
+)
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from airport.flight_search import (
+    add_tickets_available,
+    aget_cached_flight_search,
+    aget_tickets_sold,
+    filter_flights,
+    get_flight_search_key,
+)
+from airport.models import Crew, Flight, Ticket
+from airport.paginations import TwoSizePagination
+from airport.serializers import (
+    FlightSearchSerializer,
+    LoadedFlightListSerializer,
+    LoadedFlightDetailSerializer,
+)
+from user.authentication import CachedProfileJWTAuthentication
+
+FLIGHT_RELATED_FIELDS = (
+    "route__source__closest_big_city",
+    "route__destination__closest_big_city",
+    "airplane__airplane_type",
+)
+
+
+async def load_list(queryset) -> list:
+    # aiterator() of Django 4.2 runs values_list() queries in the event loop,
+    # queries are awaited one by one as they share one thread anyway
+    return [item async for item in queryset]
+
+
+class AsyncReadOnlyAPIView(View):
+    """
+    Async Django view answering GET requests of authenticated users
+    with JSON, errors look like the ones of the DRF views
+    """
+
+    http_method_names = ["get"]
+    throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+    # the action and scopes of the sync view, so both share its limits
+    action = None
+    throttle_scopes = {}
+
+    async def check_throttles(self, request, user):
+        """APIView.check_throttles on the counters of the DRF views"""
+        drf_request = Request(request)
+        drf_request.user = user
+        durations = []
+
+        for throttle_class in self.throttle_classes:
+            throttle = throttle_class()
+
+            if not await sync_to_async(throttle.allow_request)(
+                    drf_request, self
+            ):
+                durations.append(throttle.wait())
+
+        if durations:
+            raise Throttled(
+                max(
+                    (
+                        duration for duration in durations
+                        if duration is not None
+                    ),
+                    default=None
+                )
+            )
+
+    async def get(self, request, *args, **kwargs):
+        authentication = CachedProfileJWTAuthentication()
+
+        try:
+            authenticated = await authentication.aauthenticate(request)
+
+            if authenticated is None:
+                raise NotAuthenticated()
+
+            await self.check_throttles(request, authenticated[0])
+            data = await self.get_data(request, *args, **kwargs)
+        except APIException as exception:
+            response = JsonResponse(
+                exception.detail
+                if isinstance(exception.detail, (list, dict))
+                else {"detail": exception.detail},
+                status=exception.status_code,
+                encoder=JSONEncoder,
+                safe=False,
+            )
+
+            if isinstance(exception, (NotAuthenticated, AuthenticationFailed)):
+                response["WWW-Authenticate"] = (
+                    authentication.authenticate_header(request)
+                )
+
+            if getattr(exception, "wait", None):
+                response["Retry-After"] = f"{int(exception.wait)}"
+
+            return response
+
+        return JsonResponse(data, encoder=JSONEncoder, safe=False)
+
+    async def get_data(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+
+class AsyncFlightSearchView(AsyncReadOnlyAPIView):
+    """Flights between two cities on a day, the cached FlightView search"""
+
+    action = "list"
+    throttle_scopes = {"list": "flight_search"}
+
+    async def load_flights(self, queryset) -> list:
+        flights = await load_list(
+            queryset.select_related(*FLIGHT_RELATED_FIELDS)
+        )
+        crew = await load_list(
+            Flight.crew.through.objects.filter(
+                flight_id__in=[flight.id for flight in flights]
+            ).order_by("crew__last_name").values_list(
+                "flight_id", "crew__first_name", "crew__last_name"
+            )
+        )
+        crew_names = {}
+
+        for flight_id, first_name, last_name in crew:
+            crew_names.setdefault(flight_id, []).append(
+                f"{first_name} {last_name}"
+            )
+
+        for flight in flights:
+            flight.crew_names = crew_names.get(flight.id, [])
+
+        return LoadedFlightListSerializer(flights, many=True).data
+
+    async def get_data(self, request):
+        search = FlightSearchSerializer(data=request.GET)
+        search.is_valid(raise_exception=True)
+        paginator = TwoSizePagination()
+        query_params = {
+            name: str(value) for name, value in search.validated_data.items()
+        }
+
+        flights = await aget_cached_flight_search(
+            get_flight_search_key(query_params, paginator.page_query_param),
+            lambda: self.load_flights(
+                filter_flights(Flight.objects.all(), query_params)
+            )
+        )
+        page = paginator.paginate_queryset(flights, Request(request))
+        sold = await aget_tickets_sold([flight["id"] for flight in page])
+
+        return paginator.get_paginated_response(
+            add_tickets_available(page, sold)
+        ).data
+
+
+class AsyncFlightDetailView(AsyncReadOnlyAPIView):
+    """FlightView retrieve with the flight, crew and seats"""
+
+    action = "retrieve"
+
+    async def get_data(self, request, pk: int):
+        try:
+            flight = await Flight.objects.select_related(
+                *FLIGHT_RELATED_FIELDS
+            ).aget(pk=pk)
+        except Flight.DoesNotExist:
+            raise NotFound()
+
+        flight.loaded_crew = await load_list(Crew.objects.filter(flights=pk))
+        taken_places = await load_list(
+            Ticket.objects.filter(flight_id=pk).only("row", "seat")
+        )
+        flight.loaded_taken_places = taken_places
+        flight.tickets_available = (
+            flight.airplane.airplane_capacity - len(taken_places)
+        )
+
+        return LoadedFlightDetailSerializer(flight).data
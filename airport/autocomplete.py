@@ -0,0 +1,127 @@
+from bisect import bisect_left, insort
+
+from airport.models import Airport, City, Country
+from airport.search import normalize_name
+from airport_api_service.caches import VersionedIndex
+
+AUTOCOMPLETE_INDEX_VERSION_KEY = "autocomplete_index_version"
+
+AUTOCOMPLETE_MODELS = {
+    "airport": Airport,
+    "city": City,
+    "country": Country,
+}
+
+
+def get_autocomplete_keys(name: str) -> list:
+    """Normalized name from every word, so "zhul" finds "Kyiv Zhuliany" """
+    words = normalize_name(name).split(" ")
+
+    return [" ".join(words[index:]) for index in range(len(words))]
+
+
+class AutocompleteIndex:
+    """
+    Sorted array of (key, type, id) entries,
+    every name starting with the query sits in one bisect range
+    """
+
+    def __init__(self, items):
+        self.entries = []
+        self.names = {}
+        self.keys = {}
+
+        for kind, item_id, name in items:
+            self.names[kind, item_id] = name
+            self.keys[kind, item_id] = get_autocomplete_keys(name)
+            self.entries.extend(
+                (key, kind, item_id) for key in self.keys[kind, item_id]
+            )
+
+        self.entries.sort()
+
+    def add(self, kind: str, item_id: int, name: str):
+        self.remove(kind, item_id)
+
+        self.names[kind, item_id] = name
+        self.keys[kind, item_id] = get_autocomplete_keys(name)
+
+        for key in self.keys[kind, item_id]:
+            insort(self.entries, (key, kind, item_id))
+
+    def remove(self, kind: str, item_id: int):
+        self.names.pop((kind, item_id), None)
+
+        for key in self.keys.pop((kind, item_id), []):
+            index = bisect_left(self.entries, (key, kind, item_id))
+
+            if (
+                index < len(self.entries)
+                and self.entries[index] == (key, kind, item_id)
+            ):
+                del self.entries[index]
+
+    def search(self, query: str, limit: int, kinds=None) -> list:
+        prefix = normalize_name(query)
+
+        if not prefix:
+            return []
+
+        found = []
+        seen = set()
+
+        for index in range(
+            bisect_left(self.entries, (prefix,)), len(self.entries)
+        ):
+            key, kind, item_id = self.entries[index]
+
+            if not key.startswith(prefix) or len(found) == limit:
+                break
+
+            if (kinds and kind not in kinds) or (kind, item_id) in seen:
+                continue
+
+            seen.add((kind, item_id))
+            found.append({
+                "id": item_id,
+                "type": kind,
+                "name": self.names[kind, item_id],
+            })
+
+        return found
+
+
+def build_autocomplete_index() -> AutocompleteIndex:
+    return AutocompleteIndex(
+        (kind, item_id, name)
+        for kind, model in AUTOCOMPLETE_MODELS.items()
+        for item_id, name in model.objects.values_list("id", "name")
+    )
+
+
+_autocomplete_index = VersionedIndex(
+    AUTOCOMPLETE_INDEX_VERSION_KEY, build_autocomplete_index
+)
+
+
+def get_autocomplete_index() -> AutocompleteIndex:
+    return _autocomplete_index.get()
+
+
+def update_autocomplete_index(kind: str, item_id: int, name: str = None):
+    """
+    Once the write commits, apply it to the index of this process
+    and make other processes rebuild theirs on the next read
+    """
+
+    def change(index: AutocompleteIndex):
+        if name is None:
+            index.remove(kind, item_id)
+        else:
+            index.add(kind, item_id, name)
+
+    _autocomplete_index.update(change)
+
+
+def invalidate_autocomplete_index():
+    _autocomplete_index.invalidate()
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import logging
+from urllib.parse import urlsplit
+
+from asgiref.sync import async_to_sync
+from django.db.models import Case, When
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from airport.helper import filter_by_ids, get_ids
+
+BATCH_MAX_IDS = 100
+BATCH_MAX_REQUESTS = 20
+BATCH_URL_NAME = "batch"
+# the API views, the others need the middleware the batch skips
+BATCH_NAMESPACES = {"airport", "user"}
+
+logger = logging.getLogger(__name__)
+
+
+def order_by_ids(queryset, ids: list):
+    """Objects of the ids in one query, in the order of the ids"""
+    return filter_by_ids(queryset, "pk", ids).order_by(
+        Case(*[When(pk=pk, then=position) for position, pk in enumerate(ids)])
+    )
+
+
+# the view serves "batch" with its retrieve serializer and queryset
+class BatchRetrieveMixin:
+    @extend_schema(
+        description="Retrieve representation of the objects of the ids "
+                    "in the order of the ids, ids not found are skipped",
+        parameters=[
+            OpenApiParameter(
+                "ids",
+                type={"type": "list", "items": {"type": "number"}},
+                description=f"Up to {BATCH_MAX_IDS} ids (ex. ?ids=3,1,2)",
+                required=True,
+            ),
+        ]
+    )
+    @action(detail=False, methods=["GET"], url_path="batch")
+    def batch(self, request):
+        ids = get_ids(
+            request.query_params.get("ids", ""), max_length=BATCH_MAX_IDS
+        )
+
+        if not ids:
+            raise serializers.ValidationError(
+                {"ids": "This field is required"}
+            )
+
+        return Response(
+            self.get_serializer(
+                order_by_ids(self.get_queryset(), ids), many=True
+            ).data
+        )
+
+
+def get_sub_request(request, path: str, query: str) -> HttpRequest:
+    """GET request of the path made with the headers of the request"""
+    sub_request = HttpRequest()
+    sub_request.method = "GET"
+    sub_request.path = sub_request.path_info = path
+    sub_request.META = {
+        **request.META,
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+    }
+    sub_request.GET = QueryDict(query)
+    sub_request.COOKIES = request.COOKIES
+
+    return sub_request
+
+
+def get_batch_response(request, url: str) -> dict:
+    path, query = urlsplit(url)[2:4]
+
+    try:
+        match = resolve(path)
+    except Resolver404:
+        match = None
+
+    if (
+        match is None
+        or match.namespace not in BATCH_NAMESPACES
+        or match.url_name == BATCH_URL_NAME
+    ):
+        return {
+            "url": url,
+            "status": status.HTTP_404_NOT_FOUND,
+            "body": {"detail": "Not found."},
+        }
+
+    view = match.func
+
+    if asyncio.iscoroutinefunction(view):
+        view = async_to_sync(view)
+
+    try:
+        response = view(
+            get_sub_request(request, path, query), *match.args, **match.kwargs
+        )
+    except Exception:
+        # one failing request doesn't fail the others
+        logger.exception("Batch request of %s failed", url)
+
+        return {
+            "url": url,
+            "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "body": {"detail": "A server error occurred."},
+        }
+
+    if isinstance(response, Response):
+        body = response.data
+    elif response.get("Content-Type") == "application/json":
+        body = json.loads(response.content)
+    else:
+        body = None
+
+    return {"url": url, "status": response.status_code, "body": body}
+
+
+def run_batch(request, urls: list) -> list:
+    """
+    Responses of GET requests of the urls made with the authentication
+    of the request, one HTTP request for the client instead of many
+    """
+    return [get_batch_response(request, url) for url in urls]
@@ -0,0 +1,73 @@
+from airport.models import Flight
+
+AUDIT_CHUNK_SIZE = 5000
+
+
+def get_airplane_conflicts(
+        airplane,
+        departure_time,
+        arrival_time,
+        flight_id: int = None
+):
+    return Flight.objects.filter(
+        airplane=airplane,
+        departure_time__lt=arrival_time,
+        arrival_time__gt=departure_time,
+    ).exclude(id=flight_id)
+
+
+def get_crew_conflicts(
+        crew: list,
+        departure_time,
+        arrival_time,
+        flight_id: int = None
+):
+    return Flight.crew.through.objects.filter(
+        crew__in=crew,
+        flight__departure_time__lt=arrival_time,
+        flight__arrival_time__gt=departure_time,
+    ).exclude(flight_id=flight_id)
+
+
+def find_overlaps(rows):
+    """
+    Sweep rows of (key, flight_id, departure_time, arrival_time)
+    sorted by key and departure time, yield overlapping pairs
+    """
+    current_key = None
+    latest = None
+
+    for key, flight_id, departure_time, arrival_time in rows:
+        if key != current_key:
+            current_key = key
+            latest = (flight_id, arrival_time)
+            continue
+
+        if departure_time < latest[1]:
+            yield key, latest[0], flight_id
+
+        if arrival_time > latest[1]:
+            latest = (flight_id, arrival_time)
+
+
+def audit_airplane_conflicts():
+    rows = Flight.objects.order_by(
+        "airplane_id", "departure_time"
+    ).values_list(
+        "airplane_id", "id", "departure_time", "arrival_time"
+    ).iterator(chunk_size=AUDIT_CHUNK_SIZE)
+
+    return find_overlaps(rows)
+
+
+def audit_crew_conflicts():
+    rows = Flight.crew.through.objects.order_by(
+        "crew_id", "flight__departure_time"
+    ).values_list(
+        "crew_id",
+        "flight_id",
+        "flight__departure_time",
+        "flight__arrival_time"
+    ).iterator(chunk_size=AUDIT_CHUNK_SIZE)
+
+    return find_overlaps(rows)
@@ -0,0 +1,80 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework import serializers
+
+EXPORT_CHUNK_SIZE = 2000
+
+TICKET_EXPORT_FIELDS = (
+    ("id", "id"),
+    ("flight", "flight_id"),
+    ("row", "row"),
+    ("seat", "seat"),
+    ("order", "order_id"),
+    ("user", "order__user__email"),
+    ("ordered_at", "order__created_at"),
+)
+
+ORDER_EXPORT_FIELDS = (
+    ("id", "id"),
+    ("created_at", "created_at"),
+    ("user", "user__email"),
+    ("tickets", "tickets_count"),
+)
+
+
+class Echo:
+    """File-like object that hands written lines back to the caller"""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(header, rows):
+    writer = csv.writer(Echo())
+
+    yield writer.writerow(header)
+
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def ndjson_lines(header, rows):
+    for row in rows:
+        yield json.dumps(dict(zip(header, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+EXPORT_FORMATS = {
+    "csv": (csv_lines, "text/csv"),
+    "ndjson": (ndjson_lines, "application/x-ndjson"),
+}
+
+
+def stream_export(
+        queryset,
+        fields: tuple,
+        export_format: str,
+        filename: str
+):
+    if export_format not in EXPORT_FORMATS:
+        raise serializers.ValidationError({
+            "export_format": f"{export_format} is not supported, "
+                             f"choose one of: {', '.join(EXPORT_FORMATS)}"
+        })
+
+    render, content_type = EXPORT_FORMATS[export_format]
+    header = [label for label, _ in fields]
+    rows = queryset.values_list(
+        *(lookup for _, lookup in fields)
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+    response = StreamingHttpResponse(
+        render(header, rows), content_type=content_type
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{filename}.{export_format}"'
+    )
+
+    return response
@@ -0,0 +1,104 @@
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Min
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from airport.models import DailyLowestFare, Fare
+
+FARE_CALENDAR_DAYS = 60
+LOWEST_FARES_BATCH_SIZE = 1000
+
+
+def get_lowest_fare(from_city: int, to_city: int, day):
+    start = timezone.make_aware(datetime.combine(day, time.min))
+
+    return Fare.objects.filter(
+        flight__route__source__closest_big_city_id=from_city,
+        flight__route__destination__closest_big_city_id=to_city,
+        flight__departure_time__gte=start,
+        flight__departure_time__lt=start + timedelta(days=1),
+    ).aggregate(price=Min("price"))["price"]
+
+
+def refresh_daily_lowest_fares(entries: list):
+    """
+    Recount the lowest fare of the days listing any of the
+    (source city id, destination city id, departure time) entries
+    """
+    days = {
+        (from_city, to_city, timezone.localtime(departure_time).date())
+        for from_city, to_city, departure_time in entries
+    }
+
+    def refresh():
+        for from_city, to_city, day in days:
+            price = get_lowest_fare(from_city, to_city, day)
+            lowest_fare = DailyLowestFare.objects.filter(
+                source_city_id=from_city,
+                destination_city_id=to_city,
+                date=day,
+            )
+
+            if price is None:
+                lowest_fare.delete()
+            elif not lowest_fare.update(price=price):
+                DailyLowestFare.objects.create(
+                    source_city_id=from_city,
+                    destination_city_id=to_city,
+                    date=day,
+                    price=price,
+                )
+
+    if days:
+        transaction.on_commit(refresh)
+
+
+def rebuild_daily_lowest_fares(
+        batch_size: int = LOWEST_FARES_BATCH_SIZE
+) -> int:
+    lowest_fares = Fare.objects.annotate(
+        date=TruncDate("flight__departure_time"),
+    ).values(
+        "flight__route__source__closest_big_city_id",
+        "flight__route__destination__closest_big_city_id",
+        "date",
+    ).annotate(
+        price=Min("price")
+    ).order_by().values_list(
+        "flight__route__source__closest_big_city_id",
+        "flight__route__destination__closest_big_city_id",
+        "date",
+        "price",
+    )
+
+    with transaction.atomic():
+        DailyLowestFare.objects.all().delete()
+        created = DailyLowestFare.objects.bulk_create(
+            (
+                DailyLowestFare(
+                    source_city_id=from_city,
+                    destination_city_id=to_city,
+                    date=day,
+                    price=price,
+                )
+                for from_city, to_city, day, price in lowest_fares
+            ),
+            batch_size=batch_size,
+        )
+
+    return len(created)
+
+
+def get_fare_calendar(from_city: int, to_city: int) -> list:
+    today = timezone.localdate()
+
+    return list(
+        DailyLowestFare.objects.filter(
+            source_city_id=from_city,
+            destination_city_id=to_city,
+            date__gte=today,
+            date__lt=today + timedelta(days=FARE_CALENDAR_DAYS),
+        ).values("date", "price")
+    )
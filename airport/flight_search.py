@@ -0,0 +1,293 @@
+from datetime import date
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from rest_framework import serializers
+
+from airport.models import City, Airport, Route, Crew, Flight, Ticket
+from airport.spatial import get_city_airport_ids
+from airport_api_service.caches import shared_cache
+
+FLIGHT_SEARCH_TIMEOUT = 60 * 10
+FLIGHT_SEARCH_KEY = "flight_search:{from_city}:{to_city}:{day}:{ordering}"
+# a count read while a ticket commits misses its increment,
+# the timeout bounds how long such a count is served
+TICKETS_SOLD_TIMEOUT = 60 * 10
+TICKETS_SOLD_KEY = "flight_tickets_sold:{flight_id}"
+
+FLIGHT_SEARCH_MAX_RADIUS = 1000
+
+FLIGHT_SEARCH_PARAMS = {"from", "to", "departure_date", "ordering"}
+
+# flight paths to the objects the search results show
+FLIGHT_SEARCH_NAME_PATHS = {
+    City: (
+        "route__source__closest_big_city",
+        "route__destination__closest_big_city",
+    ),
+    Airport: ("route__source", "route__destination"),
+    Route: ("route",),
+    Crew: ("crew",),
+}
+
+FLIGHT_ORDERING = {
+    "duration": "flight_duration",
+    "-duration": "-flight_duration",
+    "departure_time": "departure_time",
+    "-departure_time": "-departure_time",
+}
+
+
+def filter_flights(queryset, query_params):
+    """
+    Flights of the departure_date, arrival_date, to, from,
+    radius and ordering query parameters
+    """
+    departure_date = query_params.get("departure_date")
+    arrival_date = query_params.get("arrival_date")
+    to_city = query_params.get("to")
+    from_city = query_params.get("from")
+    radius = query_params.get("radius")
+    ordering = query_params.get("ordering")
+
+    if departure_date:
+        queryset = queryset.filter(departure_time__date=departure_date)
+
+    if arrival_date:
+        queryset = queryset.filter(arrival_time__date=arrival_date)
+
+    if radius:
+        radius = serializers.IntegerField(
+            min_value=0, max_value=FLIGHT_SEARCH_MAX_RADIUS
+        ).run_validation(radius)
+
+    if to_city and radius:
+        queryset = queryset.filter(
+            route__destination_id__in=get_city_airport_ids(to_city, radius)
+        )
+    elif to_city:
+        queryset = queryset.filter(
+            route__destination__closest_big_city_id=to_city
+        )
+
+    if from_city and radius:
+        queryset = queryset.filter(
+            route__source_id__in=get_city_airport_ids(from_city, radius)
+        )
+    elif from_city:
+        queryset = queryset.filter(
+            route__source__closest_big_city_id=from_city
+        )
+
+    if ordering in FLIGHT_ORDERING:
+        queryset = queryset.order_by(FLIGHT_ORDERING[ordering], "id")
+
+    return queryset
+
+
+def get_flight_search_key(query_params, page_query_param: str):
+    """
+    Cache key of a (from, to, departure_date) search,
+    None when the request has any other filter
+    """
+    if set(query_params) - FLIGHT_SEARCH_PARAMS - {page_query_param}:
+        return None
+
+    try:
+        from_city = int(query_params["from"])
+        to_city = int(query_params["to"])
+        day = date.fromisoformat(query_params["departure_date"])
+    except (KeyError, ValueError):
+        return None
+
+    ordering = query_params.get("ordering", "")
+
+    return FLIGHT_SEARCH_KEY.format(
+        from_city=from_city,
+        to_city=to_city,
+        day=day,
+        ordering=ordering if ordering in FLIGHT_ORDERING else "",
+    )
+
+
+def without_tickets_available(flights) -> list:
+    """Serialized flights to cache, availability is added on every read"""
+    return [{**flight, "tickets_available": None} for flight in flights]
+
+
+def get_cached_flight_search(key: str, load) -> list:
+    """Serialized flights of the search without the availability numbers"""
+    flights = shared_cache.get(key)
+
+    if flights is None:
+        flights = without_tickets_available(load())
+        shared_cache.set(key, flights, FLIGHT_SEARCH_TIMEOUT)
+
+    return flights
+
+
+async def aget_cached_flight_search(key: str, load) -> list:
+    """get_cached_flight_search for async views, load is awaited"""
+    flights = await shared_cache.aget(key)
+
+    if flights is None:
+        flights = without_tickets_available(await load())
+        await shared_cache.aset(key, flights, FLIGHT_SEARCH_TIMEOUT)
+
+    return flights
+
+
+def count_tickets_sold(flight_ids: list):
+    return Ticket.objects.filter(flight_id__in=flight_ids).values(
+        "flight_id"
+    ).annotate(
+        sold=Count("id")
+    ).values_list("flight_id", "sold")
+
+
+def get_tickets_sold_keys(flight_ids: list) -> dict:
+    """Cache keys of the sold tickets counters with their flight ids"""
+    return {
+        TICKETS_SOLD_KEY.format(flight_id=flight_id): flight_id
+        for flight_id in flight_ids
+    }
+
+
+def split_tickets_sold(keys: dict, cached: dict) -> tuple:
+    """Counters found in the cache and the flight ids left to count"""
+    sold = {keys[key]: count for key, count in cached.items()}
+    missing = [
+        flight_id for flight_id in keys.values() if flight_id not in sold
+    ]
+
+    return sold, missing
+
+
+def add_counted_tickets_sold(sold: dict, missing: list, counted: dict):
+    """Add the counted flights to sold, return their counters to cache"""
+    sold.update(
+        {flight_id: counted.get(flight_id, 0) for flight_id in missing}
+    )
+
+    return {
+        TICKETS_SOLD_KEY.format(flight_id=flight_id): sold[flight_id]
+        for flight_id in missing
+    }
+
+
+def get_tickets_sold(flight_ids: list) -> dict:
+    keys = get_tickets_sold_keys(flight_ids)
+    sold, missing = split_tickets_sold(keys, shared_cache.get_many(keys))
+
+    if missing:
+        counted = dict(count_tickets_sold(missing))
+        shared_cache.set_many(
+            add_counted_tickets_sold(sold, missing, counted),
+            TICKETS_SOLD_TIMEOUT
+        )
+
+    return sold
+
+
+async def aget_tickets_sold(flight_ids: list) -> dict:
+    """get_tickets_sold for async views"""
+    keys = get_tickets_sold_keys(flight_ids)
+    sold, missing = split_tickets_sold(
+        keys, await shared_cache.aget_many(keys)
+    )
+
+    if missing:
+        counted = {
+            flight_id: count
+            async for flight_id, count
+            in count_tickets_sold(missing)
+        }
+        await shared_cache.aset_many(
+            add_counted_tickets_sold(sold, missing, counted),
+            TICKETS_SOLD_TIMEOUT
+        )
+
+    return sold
+
+
+def add_tickets_available(flights: list, sold: dict) -> list:
+    return [
+        {
+            **flight,
+            "tickets_available": (
+                flight["airplane_capacity"] - sold[flight["id"]]
+            ),
+        }
+        for flight in flights
+    ]
+
+
+def with_tickets_available(flights: list) -> list:
+    return add_tickets_available(
+        flights, get_tickets_sold([flight["id"] for flight in flights])
+    )
+
+
+def change_tickets_sold(flight_id: int, delta: int):
+    def change():
+        try:
+            shared_cache.incr(
+                TICKETS_SOLD_KEY.format(flight_id=flight_id), delta
+            )
+        except ValueError:
+            # not counted yet, the next read counts it from the database
+            pass
+
+    transaction.on_commit(change)
+
+
+def get_flight_search_entries(flights) -> list:
+    return list(
+        flights.values_list(
+            "route__source__closest_big_city_id",
+            "route__destination__closest_big_city_id",
+            "departure_time",
+        )
+    )
+
+
+def get_flights_showing(instance):
+    """Flights whose search results show the city, airport, route or crew"""
+    query = Q()
+
+    for path in FLIGHT_SEARCH_NAME_PATHS[type(instance)]:
+        query |= Q(**{path: instance})
+
+    return Flight.objects.filter(query).distinct()
+
+
+def invalidate_flight_searches(entries: list):
+    """
+    Drop the searches listing any of the
+    (source city id, destination city id, departure time) entries
+    """
+    keys = {
+        FLIGHT_SEARCH_KEY.format(
+            from_city=from_city,
+            to_city=to_city,
+            day=timezone.localtime(departure_time).date(),
+            ordering=ordering,
+        )
+        for from_city, to_city, departure_time in entries
+        for ordering in ["", *FLIGHT_ORDERING]
+    }
+
+    if keys:
+        transaction.on_commit(lambda: shared_cache.delete_many(list(keys)))
+
+
+def invalidate_tickets_sold(flight_ids):
+    """Drop the sold tickets counters, the next read counts them again"""
+    keys = [
+        TICKETS_SOLD_KEY.format(flight_id=flight_id)
+        for flight_id in flight_ids
+    ]
+
+    if keys:
+        transaction.on_commit(lambda: shared_cache.delete_many(keys))
@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def great_circle_distance(
+        latitude1: float,
+        longitude1: float,
+        latitude2: float,
+        longitude2: float
+) -> float:
+    latitude1, longitude1, latitude2, longitude2 = map(
+        math.radians, (latitude1, longitude1, latitude2, longitude2)
+    )
+    haversine = (
+        math.sin((latitude2 - latitude1) / 2) ** 2
+        + math.cos(latitude1) * math.cos(latitude2)
+        * math.sin((longitude2 - longitude1) / 2) ** 2
+    )
+
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(haversine))
+
+
+def great_circle_distances(
+        latitudes1: np.ndarray,
+        longitudes1: np.ndarray,
+        latitudes2: np.ndarray,
+        longitudes2: np.ndarray
+) -> np.ndarray:
+    latitudes1, longitudes1, latitudes2, longitudes2 = map(
+        np.radians, (latitudes1, longitudes1, latitudes2, longitudes2)
+    )
+    haversine = (
+        np.sin((latitudes2 - latitudes1) / 2) ** 2
+        + np.cos(latitudes1) * np.cos(latitudes2)
+        * np.sin((longitudes2 - longitudes1) / 2) ** 2
+    )
+
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(haversine))
+
+
+def to_unit_vector(latitude: float, longitude: float) -> tuple:
+    latitude, longitude = math.radians(latitude), math.radians(longitude)
+
+    return (
+        math.cos(latitude) * math.cos(longitude),
+        math.cos(latitude) * math.sin(longitude),
+        math.sin(latitude),
+    )
+
+
+def chord_to_distance(chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+
+
+def distance_to_chord(distance: float) -> float:
+    return 2 * math.sin(min(distance / EARTH_RADIUS_KM, math.pi) / 2)
+
+
+def squared_chord(first: tuple, second: tuple) -> float:
+    return sum((a - b) ** 2 for a, b in zip(first, second))
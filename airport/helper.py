@@ -1,14 +1,25 @@
 import json
 import os
+from datetime import datetime, time
 
 import requests
+from django.db import connections
+from django.db.models import ForeignKey, IntegerField, Lookup
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from dotenv import load_dotenv
 
-from rest_framework import status
+from rest_framework import serializers, status
 
 
 load_dotenv()
 
+IDS_MAX_LENGTH = 1000
+# the largest bigint, bigger ids can't be compared with id columns
+ID_MAX_VALUE = 2 ** 63 - 1
+# longer id lists are matched by a join with the unnested array
+IDS_JOIN_MIN_LENGTH = 100
+
 
 class WeatherAPI:
     BASE_URL = "http://api.weatherapi.com/v1/current.json"
@@ -38,8 +49,81 @@ class WeatherAPI:
             return "error"
 
 
-def get_ids(queryset):
-    return [
-        object_id
-        for object_id in queryset.split(",")
-    ]
+def get_ids(
+    value: str, field_name: str = "ids", max_length: int = IDS_MAX_LENGTH
+) -> list:
+    """
+    Unique ids of a comma separated list (ex. "3,1,3" -> [3, 1]),
+    in the order they were given
+    """
+    ids = {}
+
+    for object_id in value.split(","):
+        object_id = object_id.strip()
+
+        if not object_id:
+            continue
+
+        if (
+            not object_id.isascii()
+            or not object_id.isdigit()
+            or int(object_id) > ID_MAX_VALUE
+        ):
+            raise serializers.ValidationError({
+                f"{field_name}": f"{object_id} is not a valid id"
+            })
+
+        ids[int(object_id)] = None
+
+        if len(ids) > max_length:
+            raise serializers.ValidationError({
+                f"{field_name}": f"Ensure there are no more than "
+                                 f"{max_length} ids"
+            })
+
+    return list(ids)
+
+
+@IntegerField.register_lookup
+@ForeignKey.register_lookup
+class InArray(Lookup):
+    """
+    field__in_array=[1, 2, 3] on PostgreSQL, the ids are one array
+    parameter the planner can hash join instead of a long IN list,
+    for integer fields and foreign keys to integer primary keys
+    """
+
+    lookup_name = "in_array"
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+
+        return (
+            f"{lhs} IN (SELECT UNNEST(%s::bigint[]))",
+            [*lhs_params, list(self.rhs)],
+        )
+
+
+def filter_by_ids(queryset, field_name: str, ids: list):
+    if (
+        len(ids) >= IDS_JOIN_MIN_LENGTH
+        and connections[queryset.db].vendor == "postgresql"
+    ):
+        return queryset.filter(**{f"{field_name}__in_array": ids})
+
+    return queryset.filter(**{f"{field_name}__in": ids})
+
+
+def get_day_start(field_name: str, value: str):
+    try:
+        date = parse_date(value or "")
+    except ValueError:
+        date = None
+
+    if date is None:
+        raise serializers.ValidationError({
+            f"{field_name}": f"{value} should be in format year-month-day"
+        })
+
+    return timezone.make_aware(datetime.combine(date, time.min))
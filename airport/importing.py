@@ -0,0 +1,288 @@
+import hashlib
+import json
+from collections import defaultdict
+
+from django.apps import apps
+from django.core.management.color import no_style
+from django.core.serializers import python, sort_dependencies
+from django.db import connection, transaction
+
+from airport.analytics import rebuild_route_stats
+from airport.autocomplete import invalidate_autocomplete_index
+from airport.fares import rebuild_daily_lowest_fares
+from airport.flight_search import (
+    get_flight_search_entries,
+    invalidate_flight_searches,
+    invalidate_tickets_sold,
+)
+from airport.models import (
+    Country,
+    City,
+    Airport,
+    Route,
+    AirplaneType,
+    Airplane,
+    Crew,
+    Flight,
+    Order,
+    Ticket,
+    ImportedFixture,
+)
+from airport.orders import save_order_summaries
+from airport.search import invalidate_search_index
+from airport.spatial import invalidate_airport_index
+
+IMPORT_BATCH_SIZE = 5000
+FIXTURE_READ_SIZE = 1 << 16
+FIXTURE_EXTENSIONS = ("", ".json", ".ndjson", ".jsonl")
+
+JSON_SEPARATORS = " \t\r\n,[]"
+
+
+def get_file_checksum(path: str) -> str:
+    checksum = hashlib.sha256()
+
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(FIXTURE_READ_SIZE), b""):
+            checksum.update(chunk)
+
+    return checksum.hexdigest()
+
+
+def iterate_fixture_objects(file, read_size: int = FIXTURE_READ_SIZE):
+    """
+    Objects of a JSON array or of NDJSON lines, decoded one at a time
+    from a buffer holding little more than the current object
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+
+    while True:
+        while position < len(buffer) and buffer[position] in JSON_SEPARATORS:
+            position += 1
+
+        try:
+            item, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            chunk = file.read(read_size)
+
+            if not chunk:
+                if position < len(buffer):
+                    raise
+
+                return
+
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        if not isinstance(item, dict):
+            raise ValueError(f"Fixture objects must be JSON objects: {item}")
+
+        yield item
+
+
+def strip_names(objects: list, *fields, title: bool = False):
+    for item in objects:
+        for field in fields:
+            value = getattr(item, field)
+            setattr(item, field, (value.title() if title else value).strip())
+
+
+def normalize_routes(routes: list):
+    airports = Airport.objects.in_bulk(
+        {route.source_id for route in routes}
+        | {route.destination_id for route in routes}
+    )
+
+    for route in routes:
+        if route.source_id in airports and route.destination_id in airports:
+            route.source = airports[route.source_id]
+            route.destination = airports[route.destination_id]
+
+            if route.has_coordinates:
+                route.set_distance()
+
+
+def normalize_airplanes(airplanes: list):
+    strip_names(airplanes, "name")
+
+    for airplane in airplanes:
+        airplane.set_airplane_capacity()
+
+
+def normalize_flights(flights: list):
+    for flight in flights:
+        flight.set_flight_duration()
+
+
+# the same changes the save() of each model makes, applied to a whole batch
+FIXTURE_NORMALIZERS = {
+    Country: lambda countries: strip_names(countries, "name", title=True),
+    City: lambda cities: strip_names(cities, "name"),
+    Airport: lambda airports: strip_names(airports, "name", title=True),
+    Route: normalize_routes,
+    AirplaneType: lambda types: strip_names(types, "name"),
+    Airplane: normalize_airplanes,
+    Crew: lambda crew: strip_names(
+        crew, "first_name", "last_name", title=True
+    ),
+    Flight: normalize_flights,
+}
+
+
+def refresh_derived_data(flights, batch_size: int = IMPORT_BATCH_SIZE):
+    """
+    Rebuild the rollups and drop the caches and indexes
+    which signals keep current, after rows are written with bulk_create
+    """
+    rebuild_route_stats(batch_size=batch_size)
+    rebuild_daily_lowest_fares(batch_size=batch_size)
+    save_order_summaries(
+        Order.objects.filter(summary__isnull=True), batch_size=batch_size
+    )
+    invalidate_flight_searches(get_flight_search_entries(flights))
+    invalidate_tickets_sold(flights.values_list("id", flat=True))
+    invalidate_airport_index()
+    invalidate_autocomplete_index()
+
+    for model in (Country, City, Airport, AirplaneType, Airplane, Crew):
+        invalidate_search_index(model)
+
+
+class FixtureImporter:
+    """
+    Loads dumpdata objects with bulk_create, parents before children,
+    rows that already exist are skipped
+    """
+
+    def __init__(self, batch_size: int = IMPORT_BATCH_SIZE, log=None):
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+        self.models_order = sort_dependencies(
+            [(app_config, None) for app_config in apps.get_app_configs()],
+            allow_cycles=True,
+        )
+        self.pending = defaultdict(list)
+        self.pending_count = 0
+        self.counts = defaultdict(int)
+        self.flight_ids = set()
+
+    def add(self, item: dict):
+        self.pending[apps.get_model(item["model"])].append(item)
+        self.pending_count += 1
+
+        if self.pending_count >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        for model in sorted(self.pending, key=self.models_order.index):
+            self.create(model, self.pending[model])
+
+        self.pending.clear()
+        self.pending_count = 0
+
+    def create(self, model, items: list):
+        deserialized = list(python.Deserializer(items, ignorenonexistent=True))
+        objects = [item.object for item in deserialized]
+
+        if model in FIXTURE_NORMALIZERS:
+            FIXTURE_NORMALIZERS[model](objects)
+
+        model._default_manager.bulk_create(
+            objects, batch_size=self.batch_size, ignore_conflicts=True
+        )
+
+        for field_name in {
+            field_name
+            for item in deserialized
+            for field_name in item.m2m_data
+        }:
+            self.create_through_rows(
+                model._meta.get_field(field_name), deserialized
+            )
+
+        if model is Flight:
+            self.flight_ids.update(flight.id for flight in objects)
+        elif model is Ticket:
+            self.flight_ids.update(ticket.flight_id for ticket in objects)
+
+        self.counts[model] += len(objects)
+
+    def create_through_rows(self, field, deserialized: list):
+        through = field.remote_field.through
+
+        if not through._meta.auto_created:
+            return
+
+        source = through._meta.get_field(field.m2m_field_name())
+        target = through._meta.get_field(field.m2m_reverse_field_name())
+
+        rows = [
+            through(**{
+                source.attname: item.object.pk,
+                target.attname: related_id,
+            })
+            for item in deserialized
+            for related_id in item.m2m_data.get(field.name, [])
+        ]
+        through._default_manager.bulk_create(
+            rows, batch_size=self.batch_size, ignore_conflicts=True
+        )
+        self.counts[through] += len(rows)
+
+    def import_file(self, path: str, force: bool = False):
+        """Number of objects in the file, None when it was already imported"""
+        checksum = get_file_checksum(path)
+
+        if not force and ImportedFixture.objects.filter(
+            checksum=checksum
+        ).exists():
+            return None
+
+        objects_count = 0
+
+        with open(path, encoding="utf-8") as file:
+            for item in iterate_fixture_objects(file):
+                self.add(item)
+                objects_count += 1
+
+        self.flush()
+        ImportedFixture.objects.update_or_create(
+            checksum=checksum,
+            defaults={"name": path, "objects_count": objects_count},
+        )
+        self.log(f"{path}: {objects_count} objects")
+
+        return objects_count
+
+    def reset_sequences(self):
+        models = list(self.counts)
+        statements = connection.ops.sequence_reset_sql(no_style(), models)
+
+        if statements:
+            with connection.cursor() as cursor:
+                for statement in statements:
+                    cursor.execute(statement)
+
+    def import_files(self, paths: list, force: bool = False) -> dict:
+        """Objects count of every file, the files are loaded atomically"""
+        counts = {}
+
+        with transaction.atomic():
+            with connection.constraint_checks_disabled():
+                for path in paths:
+                    counts[path] = self.import_file(path, force)
+
+            if self.counts:
+                connection.check_constraints(
+                    table_names=[model._meta.db_table for model in self.counts]
+                )
+                self.reset_sequences()
+                refresh_derived_data(
+                    Flight.objects.filter(id__in=self.flight_ids),
+                    batch_size=self.batch_size,
+                )
+
+        return counts
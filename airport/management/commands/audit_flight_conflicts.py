@@ -0,0 +1,33 @@
+from django.core.management import BaseCommand
+
+from airport.conflicts import audit_airplane_conflicts, audit_crew_conflicts
+
+
+class Command(BaseCommand):
+    """Django command to find airplanes and crew on overlapping flights"""
+
+    help = "List all airplane and crew double bookings in one pass"
+
+    def handle(self, *args, **options):
+        conflicts_count = 0
+
+        for airplane_id, first_id, second_id in audit_airplane_conflicts():
+            conflicts_count += 1
+            self.stdout.write(
+                f"Airplane {airplane_id}: "
+                f"flights {first_id} and {second_id} overlap"
+            )
+
+        for crew_id, first_id, second_id in audit_crew_conflicts():
+            conflicts_count += 1
+            self.stdout.write(
+                f"Crew member {crew_id}: "
+                f"flights {first_id} and {second_id} overlap"
+            )
+
+        if conflicts_count:
+            self.stdout.write(self.style.WARNING(
+                f"Found {conflicts_count} conflicts"
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS("No conflicts found"))
@@ -0,0 +1,153 @@
+import http.client
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand, CommandError
+from django.urls import reverse
+from django.utils.http import urlencode
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from airport.models import Flight
+
+ASGI_APPLICATION = "airport_api_service.asgi:application"
+SERVER_START_TIMEOUT = 30
+
+
+def get_percentile(timings: list, percentile: float) -> float:
+    return timings[min(len(timings) - 1, int(len(timings) * percentile))]
+
+
+class Command(BaseCommand):
+    """Django command to compare the sync and async flight views"""
+
+    help = (
+        "Serve the project with uvicorn and time concurrent requests "
+        "to the sync and async flight search and detail"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--concurrency", type=int, default=20)
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="uvicorn worker processes",
+        )
+
+    def get_urls(self) -> dict:
+        flight = Flight.objects.select_related(
+            "route__source", "route__destination"
+        ).order_by("departure_time").first()
+
+        if flight is None:
+            raise CommandError("No flights, run seed_data first")
+
+        search = urlencode({
+            "from": flight.route.source.closest_big_city_id,
+            "to": flight.route.destination.closest_big_city_id,
+            "departure_date": f"{flight.departure_time.date()}",
+        })
+
+        return {
+            "search": (
+                f"{reverse('airport:flight-list')}?{search}",
+                f"{reverse('airport:async-flight-search')}?{search}",
+            ),
+            "detail": (
+                reverse("airport:flight-detail", args=[flight.id]),
+                reverse("airport:async-flight-detail", args=[flight.id]),
+            ),
+        }
+
+    def get_token(self) -> str:
+        user = get_user_model().objects.filter(is_active=True).first()
+
+        if user is None:
+            raise CommandError("No active users to authenticate with")
+
+        return str(RefreshToken.for_user(user).access_token)
+
+    def start_server(self, port: int, workers: int):
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", ASGI_APPLICATION,
+                "--port", str(port),
+                "--workers", str(workers),
+                "--log-level", "warning",
+            ],
+            env=os.environ.copy(),
+        )
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+
+        while time.monotonic() < deadline:
+            try:
+                http.client.HTTPConnection("127.0.0.1", port).connect()
+            except OSError:
+                time.sleep(0.2)
+            else:
+                return server
+
+        server.terminate()
+        raise CommandError("uvicorn did not start")
+
+    def benchmark(self, port: int, url: str, token: str, options) -> dict:
+        def fetch(_) -> float:
+            connection = http.client.HTTPConnection("127.0.0.1", port)
+            started = time.perf_counter()
+            connection.request(
+                "GET", url, headers={"Authorization": f"Bearer {token}"}
+            )
+            response = connection.getresponse()
+            response.read()
+            connection.close()
+
+            if response.status == 429:
+                raise CommandError(
+                    f"{url} is throttled, benchmark with settings "
+                    "whose DEFAULT_THROTTLE_RATES allow the requests"
+                )
+
+            if response.status != 200:
+                raise CommandError(f"{url} answered {response.status}")
+
+            return time.perf_counter() - started
+
+        # warm up the caches both views read
+        fetch(None)
+
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+            timings = sorted(pool.map(fetch, range(options["requests"])))
+
+        return {
+            "rps": len(timings) / (time.perf_counter() - started),
+            "p50": get_percentile(timings, 0.5) * 1000,
+            "p95": get_percentile(timings, 0.95) * 1000,
+        }
+
+    def handle(self, *args, **options):
+        urls = self.get_urls()
+        token = self.get_token()
+        server = self.start_server(options["port"], options["workers"])
+
+        try:
+            for name, (sync_url, async_url) in urls.items():
+                for label, url in (("sync", sync_url), ("async", async_url)):
+                    result = self.benchmark(
+                        options["port"], url, token, options
+                    )
+                    self.stdout.write(
+                        f"{label} {name}: {result['rps']:.1f} req/s, "
+                        f"p50 {result['p50']:.1f}ms, "
+                        f"p95 {result['p95']:.1f}ms"
+                    )
+        finally:
+            server.terminate()
+            server.wait()
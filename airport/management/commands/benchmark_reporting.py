@@ -0,0 +1,79 @@
+import time
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from airport.reporting import (
+    REPORT_GROUPS,
+    build_flight_report,
+    build_flight_report_naive,
+)
+from airport.synthetic import SyntheticDataset, get_dataset_size
+
+
+class Command(BaseCommand):
+    """Django command to compare the vectorized and ORM loop reports"""
+
+    help = "Generate synthetic tickets and time both flight reports on them"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tickets", type=int, default=2_000_000)
+        parser.add_argument("--load-factor", type=float, default=0.8)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the synthetic data instead of rolling it back",
+        )
+
+    def timed(self, label: str, function, *args, **kwargs):
+        started = time.perf_counter()
+        result = function(*args, **kwargs)
+        self.stdout.write(f"{label}: {time.perf_counter() - started:.2f}s")
+
+        return result
+
+    def handle(self, *args, **options):
+        size = get_dataset_size(options["tickets"], options["load_factor"])
+        date_from = timezone.localdate() + timedelta(days=1)
+        date_to = date_from + timedelta(days=size["days"] - 1)
+
+        with transaction.atomic():
+            dataset = self.timed(
+                "Synthetic data",
+                SyntheticDataset(
+                    seed=options["seed"], log=self.stdout.write
+                ).generate,
+                **size
+            )
+
+            for group_by in REPORT_GROUPS:
+                vectorized = self.timed(
+                    f"Vectorized report by {group_by}",
+                    build_flight_report,
+                    date_from,
+                    date_to,
+                    group_by,
+                )
+                naive = self.timed(
+                    f"ORM loop report by {group_by}",
+                    build_flight_report_naive,
+                    date_from,
+                    date_to,
+                    group_by,
+                )
+
+                if vectorized != naive:
+                    self.stdout.write(self.style.ERROR(
+                        f"Reports by {group_by} differ"
+                    ))
+
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Benchmarked on {dataset['tickets']} tickets "
+            f"of {dataset['flights']} flights"
+        ))
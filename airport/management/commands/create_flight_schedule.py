@@ -0,0 +1,53 @@
+from django.core.management import BaseCommand, CommandError
+
+from airport.schedules import create_scheduled_flights
+from airport.serializers import FlightScheduleSerializer
+
+
+class Command(BaseCommand):
+    """Django command to create recurring flights for a route"""
+
+    help = "Create flights on the given weekdays between two dates"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--route", type=int, required=True)
+        parser.add_argument("--airplane", type=int, required=True)
+        parser.add_argument(
+            "--weekdays",
+            required=True,
+            help="Comma separated weekdays, 1 (Monday) - 7 (Sunday)",
+        )
+        parser.add_argument(
+            "--departure-time", required=True, help="ex. 08:30"
+        )
+        parser.add_argument(
+            "--duration", required=True, help="ex. 02:15:00"
+        )
+        parser.add_argument(
+            "--date-from", required=True, help="ex. year-month-day"
+        )
+        parser.add_argument(
+            "--date-to", required=True, help="ex. year-month-day"
+        )
+
+    def handle(self, *args, **options):
+        serializer = FlightScheduleSerializer(data={
+            "route": options["route"],
+            "airplane": options["airplane"],
+            "weekdays": options["weekdays"].split(","),
+            "departure_time": options["departure_time"],
+            "duration": options["duration"],
+            "date_from": options["date_from"],
+            "date_to": options["date_to"],
+        })
+
+        if not serializer.is_valid():
+            raise CommandError(serializer.errors)
+
+        flights, skipped = create_scheduled_flights(
+            **serializer.validated_data
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {len(flights)} flights, skipped {skipped} existing"
+        ))
@@ -0,0 +1,55 @@
+import os
+
+from django.core.management import BaseCommand, CommandError
+
+from airport.importing import (
+    FIXTURE_EXTENSIONS,
+    IMPORT_BATCH_SIZE,
+    FixtureImporter,
+)
+
+
+class Command(BaseCommand):
+    """Django command to bulk load dumpdata fixtures"""
+
+    help = (
+        "Stream JSON or NDJSON fixtures into the database with bulk inserts, "
+        "skipping files and rows which were already imported"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "fixtures",
+            nargs="+",
+            help="Fixture paths, the extension may be left out",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=IMPORT_BATCH_SIZE
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Import files even when their checksum is known",
+        )
+
+    def get_path(self, fixture: str) -> str:
+        for extension in FIXTURE_EXTENSIONS:
+            if os.path.isfile(fixture + extension):
+                return fixture + extension
+
+        raise CommandError(f"No fixture named {fixture}")
+
+    def handle(self, *args, **options):
+        paths = [self.get_path(fixture) for fixture in options["fixtures"]]
+        counts = FixtureImporter(
+            batch_size=options["batch_size"], log=self.stdout.write
+        ).import_files(paths, force=options["force"])
+
+        for path, objects_count in counts.items():
+            if objects_count is None:
+                self.stdout.write(f"{path}: already imported, skipped")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {sum(filter(None, counts.values()))} objects "
+            f"from {len(paths)} fixtures"
+        ))
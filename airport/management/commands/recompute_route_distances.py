@@ -0,0 +1,60 @@
+import numpy as np
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from airport.geo import great_circle_distances
+from airport.models import Route
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    """Django command to recompute route distances from coordinates"""
+
+    help = "Fill distances of all routes whose airports have coordinates"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        rows = list(
+            Route.objects.filter(
+                source__latitude__isnull=False,
+                source__longitude__isnull=False,
+                destination__latitude__isnull=False,
+                destination__longitude__isnull=False,
+            ).values_list(
+                "id",
+                "source__latitude",
+                "source__longitude",
+                "destination__latitude",
+                "destination__longitude",
+            )
+        )
+
+        if not rows:
+            self.stdout.write("No routes with airport coordinates")
+            return
+
+        route_ids = [row[0] for row in rows]
+        coordinates = np.array([row[1:] for row in rows], dtype=np.float64)
+        distances = np.rint(great_circle_distances(
+            coordinates[:, 0],
+            coordinates[:, 1],
+            coordinates[:, 2],
+            coordinates[:, 3],
+        )).astype(np.int64)
+
+        routes = [
+            Route(id=route_id, distance=distance)
+            for route_id, distance in zip(route_ids, distances.tolist())
+        ]
+
+        with transaction.atomic():
+            Route.objects.bulk_update(
+                routes, ["distance"], batch_size=options["batch_size"]
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Updated distances of {len(routes)} routes"
+        ))
@@ -0,0 +1,21 @@
+from django.core.management import BaseCommand
+
+from airport.fares import LOWEST_FARES_BATCH_SIZE, rebuild_daily_lowest_fares
+
+
+class Command(BaseCommand):
+    """Django command to rebuild the daily lowest fares"""
+
+    help = "Recount the lowest fare per city pair and day from all fares"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=LOWEST_FARES_BATCH_SIZE
+        )
+
+    def handle(self, *args, **options):
+        days_count = rebuild_daily_lowest_fares(options["batch_size"])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored lowest fares of {days_count} days"
+        ))
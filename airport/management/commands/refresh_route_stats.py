@@ -0,0 +1,33 @@
+from datetime import date
+
+from django.core.management import BaseCommand
+
+from airport.analytics import ANALYTICS_BATCH_SIZE, rebuild_route_stats
+
+
+class Command(BaseCommand):
+    """Django command to rebuild the daily route stats"""
+
+    help = "Recount flights, seats, tickets and revenue per day and route"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date-from", type=date.fromisoformat, help="ex. year-month-day"
+        )
+        parser.add_argument(
+            "--date-to", type=date.fromisoformat, help="ex. year-month-day"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=ANALYTICS_BATCH_SIZE
+        )
+
+    def handle(self, *args, **options):
+        rows_count = rebuild_route_stats(
+            date_from=options["date_from"],
+            date_to=options["date_to"],
+            batch_size=options["batch_size"],
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored {rows_count} daily route stats"
+        ))
@@ -0,0 +1,90 @@
+from datetime import datetime, time, timedelta
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from airport.importing import refresh_derived_data
+from airport.models import Flight
+from airport.synthetic import (
+    CREW_PER_FLIGHT,
+    SyntheticDataset,
+    get_dataset_size,
+)
+
+SIZE_OPTIONS = (
+    "countries",
+    "cities",
+    "airports",
+    "routes",
+    "airplanes",
+    "crew",
+    "flights_per_day",
+    "days",
+    "users",
+)
+
+
+class Command(BaseCommand):
+    """Django command to fill the database with synthetic data"""
+
+    help = (
+        "Generate reproducible countries, airports, routes, airplanes, "
+        "crew, flights, fares and orders at a given scale"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tickets",
+            type=int,
+            default=100_000,
+            help="Target number of tickets, sizes everything else",
+        )
+        parser.add_argument("--load-factor", type=float, default=0.8)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+        for option in SIZE_OPTIONS:
+            parser.add_argument(
+                f"--{option.replace('_', '-')}",
+                type=int,
+                help="Overrides the size derived from --tickets",
+            )
+
+    def handle(self, *args, **options):
+        size = get_dataset_size(options["tickets"], options["load_factor"])
+        size.update({
+            option: options[option]
+            for option in SIZE_OPTIONS
+            if options[option] is not None
+        })
+
+        if options["crew"] is None:
+            size["crew"] = size["airplanes"] * CREW_PER_FLIGHT
+
+        dataset = SyntheticDataset(
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            log=self.stdout.write,
+        ).generate(fares=True, **size)
+
+        # bulk_create sends no signals, derived data is rebuilt here
+        self.stdout.write("Rebuilding rollups and indexes")
+        date_from = timezone.localdate() + timedelta(days=1)
+        refresh_derived_data(
+            Flight.objects.filter(
+                departure_time__gte=timezone.make_aware(
+                    datetime.combine(date_from, time.min)
+                ),
+                departure_time__lt=timezone.make_aware(
+                    datetime.combine(date_from, time.min)
+                ) + timedelta(days=size["days"]),
+            ),
+            batch_size=options["batch_size"],
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            "Seeded " + ", ".join(
+                f"{count} {name.replace('_', ' ')}"
+                for name, count in dataset.items()
+            )
+        ))
@@ -0,0 +1,368 @@
+# Generated by Django 4.2.4 on 2026-10-19 08:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="airplane",
+            options={"ordering": ["name"]},
+        ),
+        migrations.AlterModelOptions(
+            name="airplanetype",
+            options={"ordering": ["name"]},
+        ),
+        migrations.AlterModelOptions(
+            name="airport",
+            options={"ordering": ["name"]},
+        ),
+        migrations.AlterModelOptions(
+            name="city",
+            options={"ordering": ["name"], "verbose_name_plural": "cities"},
+        ),
+        migrations.AlterModelOptions(
+            name="country",
+            options={"ordering": ["name"], "verbose_name_plural": "countries"},
+        ),
+        migrations.AlterModelOptions(
+            name="crew",
+            options={"ordering": ["last_name"]},
+        ),
+        migrations.AlterModelOptions(
+            name="order",
+            options={"ordering": ["created_at"]},
+        ),
+        migrations.RenameField(
+            model_name="airport",
+            old_name="city",
+            new_name="closest_big_city",
+        ),
+        migrations.AlterUniqueTogether(
+            name="airplane",
+            unique_together={("name", "airplane_type")},
+        ),
+        migrations.AlterUniqueTogether(
+            name="airport",
+            unique_together={("name", "closest_big_city")},
+        ),
+        migrations.AlterUniqueTogether(
+            name="flight",
+            unique_together={("route", "airplane", "departure_time", "arrival_time")},
+        ),
+        migrations.AlterField(
+            model_name="country",
+            name="name",
+            field=models.CharField(
+                choices=[
+                    ("Aruba", "Aruba"),
+                    ("Afghanistan", "Afghanistan"),
+                    ("Angola", "Angola"),
+                    ("Anguilla", "Anguilla"),
+                    ("Åland Islands", "Åland Islands"),
+                    ("Albania", "Albania"),
+                    ("Andorra", "Andorra"),
+                    ("United Arab Emirates", "United Arab Emirates"),
+                    ("Argentina", "Argentina"),
+                    ("Armenia", "Armenia"),
+                    ("American Samoa", "American Samoa"),
+                    ("Antarctica", "Antarctica"),
+                    ("French Southern Territories", "French Southern Territories"),
+                    ("Antigua And Barbuda", "Antigua And Barbuda"),
+                    ("Australia", "Australia"),
+                    ("Austria", "Austria"),
+                    ("Azerbaijan", "Azerbaijan"),
+                    ("Burundi", "Burundi"),
+                    ("Belgium", "Belgium"),
+                    ("Benin", "Benin"),
+                    ("Bonaire", "Bonaire"),
+                    ("Burkina Faso", "Burkina Faso"),
+                    ("Bangladesh", "Bangladesh"),
+                    ("Bulgaria", "Bulgaria"),
+                    ("Bahrain", "Bahrain"),
+                    ("Bahamas", "Bahamas"),
+                    ("Bosnia And Herzegovina", "Bosnia And Herzegovina"),
+                    ("Saint Barthélemy", "Saint Barthélemy"),
+                    ("Belarus", "Belarus"),
+                    ("Belize", "Belize"),
+                    ("Bermuda", "Bermuda"),
+                    ("Bolivia", "Bolivia"),
+                    ("Brazil", "Brazil"),
+                    ("Barbados", "Barbados"),
+                    ("Brunei Darussalam", "Brunei Darussalam"),
+                    ("Bhutan", "Bhutan"),
+                    ("Bouvet Island", "Bouvet Island"),
+                    ("Botswana", "Botswana"),
+                    ("Central African Republic", "Central African Republic"),
+                    ("Canada", "Canada"),
+                    ("Cocos (Keeling) Islands", "Cocos (Keeling) Islands"),
+                    ("Switzerland", "Switzerland"),
+                    ("Chile", "Chile"),
+                    ("China", "China"),
+                    ("Côte D'Ivoire", "Côte D'Ivoire"),
+                    ("Cameroon", "Cameroon"),
+                    ("Congo", "Congo"),
+                    ("Congo", "Congo"),
+                    ("Cook Islands", "Cook Islands"),
+                    ("Colombia", "Colombia"),
+                    ("Comoros", "Comoros"),
+                    ("Cabo Verde", "Cabo Verde"),
+                    ("Costa Rica", "Costa Rica"),
+                    ("Cuba", "Cuba"),
+                    ("Curaçao", "Curaçao"),
+                    ("Christmas Island", "Christmas Island"),
+                    ("Cayman Islands", "Cayman Islands"),
+                    ("Cyprus", "Cyprus"),
+                    ("Czechia", "Czechia"),
+                    ("Germany", "Germany"),
+                    ("Djibouti", "Djibouti"),
+                    ("Dominica", "Dominica"),
+                    ("Denmark", "Denmark"),
+                    ("Dominican Republic", "Dominican Republic"),
+                    ("Algeria", "Algeria"),
+                    ("Ecuador", "Ecuador"),
+                    ("Egypt", "Egypt"),
+                    ("Eritrea", "Eritrea"),
+                    ("Western Sahara", "Western Sahara"),
+                    ("Spain", "Spain"),
+                    ("Estonia", "Estonia"),
+                    ("Ethiopia", "Ethiopia"),
+                    ("Finland", "Finland"),
+                    ("Fiji", "Fiji"),
+                    ("Falkland Islands (Malvinas)", "Falkland Islands (Malvinas)"),
+                    ("France", "France"),
+                    ("Faroe Islands", "Faroe Islands"),
+                    ("Micronesia", "Micronesia"),
+                    ("Gabon", "Gabon"),
+                    ("United Kingdom", "United Kingdom"),
+                    ("Georgia", "Georgia"),
+                    ("Guernsey", "Guernsey"),
+                    ("Ghana", "Ghana"),
+                    ("Gibraltar", "Gibraltar"),
+                    ("Guinea", "Guinea"),
+                    ("Guadeloupe", "Guadeloupe"),
+                    ("Gambia", "Gambia"),
+                    ("Guinea-Bissau", "Guinea-Bissau"),
+                    ("Equatorial Guinea", "Equatorial Guinea"),
+                    ("Greece", "Greece"),
+                    ("Grenada", "Grenada"),
+                    ("Greenland", "Greenland"),
+                    ("Guatemala", "Guatemala"),
+                    ("French Guiana", "French Guiana"),
+                    ("Guam", "Guam"),
+                    ("Guyana", "Guyana"),
+                    ("Hong Kong", "Hong Kong"),
+                    (
+                        "Heard Island And Mcdonald Islands",
+                        "Heard Island And Mcdonald Islands",
+                    ),
+                    ("Honduras", "Honduras"),
+                    ("Croatia", "Croatia"),
+                    ("Haiti", "Haiti"),
+                    ("Hungary", "Hungary"),
+                    ("Indonesia", "Indonesia"),
+                    ("Isle Of Man", "Isle Of Man"),
+                    ("India", "India"),
+                    (
+                        "British Indian Ocean Territory",
+                        "British Indian Ocean Territory",
+                    ),
+                    ("Ireland", "Ireland"),
+                    ("Iran", "Iran"),
+                    ("Iraq", "Iraq"),
+                    ("Iceland", "Iceland"),
+                    ("Israel", "Israel"),
+                    ("Italy", "Italy"),
+                    ("Jamaica", "Jamaica"),
+                    ("Jersey", "Jersey"),
+                    ("Jordan", "Jordan"),
+                    ("Japan", "Japan"),
+                    ("Kazakhstan", "Kazakhstan"),
+                    ("Kenya", "Kenya"),
+                    ("Kyrgyzstan", "Kyrgyzstan"),
+                    ("Cambodia", "Cambodia"),
+                    ("Kiribati", "Kiribati"),
+                    ("Saint Kitts And Nevis", "Saint Kitts And Nevis"),
+                    ("Korea", "Korea"),
+                    ("Kuwait", "Kuwait"),
+                    (
+                        "Lao People'S Democratic Republic",
+                        "Lao People'S Democratic Republic",
+                    ),
+                    ("Lebanon", "Lebanon"),
+                    ("Liberia", "Liberia"),
+                    ("Libya", "Libya"),
+                    ("Saint Lucia", "Saint Lucia"),
+                    ("Liechtenstein", "Liechtenstein"),
+                    ("Sri Lanka", "Sri Lanka"),
+                    ("Lesotho", "Lesotho"),
+                    ("Lithuania", "Lithuania"),
+                    ("Luxembourg", "Luxembourg"),
+                    ("Latvia", "Latvia"),
+                    ("Macao", "Macao"),
+                    ("Saint Martin (French Part)", "Saint Martin (French Part)"),
+                    ("Morocco", "Morocco"),
+                    ("Monaco", "Monaco"),
+                    ("Moldova", "Moldova"),
+                    ("Madagascar", "Madagascar"),
+                    ("Maldives", "Maldives"),
+                    ("Mexico", "Mexico"),
+                    ("Marshall Islands", "Marshall Islands"),
+                    ("North Macedonia", "North Macedonia"),
+                    ("Mali", "Mali"),
+                    ("Malta", "Malta"),
+                    ("Myanmar", "Myanmar"),
+                    ("Montenegro", "Montenegro"),
+                    ("Mongolia", "Mongolia"),
+                    ("Northern Mariana Islands", "Northern Mariana Islands"),
+                    ("Mozambique", "Mozambique"),
+                    ("Mauritania", "Mauritania"),
+                    ("Montserrat", "Montserrat"),
+                    ("Martinique", "Martinique"),
+                    ("Mauritius", "Mauritius"),
+                    ("Malawi", "Malawi"),
+                    ("Malaysia", "Malaysia"),
+                    ("Mayotte", "Mayotte"),
+                    ("Namibia", "Namibia"),
+                    ("New Caledonia", "New Caledonia"),
+                    ("Niger", "Niger"),
+                    ("Norfolk Island", "Norfolk Island"),
+                    ("Nigeria", "Nigeria"),
+                    ("Nicaragua", "Nicaragua"),
+                    ("Niue", "Niue"),
+                    ("Netherlands", "Netherlands"),
+                    ("Norway", "Norway"),
+                    ("Nepal", "Nepal"),
+                    ("Nauru", "Nauru"),
+                    ("New Zealand", "New Zealand"),
+                    ("Oman", "Oman"),
+                    ("Pakistan", "Pakistan"),
+                    ("Panama", "Panama"),
+                    ("Pitcairn", "Pitcairn"),
+                    ("Peru", "Peru"),
+                    ("Philippines", "Philippines"),
+                    ("Palau", "Palau"),
+                    ("Papua New Guinea", "Papua New Guinea"),
+                    ("Poland", "Poland"),
+                    ("Puerto Rico", "Puerto Rico"),
+                    ("Korea", "Korea"),
+                    ("Portugal", "Portugal"),
+                    ("Paraguay", "Paraguay"),
+                    ("Palestine", "Palestine"),
+                    ("French Polynesia", "French Polynesia"),
+                    ("Qatar", "Qatar"),
+                    ("Réunion", "Réunion"),
+                    ("Romania", "Romania"),
+                    ("Russian Federation", "Russian Federation"),
+                    ("Rwanda", "Rwanda"),
+                    ("Saudi Arabia", "Saudi Arabia"),
+                    ("Sudan", "Sudan"),
+                    ("Senegal", "Senegal"),
+                    ("Singapore", "Singapore"),
+                    (
+                        "South Georgia And The South Sandwich Islands",
+                        "South Georgia And The South Sandwich Islands",
+                    ),
+                    ("Saint Helena", "Saint Helena"),
+                    ("Svalbard And Jan Mayen", "Svalbard And Jan Mayen"),
+                    ("Solomon Islands", "Solomon Islands"),
+                    ("Sierra Leone", "Sierra Leone"),
+                    ("El Salvador", "El Salvador"),
+                    ("San Marino", "San Marino"),
+                    ("Somalia", "Somalia"),
+                    ("Saint Pierre And Miquelon", "Saint Pierre And Miquelon"),
+                    ("Serbia", "Serbia"),
+                    ("South Sudan", "South Sudan"),
+                    ("Sao Tome And Principe", "Sao Tome And Principe"),
+                    ("Suriname", "Suriname"),
+                    ("Slovakia", "Slovakia"),
+                    ("Slovenia", "Slovenia"),
+                    ("Sweden", "Sweden"),
+                    ("Eswatini", "Eswatini"),
+                    ("Sint Maarten (Dutch Part)", "Sint Maarten (Dutch Part)"),
+                    ("Seychelles", "Seychelles"),
+                    ("Syrian Arab Republic", "Syrian Arab Republic"),
+                    ("Turks And Caicos Islands", "Turks And Caicos Islands"),
+                    ("Chad", "Chad"),
+                    ("Togo", "Togo"),
+                    ("Thailand", "Thailand"),
+                    ("Tajikistan", "Tajikistan"),
+                    ("Tokelau", "Tokelau"),
+                    ("Turkmenistan", "Turkmenistan"),
+                    ("Timor-Leste", "Timor-Leste"),
+                    ("Tonga", "Tonga"),
+                    ("Trinidad And Tobago", "Trinidad And Tobago"),
+                    ("Tunisia", "Tunisia"),
+                    ("Turkey", "Turkey"),
+                    ("Tuvalu", "Tuvalu"),
+                    ("Taiwan", "Taiwan"),
+                    ("Tanzania", "Tanzania"),
+                    ("Uganda", "Uganda"),
+                    ("Ukraine", "Ukraine"),
+                    (
+                        "United States Minor Outlying Islands",
+                        "United States Minor Outlying Islands",
+                    ),
+                    ("Uruguay", "Uruguay"),
+                    ("United States", "United States"),
+                    ("Uzbekistan", "Uzbekistan"),
+                    ("Holy See (Vatican City State)", "Holy See (Vatican City State)"),
+                    (
+                        "Saint Vincent And The Grenadines",
+                        "Saint Vincent And The Grenadines",
+                    ),
+                    ("Venezuela", "Venezuela"),
+                    ("Virgin Islands", "Virgin Islands"),
+                    ("Virgin Islands", "Virgin Islands"),
+                    ("Viet Nam", "Viet Nam"),
+                    ("Vanuatu", "Vanuatu"),
+                    ("Wallis And Futuna", "Wallis And Futuna"),
+                    ("Samoa", "Samoa"),
+                    ("Yemen", "Yemen"),
+                    ("South Africa", "South Africa"),
+                    ("Zambia", "Zambia"),
+                    ("Zimbabwe", "Zimbabwe"),
+                ],
+                max_length=63,
+                unique=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="flight",
+            name="crew",
+            field=models.ManyToManyField(
+                blank=True, related_name="flights", to="airport.crew"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="route",
+            name="destination",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="routs_destination",
+                to="airport.airport",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="route",
+            name="source",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="routs_source",
+                to="airport.airport",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="ticket",
+            unique_together={("row", "seat", "flight")},
+        ),
+        migrations.RemoveField(
+            model_name="flight",
+            name="ticket",
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.4 on 2026-10-19 08:15
+
+from django.db import migrations, models
+
+AIRPLANE_OVERLAP_CONSTRAINT = "flight_airplane_no_overlap"
+
+
+def add_airplane_overlap_constraint(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    schema_editor.execute(
+        f"ALTER TABLE airport_flight "
+        f"ADD CONSTRAINT {AIRPLANE_OVERLAP_CONSTRAINT} "
+        f"EXCLUDE USING gist ("
+        f"airplane_id WITH =, "
+        f"tstzrange(departure_time, arrival_time, '[)') WITH &&"
+        f")"
+    )
+
+
+def remove_airplane_overlap_constraint(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        f"ALTER TABLE airport_flight "
+        f"DROP CONSTRAINT IF EXISTS {AIRPLANE_OVERLAP_CONSTRAINT}"
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0003_sync_models_state"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="flight",
+            index=models.Index(
+                fields=["airplane", "departure_time", "arrival_time"],
+                name="flight_airplane_time_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="flight",
+            index=models.Index(
+                fields=["departure_time", "arrival_time"], name="flight_time_idx"
+            ),
+        ),
+        migrations.RunPython(
+            add_airplane_overlap_constraint,
+            remove_airplane_overlap_constraint,
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.4 on 2026-10-19 08:18
+
+from django.db import migrations, models
+from django.db.models import F
+
+BATCH_SIZE = 1000
+SECONDS_IN_HOUR = 3600
+
+
+def fill_capacity_and_duration(apps, schema_editor):
+    Airplane = apps.get_model("airport", "Airplane")
+    Flight = apps.get_model("airport", "Flight")
+
+    Airplane.objects.update(airplane_capacity=F("rows") * F("seats_in_row"))
+
+    flights = []
+
+    for flight in Flight.objects.only(
+        "id", "departure_time", "arrival_time"
+    ).iterator(chunk_size=BATCH_SIZE):
+        flight.flight_duration = (
+            (flight.arrival_time - flight.departure_time).total_seconds()
+            / SECONDS_IN_HOUR
+        )
+        flights.append(flight)
+
+        if len(flights) == BATCH_SIZE:
+            Flight.objects.bulk_update(flights, ["flight_duration"])
+            flights = []
+
+    Flight.objects.bulk_update(flights, ["flight_duration"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0004_flight_overlap_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="airplane",
+            name="airplane_capacity",
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="flight",
+            name="flight_duration",
+            field=models.FloatField(db_index=True, default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.RunPython(
+            fill_capacity_and_duration,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,53 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+NAME_TRIGRAM_INDEXES = (
+    ("airport_country", "name"),
+    ("airport_city", "name"),
+    ("airport_airport", "name"),
+    ("airport_airplanetype", "name"),
+    ("airport_airplane", "name"),
+    ("airport_crew", "first_name"),
+    ("airport_crew", "last_name"),
+)
+
+
+def get_index_name(table: str, column: str) -> str:
+    return f"{table}_{column}_trgm_idx"
+
+
+def add_name_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    # icontains compiles to UPPER(column::text) LIKE UPPER(...),
+    # so the index is built over the same expression
+    for table, column in NAME_TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {get_index_name(table, column)} "
+            f"ON {table} USING gin (UPPER({column}::text) gin_trgm_ops)"
+        )
+
+
+def remove_name_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for table, column in NAME_TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS {get_index_name(table, column)}"
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0006_airport_coordinates"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(
+            add_name_trigram_indexes,
+            remove_name_trigram_indexes,
+        ),
+    ]
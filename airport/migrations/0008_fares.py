@@ -0,0 +1,119 @@
+# Generated by Django 4.2.4 on 2026-10-19 08:29
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0007_name_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FareClass",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        choices=[("economy", "Economy"), ("business", "Business")],
+                        max_length=15,
+                    ),
+                ),
+                ("first_row", models.PositiveIntegerField()),
+                ("last_row", models.PositiveIntegerField()),
+                (
+                    "airplane",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="fare_classes",
+                        to="airport.airplane",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "fare classes",
+                "ordering": ["airplane", "first_row"],
+                "unique_together": {("airplane", "name")},
+            },
+        ),
+        migrations.CreateModel(
+            name="Fare",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("price", models.DecimalField(decimal_places=2, max_digits=10)),
+                (
+                    "fare_class",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="fares",
+                        to="airport.fareclass",
+                    ),
+                ),
+                (
+                    "flight",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="fares",
+                        to="airport.flight",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("flight", "fare_class")},
+            },
+        ),
+        migrations.CreateModel(
+            name="DailyLowestFare",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("price", models.DecimalField(decimal_places=2, max_digits=10)),
+                (
+                    "destination_city",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="airport.city",
+                    ),
+                ),
+                (
+                    "source_city",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="airport.city",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["date"],
+                "unique_together": {("source_city", "destination_city", "date")},
+            },
+        ),
+    ]
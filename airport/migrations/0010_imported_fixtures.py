@@ -0,0 +1,33 @@
+# Generated by Django 4.2.4 on 2026-10-19 08:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0009_daily_route_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportedFixture",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255)),
+                ("checksum", models.CharField(max_length=64, unique=True)),
+                ("objects_count", models.PositiveIntegerField(default=0)),
+                ("imported_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["imported_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 4.2.4 on 2026-10-19 09:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+from rest_framework import serializers
+
+BATCH_SIZE = 1000
+
+
+def build_summaries(OrderSummary, Ticket, order_ids):
+    summaries = {
+        order_id: OrderSummary(
+            order_id=order_id, tickets_count=0, flights=[], cities=[]
+        )
+        for order_id in order_ids
+    }
+    datetime_field = serializers.DateTimeField()
+    tickets = Ticket.objects.filter(order_id__in=order_ids).order_by(
+        "order_id", "flight__departure_time", "flight_id"
+    ).values_list(
+        "order_id",
+        "flight_id",
+        "flight__departure_time",
+        "flight__route__source__closest_big_city__name",
+        "flight__route__destination__closest_big_city__name",
+    )
+
+    for order_id, flight_id, departure_time, source, destination in tickets:
+        summary = summaries[order_id]
+        summary.tickets_count += 1
+
+        if summary.flights and summary.flights[-1]["id"] == flight_id:
+            continue
+
+        if summary.first_departure is None:
+            summary.first_departure = departure_time
+
+        summary.flights.append({
+            "id": flight_id,
+            "route": f"{source} - {destination}",
+            "departure_time": datetime_field.to_representation(
+                departure_time
+            ),
+        })
+
+        for city in (source, destination):
+            if not summary.cities or summary.cities[-1] != city:
+                summary.cities.append(city)
+
+    return list(summaries.values())
+
+
+def fill_order_summaries(apps, schema_editor):
+    Order = apps.get_model("airport", "Order")
+    OrderSummary = apps.get_model("airport", "OrderSummary")
+    Ticket = apps.get_model("airport", "Ticket")
+
+    order_ids = list(Order.objects.values_list("id", flat=True))
+
+    for start in range(0, len(order_ids), BATCH_SIZE):
+        OrderSummary.objects.bulk_create(
+            build_summaries(
+                OrderSummary, Ticket, order_ids[start:start + BATCH_SIZE]
+            )
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("airport", "0010_imported_fixtures"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderSummary",
+            fields=[
+                (
+                    "order",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="summary",
+                        serialize=False,
+                        to="airport.order",
+                    ),
+                ),
+                ("tickets_count", models.PositiveIntegerField(default=0)),
+                ("flights", models.JSONField(default=list)),
+                ("first_departure", models.DateTimeField(blank=True, null=True)),
+                ("cities", models.JSONField(default=list)),
+            ],
+        ),
+        migrations.RunPython(
+            fill_order_summaries,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -2,6 +2,7 @@ from django.db import models
 
 from pycountry import countries
 
+from airport.geo import great_circle_distance
 from user.models import User
 
 
@@ -62,6 +63,8 @@ class Airport(models.Model):
         related_name="airports",
         on_delete=models.CASCADE
     )
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
 
     class Meta:
         unique_together = ("name", "closest_big_city")
@@ -104,6 +107,29 @@ class Route(models.Model):
             f"{self.source} - {self.destination}"
         )
 
+    @property
+    def has_coordinates(self) -> bool:
+        return None not in (
+            self.source.latitude,
+            self.source.longitude,
+            self.destination.latitude,
+            self.destination.longitude,
+        )
+
+    def set_distance(self):
+        self.distance = round(great_circle_distance(
+            self.source.latitude,
+            self.source.longitude,
+            self.destination.latitude,
+            self.destination.longitude,
+        ))
+
+    def save(self, *args, **kwargs):
+        if self.has_coordinates:
+            self.set_distance()
+
+        return super().save(*args, **kwargs)
+
 
 class AirplaneType(models.Model):
     name = models.CharField(unique=True, max_length=63)
@@ -124,6 +150,10 @@ class Airplane(models.Model):
     name = models.CharField(unique=True, max_length=63)
     rows = models.PositiveIntegerField()
     seats_in_row = models.PositiveIntegerField()
+    airplane_capacity = models.PositiveIntegerField(
+        editable=False,
+        db_index=True
+    )
     airplane_type = models.ForeignKey(
         AirplaneType,
         related_name="airplanes",
@@ -136,15 +166,15 @@ class Airplane(models.Model):
         ]
         ordering = ["name"]
 
-    @property
-    def airplane_capacity(self):
-        return self.rows * self.seats_in_row
+    def set_airplane_capacity(self):
+        self.airplane_capacity = self.rows * self.seats_in_row
 
     def __str__(self) -> str:
         return self.name
 
     def save(self, *args, **kwargs):
         self.name = self.name.strip()
+        self.set_airplane_capacity()
 
         return super().save(*args, **kwargs)
 
@@ -189,6 +219,7 @@ class Flight(models.Model):
     )
     departure_time = models.DateTimeField()
     arrival_time = models.DateTimeField()
+    flight_duration = models.FloatField(editable=False, db_index=True)
 
     class Meta:
         unique_together = (
@@ -197,16 +228,151 @@ class Flight(models.Model):
             "departure_time",
             "arrival_time"
         )
+        indexes = [
+            models.Index(
+                fields=["airplane", "departure_time", "arrival_time"],
+                name="flight_airplane_time_idx",
+            ),
+            models.Index(
+                fields=["departure_time", "arrival_time"],
+                name="flight_time_idx",
+            ),
+        ]
 
-    @property
-    def flight_duration(self):
+    def set_flight_duration(self):
         seconds_in_hour = 3600
-        return ((self.arrival_time - self.departure_time).total_seconds()
-                / seconds_in_hour)
+        self.flight_duration = (
+            (self.arrival_time - self.departure_time).total_seconds()
+            / seconds_in_hour
+        )
 
     def __str__(self) -> str:
         return f"{self.route} ({self.departure_time})"
 
+    def save(self, *args, **kwargs):
+        self.set_flight_duration()
+
+        return super().save(*args, **kwargs)
+
+
+class FareClass(models.Model):
+    ECONOMY = "economy"
+    BUSINESS = "business"
+    NAME_CHOICES = [
+        (ECONOMY, "Economy"),
+        (BUSINESS, "Business"),
+    ]
+
+    airplane = models.ForeignKey(
+        Airplane,
+        related_name="fare_classes",
+        on_delete=models.CASCADE
+    )
+    name = models.CharField(max_length=15, choices=NAME_CHOICES)
+    first_row = models.PositiveIntegerField()
+    last_row = models.PositiveIntegerField()
+
+    class Meta:
+        unique_together = ("airplane", "name")
+        ordering = ["airplane", "first_row"]
+        verbose_name_plural = "fare classes"
+
+    def __str__(self) -> str:
+        return (
+            f"{self.airplane} {self.get_name_display()} "
+            f"(rows {self.first_row}-{self.last_row})"
+        )
+
+
+class Fare(models.Model):
+    flight = models.ForeignKey(
+        Flight,
+        related_name="fares",
+        on_delete=models.CASCADE
+    )
+    fare_class = models.ForeignKey(
+        FareClass,
+        related_name="fares",
+        on_delete=models.CASCADE
+    )
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+
+    class Meta:
+        unique_together = ("flight", "fare_class")
+
+    def __str__(self) -> str:
+        return f"{self.flight} {self.fare_class.name}: {self.price}"
+
+
+class DailyLowestFare(models.Model):
+    """Lowest fare between two cities per departure day"""
+
+    source_city = models.ForeignKey(
+        City,
+        related_name="+",
+        on_delete=models.CASCADE
+    )
+    destination_city = models.ForeignKey(
+        City,
+        related_name="+",
+        on_delete=models.CASCADE
+    )
+    date = models.DateField()
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+
+    class Meta:
+        unique_together = ("source_city", "destination_city", "date")
+        ordering = ["date"]
+
+    def __str__(self) -> str:
+        return (
+            f"{self.source_city} - {self.destination_city} "
+            f"({self.date}): {self.price}"
+        )
+
+
+class DailyRouteStats(models.Model):
+    """Flights, seats, sold tickets and revenue per day, route and type"""
+
+    date = models.DateField()
+    route = models.ForeignKey(
+        Route,
+        related_name="+",
+        on_delete=models.CASCADE
+    )
+    airplane_type = models.ForeignKey(
+        AirplaneType,
+        related_name="+",
+        on_delete=models.CASCADE
+    )
+    flights_count = models.PositiveIntegerField(default=0)
+    seats = models.PositiveIntegerField(default=0)
+    tickets_sold = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        unique_together = ("date", "route", "airplane_type")
+        ordering = ["date"]
+        verbose_name_plural = "daily route stats"
+
+    def __str__(self) -> str:
+        return f"{self.route} {self.airplane_type} ({self.date})"
+
+
+class ImportedFixture(models.Model):
+    """Checksum of a fixture file loaded by the import_fixtures command"""
+
+    name = models.CharField(max_length=255)
+    checksum = models.CharField(max_length=64, unique=True)
+    objects_count = models.PositiveIntegerField(default=0)
+    imported_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["imported_at"]
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.checksum[:12]})"
+
 
 class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -216,6 +382,12 @@ class Order(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "created_at", "id"],
+                name="order_user_created_at_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Order №{self.id}"
@@ -236,3 +408,22 @@ class Ticket(models.Model):
 
     def __str__(self):
         return f"Ticket: row {self.row}, seat {self.seat}"
+
+
+class OrderSummary(models.Model):
+    """Tickets of an order condensed for order lists, see airport.orders"""
+
+    order = models.OneToOneField(
+        Order,
+        primary_key=True,
+        related_name="summary",
+        on_delete=models.CASCADE,
+    )
+    tickets_count = models.PositiveIntegerField(default=0)
+    # [{"id": ..., "route": ..., "departure_time": ...}] by departure
+    flights = models.JSONField(default=list)
+    first_departure = models.DateTimeField(null=True, blank=True)
+    cities = models.JSONField(default=list)
+
+    def __str__(self):
+        return f"Summary of order №{self.order_id}"
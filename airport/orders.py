@@ -0,0 +1,97 @@
+from django.db import transaction
+from rest_framework import serializers
+
+from airport.flight_search import get_flights_showing
+from airport.models import Order, OrderSummary, Ticket
+
+ORDER_SUMMARY_BATCH_SIZE = 1000
+ORDER_SUMMARY_FIELDS = (
+    "tickets_count",
+    "flights",
+    "first_departure",
+    "cities",
+)
+
+
+def build_order_summaries(order_ids: list) -> list:
+    """
+    Ticket count, flights in departure order and the cities
+    of the trip (ex. ["Kyiv", "Lviv", "Odesa"]) of every order
+    """
+    summaries = {
+        order_id: OrderSummary(
+            order_id=order_id, tickets_count=0, flights=[], cities=[]
+        )
+        for order_id in order_ids
+    }
+    # stored as the serializers would render it
+    datetime_field = serializers.DateTimeField()
+    tickets = Ticket.objects.filter(order_id__in=order_ids).order_by(
+        "order_id", "flight__departure_time", "flight_id"
+    ).values_list(
+        "order_id",
+        "flight_id",
+        "flight__departure_time",
+        "flight__route__source__closest_big_city__name",
+        "flight__route__destination__closest_big_city__name",
+    )
+
+    for order_id, flight_id, departure_time, source, destination in tickets:
+        summary = summaries[order_id]
+        summary.tickets_count += 1
+
+        if summary.flights and summary.flights[-1]["id"] == flight_id:
+            continue
+
+        if summary.first_departure is None:
+            summary.first_departure = departure_time
+
+        summary.flights.append({
+            "id": flight_id,
+            "route": f"{source} - {destination}",
+            "departure_time": datetime_field.to_representation(
+                departure_time
+            ),
+        })
+
+        for city in (source, destination):
+            if not summary.cities or summary.cities[-1] != city:
+                summary.cities.append(city)
+
+    return list(summaries.values())
+
+
+def save_order_summaries(
+        orders, batch_size: int = ORDER_SUMMARY_BATCH_SIZE
+) -> int:
+    """Write the summaries of the orders, replacing existing ones"""
+    order_ids = list(orders.values_list("id", flat=True))
+
+    for start in range(0, len(order_ids), batch_size):
+        OrderSummary.objects.bulk_create(
+            build_order_summaries(order_ids[start:start + batch_size]),
+            update_conflicts=True,
+            unique_fields=["order"],
+            update_fields=ORDER_SUMMARY_FIELDS,
+        )
+
+    return len(order_ids)
+
+
+def refresh_order_summaries_on_commit(orders):
+    """save_order_summaries once the tickets of the orders are written"""
+    order_ids = list(orders.values_list("id", flat=True))
+
+    if order_ids:
+        transaction.on_commit(
+            lambda: save_order_summaries(
+                Order.objects.filter(id__in=order_ids)
+            )
+        )
+
+
+def get_orders_showing(instance):
+    """Orders whose summaries show the city, airport or route"""
+    return Order.objects.filter(
+        tickets__flight__in=get_flights_showing(instance)
+    ).distinct()
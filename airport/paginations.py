@@ -1,4 +1,7 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import (
+    CursorPagination,
+    PageNumberPagination,
+)
 
 
 class TwoSizePagination(PageNumberPagination):
@@ -17,3 +20,12 @@ class TenSizePagination(PageNumberPagination):
     page_size = 10
     page_query_param = "page_size"
     max_page_size = 100
+
+
+class OrderHistoryPagination(CursorPagination):
+    """Newest orders first, paged by (created_at, id) instead of offset"""
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
@@ -0,0 +1,51 @@
+class QuerysetPlan:
+    """
+    select_related, prefetch_related (names or Prefetch objects),
+    only() fields and annotations loading what a serializer reads
+    """
+
+    def __init__(
+            self,
+            select_related: tuple = (),
+            prefetch_related: tuple = (),
+            only: tuple = (),
+            annotations: dict = None,
+    ):
+        self.select_related = select_related
+        self.prefetch_related = prefetch_related
+        self.only = only
+        self.annotations = annotations or {}
+
+    def apply(self, queryset):
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+
+        if self.only:
+            queryset = queryset.only(*self.only)
+
+        if self.annotations:
+            queryset = queryset.annotate(**self.annotations)
+
+        return queryset
+
+
+class QuerysetPlanMixin:
+    """
+    get_planned_queryset applies the queryset_plans entry of the action,
+    ex. queryset_plans = {"list": QuerysetPlan(select_related=["country"])},
+    actions without a plan (create, update, destroy...) get the queryset
+    """
+
+    queryset_plans = {}
+
+    def get_planned_queryset(self):
+        queryset = self.queryset.all()
+        plan = self.queryset_plans.get(self.action)
+
+        if plan is not None:
+            queryset = plan.apply(queryset)
+
+        return queryset
@@ -0,0 +1,191 @@
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+import numpy as np
+from django.utils import timezone
+
+from airport.models import Flight, Ticket
+
+REPORT_CHUNK_SIZE = 100_000
+
+REPORT_GROUPS = ("route", "weekday", "hour")
+
+
+def get_period_filter(field: str, date_from, date_to) -> dict:
+    start = timezone.make_aware(datetime.combine(date_from, time.min))
+    end = timezone.make_aware(datetime.combine(date_to, time.min))
+
+    return {
+        f"{field}__gte": start,
+        f"{field}__lt": end + timedelta(days=1),
+    }
+
+
+def iterate_chunks(queryset, fields: tuple, chunk_size: int):
+    """
+    Rows of values_list(fields) in id order, one chunk per query,
+    keyset pagination keeps every chunk an index range scan
+    """
+    last_id = 0
+
+    while True:
+        rows = list(
+            queryset.filter(id__gt=last_id).order_by("id").values_list(
+                "id", *fields
+            )[:chunk_size]
+        )
+
+        if not rows:
+            return
+
+        yield rows
+        last_id = rows[-1][0]
+
+
+def load_flight_columns(
+        date_from,
+        date_to,
+        chunk_size: int = REPORT_CHUNK_SIZE
+) -> dict:
+    flights = Flight.objects.filter(
+        **get_period_filter("departure_time", date_from, date_to)
+    )
+    columns = defaultdict(list)
+
+    for rows in iterate_chunks(
+        flights,
+        ("route_id", "airplane__airplane_capacity", "departure_time"),
+        chunk_size
+    ):
+        ids, route_ids, capacities, departure_times = zip(*rows)
+        local_times = [
+            timezone.localtime(departure_time)
+            for departure_time in departure_times
+        ]
+        columns["id"].append(np.array(ids, dtype=np.int64))
+        columns["route"].append(np.array(route_ids, dtype=np.int64))
+        columns["capacity"].append(np.array(capacities, dtype=np.int64))
+        columns["weekday"].append(np.array(
+            [local_time.isoweekday() for local_time in local_times],
+            dtype=np.int64
+        ))
+        columns["hour"].append(np.array(
+            [local_time.hour for local_time in local_times],
+            dtype=np.int64
+        ))
+
+    return {
+        name: np.concatenate(columns[name]) if columns[name]
+        else np.empty(0, dtype=np.int64)
+        for name in ("id", "route", "capacity", "weekday", "hour")
+    }
+
+
+def load_ticket_flight_ids(
+        date_from,
+        date_to,
+        chunk_size: int = REPORT_CHUNK_SIZE
+) -> np.ndarray:
+    tickets = Ticket.objects.filter(
+        **get_period_filter("flight__departure_time", date_from, date_to)
+    )
+    chunks = [
+        np.array([flight_id for _, flight_id in rows], dtype=np.int64)
+        for rows in iterate_chunks(tickets, ("flight_id",), chunk_size)
+    ]
+
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+
+def build_flight_report(
+        date_from,
+        date_to,
+        group_by: str,
+        chunk_size: int = REPORT_CHUNK_SIZE
+) -> list:
+    """
+    Flights, seats, sold tickets and load factor per route,
+    departure weekday or departure hour, grouped with bincount
+    """
+    flights = load_flight_columns(date_from, date_to, chunk_size)
+    ticket_flight_ids = load_ticket_flight_ids(date_from, date_to, chunk_size)
+
+    if not len(flights["id"]):
+        return []
+
+    # ids come sorted from the keyset chunks, tickets of flights
+    # written between the two loads are left out
+    ticket_flights = np.searchsorted(flights["id"], ticket_flight_ids)
+    ticket_flights = ticket_flights[
+        (ticket_flights < len(flights["id"]))
+        & (
+            flights["id"][np.minimum(ticket_flights, len(flights["id"]) - 1)]
+            == ticket_flight_ids
+        )
+    ]
+    groups, flight_groups = np.unique(
+        flights[group_by], return_inverse=True
+    )
+
+    flights_count = np.bincount(flight_groups, minlength=len(groups))
+    seats = np.bincount(
+        flight_groups, weights=flights["capacity"], minlength=len(groups)
+    ).astype(np.int64)
+    tickets_sold = np.bincount(
+        flight_groups[ticket_flights], minlength=len(groups)
+    )
+
+    return [
+        {
+            group_by: group,
+            "flights": flights_number,
+            "seats": seats_number,
+            "tickets_sold": sold,
+            "load_factor": round(sold / max(seats_number, 1), 4),
+        }
+        for group, flights_number, seats_number, sold in zip(
+            groups.tolist(),
+            flights_count.tolist(),
+            seats.tolist(),
+            tickets_sold.tolist(),
+        )
+    ]
+
+
+def build_flight_report_naive(date_from, date_to, group_by: str) -> list:
+    """The same report by iterating model instances, for benchmarks"""
+    stats = defaultdict(lambda: {"flights": 0, "seats": 0, "tickets_sold": 0})
+
+    def get_group(flight):
+        if group_by == "route":
+            return flight.route_id
+
+        local_time = timezone.localtime(flight.departure_time)
+
+        return (
+            local_time.isoweekday() if group_by == "weekday"
+            else local_time.hour
+        )
+
+    for flight in Flight.objects.filter(
+        **get_period_filter("departure_time", date_from, date_to)
+    ).select_related("airplane"):
+        stats[get_group(flight)]["flights"] += 1
+        stats[get_group(flight)]["seats"] += flight.airplane.airplane_capacity
+
+    for ticket in Ticket.objects.filter(
+        **get_period_filter("flight__departure_time", date_from, date_to)
+    ).select_related("flight"):
+        stats[get_group(ticket.flight)]["tickets_sold"] += 1
+
+    return [
+        {
+            group_by: group,
+            **stats[group],
+            "load_factor": round(
+                stats[group]["tickets_sold"] / max(stats[group]["seats"], 1),
+                4
+            ),
+        }
+        for group in sorted(stats)
+    ]
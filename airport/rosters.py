@@ -0,0 +1,185 @@
+import heapq
+from bisect import bisect_left, insort
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from airport.flight_search import (
+    get_flight_search_entries,
+    invalidate_flight_searches,
+)
+from airport.models import Crew, Flight
+
+ROSTER_BATCH_SIZE = 1000
+
+
+class CrewDuties:
+    """Sorted (departure_time, arrival_time) duties of one crew member"""
+
+    def __init__(self):
+        self.duties = []
+
+    def add(self, departure_time, arrival_time):
+        insort(self.duties, (departure_time, arrival_time))
+
+    def duty_between(self, start, end) -> timedelta:
+        index = max(bisect_left(self.duties, (start,)) - 1, 0)
+        total = timedelta(0)
+
+        for departure_time, arrival_time in self.duties[index:]:
+            if departure_time >= end:
+                break
+
+            if arrival_time > start:
+                total += min(arrival_time, end) - max(departure_time, start)
+
+        return total
+
+    def has_rest(self, departure_time, arrival_time, min_rest) -> bool:
+        index = bisect_left(self.duties, (departure_time,))
+
+        if index > 0:
+            previous_arrival = self.duties[index - 1][1]
+
+            if previous_arrival + min_rest > departure_time:
+                return False
+
+        if index < len(self.duties):
+            next_departure = self.duties[index][0]
+
+            if arrival_time + min_rest > next_departure:
+                return False
+
+        return True
+
+    def can_take(
+            self,
+            departure_time,
+            arrival_time,
+            min_rest: timedelta,
+            max_duty: timedelta,
+            duty_window: timedelta
+    ) -> bool:
+        if not self.has_rest(departure_time, arrival_time, min_rest):
+            return False
+
+        duration = arrival_time - departure_time
+
+        return (
+            self.duty_between(arrival_time - duty_window, arrival_time)
+            + duration <= max_duty
+            and self.duty_between(departure_time, departure_time + duty_window)
+            + duration <= max_duty
+        )
+
+
+def get_crew_duties(crew_ids: list, start, end) -> dict:
+    duties = {crew_id: CrewDuties() for crew_id in crew_ids}
+
+    assigned = Flight.crew.through.objects.filter(
+        flight__departure_time__lt=end,
+        flight__arrival_time__gt=start,
+    ).values_list(
+        "crew_id", "flight__departure_time", "flight__arrival_time"
+    )
+
+    for crew_id, departure_time, arrival_time in assigned:
+        duties[crew_id].add(departure_time, arrival_time)
+
+    return duties
+
+
+def plan_roster(
+        date_from,
+        date_to,
+        crew_per_flight: int,
+        min_rest: timedelta,
+        max_duty: timedelta,
+        duty_window: timedelta
+):
+    start = timezone.make_aware(datetime.combine(date_from, time.min))
+    end = timezone.make_aware(datetime.combine(date_to, time.min)) + (
+        timedelta(days=1)
+    )
+
+    flights = Flight.objects.filter(
+        departure_time__gte=start,
+        departure_time__lt=end,
+        crew__isnull=True,
+    ).order_by("departure_time").values_list(
+        "id", "departure_time", "arrival_time"
+    )
+
+    crew_ids = list(Crew.objects.values_list("id", flat=True))
+    duties = get_crew_duties(
+        crew_ids,
+        start - duty_window - min_rest,
+        end + duty_window + min_rest
+    )
+
+    # crew members ordered by the time they are ready for the next flight
+    ready = [(start - min_rest, crew_id) for crew_id in crew_ids]
+    heapq.heapify(ready)
+
+    assignments = []
+    unstaffed = []
+
+    for flight_id, departure_time, arrival_time in flights:
+        chosen = []
+        skipped = []
+
+        while ready and len(chosen) < crew_per_flight:
+            ready_time, crew_id = ready[0]
+
+            if ready_time > departure_time:
+                break
+
+            heapq.heappop(ready)
+
+            if duties[crew_id].can_take(
+                departure_time, arrival_time, min_rest, max_duty, duty_window
+            ):
+                chosen.append(crew_id)
+            else:
+                skipped.append((ready_time, crew_id))
+
+        for item in skipped:
+            heapq.heappush(ready, item)
+
+        if len(chosen) < crew_per_flight:
+            for crew_id in chosen:
+                heapq.heappush(ready, (departure_time, crew_id))
+
+            unstaffed.append(flight_id)
+            continue
+
+        for crew_id in chosen:
+            duties[crew_id].add(departure_time, arrival_time)
+            heapq.heappush(ready, (arrival_time + min_rest, crew_id))
+
+        assignments.append((flight_id, chosen))
+
+    return assignments, unstaffed
+
+
+def save_roster(assignments: list, batch_size: int = ROSTER_BATCH_SIZE):
+    through = Flight.crew.through
+
+    with transaction.atomic():
+        through.objects.bulk_create(
+            [
+                through(flight_id=flight_id, crew_id=crew_id)
+                for flight_id, crew_ids in assignments
+                for crew_id in crew_ids
+            ],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        invalidate_flight_searches(
+            get_flight_search_entries(
+                Flight.objects.filter(
+                    pk__in=[flight_id for flight_id, _ in assignments]
+                )
+            )
+        )
@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from airport.analytics import get_stats_key, refresh_route_stats
+from airport.conflicts import find_overlaps
+from airport.flight_search import invalidate_flight_searches
+from airport.models import Flight
+
+SCHEDULE_BATCH_SIZE = 1000
+
+
+def get_schedule_departures(
+        weekdays: list,
+        departure_time,
+        date_from,
+        date_to
+):
+    day = date_from
+
+    while day <= date_to:
+        if day.isoweekday() in weekdays:
+            yield timezone.make_aware(datetime.combine(day, departure_time))
+
+        day += timedelta(days=1)
+
+
+def build_scheduled_flights(
+        route,
+        airplane,
+        weekdays: list,
+        departure_time,
+        duration: timedelta,
+        date_from,
+        date_to
+):
+    flights = [
+        Flight(
+            route=route,
+            airplane=airplane,
+            departure_time=departure,
+            arrival_time=departure + duration,
+        )
+        for departure in get_schedule_departures(
+            weekdays, departure_time, date_from, date_to
+        )
+    ]
+
+    for flight in flights:
+        flight.set_flight_duration()
+
+    return flights
+
+
+def get_airplane_schedule(airplane, flights: list):
+    if not flights:
+        return []
+
+    return list(
+        Flight.objects.filter(
+            airplane=airplane,
+            departure_time__lt=flights[-1].arrival_time,
+            arrival_time__gt=flights[0].departure_time,
+        ).order_by("departure_time").values_list(
+            "id", "route_id", "departure_time", "arrival_time"
+        )
+    )
+
+
+def split_scheduled_flights(route, flights: list, existing: list):
+    existing_keys = {
+        (departure_time, arrival_time)
+        for _, route_id, departure_time, arrival_time in existing
+        if route_id == route.id
+    }
+
+    new_flights = [
+        flight
+        for flight in flights
+        if (flight.departure_time, flight.arrival_time) not in existing_keys
+    ]
+
+    return new_flights, len(flights) - len(new_flights)
+
+
+def find_schedule_conflicts(airplane, new_flights: list, existing: list):
+    rows = sorted(
+        [
+            (airplane.id, flight_id, departure_time, arrival_time)
+            for flight_id, _, departure_time, arrival_time in existing
+        ] + [
+            (airplane.id, None, flight.departure_time, flight.arrival_time)
+            for flight in new_flights
+        ],
+        key=lambda row: row[2]
+    )
+
+    return [
+        (first_id, second_id)
+        for _, first_id, second_id in find_overlaps(rows)
+        if first_id is None or second_id is None
+    ]
+
+
+def create_scheduled_flights(
+        route,
+        airplane,
+        weekdays: list,
+        departure_time,
+        duration: timedelta,
+        date_from,
+        date_to,
+        batch_size: int = SCHEDULE_BATCH_SIZE
+):
+    flights = build_scheduled_flights(
+        route, airplane, weekdays, departure_time, duration, date_from, date_to
+    )
+    new_flights, skipped = split_scheduled_flights(
+        route, flights, get_airplane_schedule(airplane, flights)
+    )
+
+    with transaction.atomic():
+        Flight.objects.bulk_create(new_flights, batch_size=batch_size)
+        invalidate_flight_searches([
+            (
+                route.source.closest_big_city_id,
+                route.destination.closest_big_city_id,
+                flight.departure_time,
+            )
+            for flight in new_flights
+        ])
+        stats_keys = {
+            get_stats_key(
+                route.id, airplane.airplane_type_id, flight.departure_time
+            )
+            for flight in new_flights
+        }
+        transaction.on_commit(lambda: refresh_route_stats(stats_keys))
+
+    return new_flights, skipped
@@ -0,0 +1,166 @@
+import re
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection
+from django.db.models import Case, FloatField, Value, When
+
+from airport_api_service.caches import VersionedIndex
+
+SEARCH_INDEX_VERSION_KEY = "search_index_version:{label}"
+
+WORD_RE = re.compile(r"\w+")
+
+
+def normalize_name(name: str) -> str:
+    return " ".join(name.casefold().split())
+
+
+def get_trigrams(name: str) -> set:
+    """Trigrams of the name the same way pg_trgm splits them"""
+    trigrams = set()
+
+    for word in WORD_RE.findall(name.casefold()):
+        padded = f"  {word} "
+        trigrams.update(
+            padded[index:index + 3] for index in range(len(padded) - 2)
+        )
+
+    return trigrams
+
+
+def trigram_similarity(first: str, second: str) -> float:
+    first, second = get_trigrams(first), get_trigrams(second)
+
+    if not first or not second:
+        return 0.0
+
+    return len(first & second) / len(first | second)
+
+
+class NameTrie:
+    """
+    Prefix trie over every suffix of the normalized names,
+    walking a query from the root finds all names containing it
+    """
+
+    def __init__(self, names):
+        self.root = {}
+        self.names = {}
+
+        for name_id, name in names:
+            self.add(name_id, name)
+
+    def add(self, name_id: int, name: str):
+        name = normalize_name(name)
+        self.names[name_id] = name
+
+        for start in range(len(name)):
+            node = self.root
+
+            for char in name[start:]:
+                node = node.setdefault(char, {})
+                node.setdefault(None, set()).add(name_id)
+
+    def find(self, query: str) -> set:
+        node = self.root
+
+        for char in normalize_name(query):
+            node = node.get(char)
+
+            if node is None:
+                return set()
+
+        return node.get(None, set())
+
+    def search(self, query: str) -> dict:
+        return {
+            name_id: trigram_similarity(self.names[name_id], query)
+            for name_id in self.find(query)
+        }
+
+
+_search_indexes = {}
+
+
+def get_search_index(model) -> VersionedIndex:
+    """Name tries of the model by field, dropped on any write of the model"""
+    label = model._meta.label_lower
+
+    if label not in _search_indexes:
+        _search_indexes[label] = VersionedIndex(
+            SEARCH_INDEX_VERSION_KEY.format(label=label), dict
+        )
+
+    return _search_indexes[label]
+
+
+def get_name_trie(model, field: str) -> NameTrie:
+    tries = get_search_index(model).get()
+
+    if field not in tries:
+        tries[field] = NameTrie(
+            model.objects.values_list("id", field).iterator()
+        )
+
+    return tries[field]
+
+
+def invalidate_search_index(model):
+    get_search_index(model).invalidate()
+
+
+def trie_search(queryset, terms: dict):
+    ranks = []
+
+    for field, value in terms.items():
+        relation, _, name_field = field.rpartition("__")
+        model = queryset.model
+        lookup = "pk"
+
+        if relation:
+            model = model._meta.get_field(relation).related_model
+            lookup = f"{relation}_id"
+
+        matches = get_name_trie(model, name_field).search(value)
+        queryset = queryset.filter(**{f"{lookup}__in": list(matches)})
+        ranks.append(
+            Case(
+                *[
+                    When(**{lookup: match_id}, then=Value(rank))
+                    for match_id, rank in matches.items()
+                ],
+                default=Value(0.0),
+                output_field=FloatField(),
+            )
+        )
+
+    return queryset, sum(ranks[1:], ranks[0])
+
+
+def postgres_search(queryset, terms: dict):
+    ranks = []
+
+    for field, value in terms.items():
+        # served by the UPPER(field) gin_trgm_ops indexes
+        queryset = queryset.filter(**{f"{field}__icontains": value})
+        ranks.append(TrigramSimilarity(field, value))
+
+    return queryset, sum(ranks[1:], ranks[0])
+
+
+def search_by_name(queryset, **terms):
+    """
+    Filter queryset by name substrings (field=value)
+    and order it by trigram similarity, best matches first
+    """
+    terms = {field: value for field, value in terms.items() if value}
+
+    if not terms:
+        return queryset
+
+    if connection.vendor == "postgresql":
+        queryset, rank = postgres_search(queryset, terms)
+    else:
+        queryset, rank = trie_search(queryset, terms)
+
+    return queryset.annotate(search_rank=rank).order_by("-search_rank", "id")
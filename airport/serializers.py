@@ -1,6 +1,12 @@
+from datetime import timedelta
+
 from django.db import transaction
 from rest_framework import serializers
 
+from airport.analytics import ANALYTICS_GROUPS, record_order_stats
+from airport.autocomplete import AUTOCOMPLETE_MODELS
+from airport.batch import BATCH_MAX_REQUESTS
+from airport.flight_search import FLIGHT_ORDERING
 from airport.models import (
     Country,
     City,
@@ -12,6 +18,15 @@ from airport.models import (
     Flight,
     Order,
     Ticket,
+    FareClass,
+    Fare,
+)
+from airport.orders import save_order_summaries
+from airport.schedules import (
+    build_scheduled_flights,
+    get_airplane_schedule,
+    split_scheduled_flights,
+    find_schedule_conflicts,
 )
 from airport.validators import (
     validate_name,
@@ -23,8 +38,23 @@ from airport.validators import (
     validate_departure_arrival_date,
     validate_city_country,
     validate_seat_or_row,
+    validate_date_range,
+    validate_weekdays,
+    validate_duration,
+    validate_airplane_is_available,
+    validate_crew_is_available,
+    validate_schedule_is_available,
+    validate_coordinates,
+    validate_route_distance,
+    validate_fare_class_rows,
+    validate_fare_class_airplane,
+    validate_price,
 )
 
+SCHEDULE_MAX_DAYS = 366
+ROSTER_MAX_DAYS = 92
+ANALYTICS_MAX_DAYS = 366
+
 
 class CountrySerializer(serializers.ModelSerializer):
     class Meta:
@@ -127,6 +157,11 @@ class AirportSerializer(serializers.ModelSerializer):
             name=attrs["name"],
             error_to_raise=serializers.ValidationError
         )
+        validate_coordinates(
+            latitude=attrs.get("latitude"),
+            longitude=attrs.get("longitude"),
+            error_to_raise=serializers.ValidationError
+        )
 
         return data
 
@@ -149,13 +184,45 @@ class AirportDetailSerializer(AirportSerializer):
 
     class Meta:
         model = Airport
-        fields = ("id", "name", "closest_big_city")
+        fields = ("id", "name", "closest_big_city", "latitude", "longitude")
+
+
+class NearestAirportsSerializer(serializers.Serializer):
+    lat = serializers.FloatField(min_value=-90, max_value=90)
+    lon = serializers.FloatField(min_value=-180, max_value=180)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=5)
+
+
+class AutocompleteSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=100)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
+    types = serializers.CharField(required=False)
+
+    def validate_types(self, value):
+        types = set(value.split(","))
+        unknown = types - set(AUTOCOMPLETE_MODELS)
+
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unknown types: {', '.join(sorted(unknown))}"
+            )
+
+        return types
+
+
+class BatchSerializer(serializers.Serializer):
+    requests = serializers.ListField(
+        child=serializers.CharField(max_length=2000),
+        allow_empty=False,
+        max_length=BATCH_MAX_REQUESTS,
+    )
 
 
 class RouteSerializer(serializers.ModelSerializer):
     class Meta:
         model = Route
         fields = "__all__"
+        extra_kwargs = {"distance": {"required": False}}
 
     def validate(self, attrs):
         data = super(RouteSerializer, self).validate(attrs)
@@ -165,6 +232,14 @@ class RouteSerializer(serializers.ModelSerializer):
             destination_id=attrs["destination"].id,
             error_to_raise=serializers.ValidationError
         )
+        validate_route_distance(
+            distance=attrs.get("distance"),
+            has_coordinates=Route(
+                source=attrs["source"],
+                destination=attrs["destination"]
+            ).has_coordinates,
+            error_to_raise=serializers.ValidationError
+        )
 
         return data
 
@@ -293,6 +368,61 @@ class CrewListSerializer(CrewSerializer):
         fields = ("id", "full_name")
 
 
+class RosterSerializer(serializers.Serializer):
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    crew_per_flight = serializers.IntegerField(min_value=1, default=2)
+    # a negative rest would overlap the flights of a crew member
+    min_rest = serializers.DurationField(
+        default=timedelta(hours=10), min_value=timedelta(0)
+    )
+    max_duty = serializers.DurationField(default=timedelta(hours=60))
+    duty_window = serializers.DurationField(default=timedelta(days=7))
+    dry_run = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        data = super(RosterSerializer, self).validate(attrs)
+
+        validate_date_range(
+            date_from=attrs["date_from"],
+            date_to=attrs["date_to"],
+            max_days=ROSTER_MAX_DAYS,
+            error_to_raise=serializers.ValidationError
+        )
+        validate_duration(
+            field_name="max_duty",
+            duration=attrs["max_duty"],
+            error_to_raise=serializers.ValidationError
+        )
+        validate_duration(
+            field_name="duty_window",
+            duration=attrs["duty_window"],
+            error_to_raise=serializers.ValidationError
+        )
+
+        return data
+
+
+class AnalyticsSerializer(serializers.Serializer):
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    group_by = serializers.ChoiceField(
+        choices=list(ANALYTICS_GROUPS), default="route"
+    )
+
+    def validate(self, attrs):
+        data = super(AnalyticsSerializer, self).validate(attrs)
+
+        validate_date_range(
+            date_from=attrs["date_from"],
+            date_to=attrs["date_to"],
+            max_days=ANALYTICS_MAX_DAYS,
+            error_to_raise=serializers.ValidationError
+        )
+
+        return data
+
+
 class FlightSerializer(serializers.ModelSerializer):
     class Meta:
         model = Flight
@@ -324,6 +454,77 @@ class FlightSerializer(serializers.ModelSerializer):
             error_to_raise=serializers.ValidationError
         )
 
+        flight_id = self.instance.id if self.instance else None
+
+        validate_airplane_is_available(
+            airplane=attrs["airplane"],
+            departure_time=attrs["departure_time"],
+            arrival_time=attrs["arrival_time"],
+            flight_id=flight_id,
+            error_to_raise=serializers.ValidationError
+        )
+        validate_crew_is_available(
+            crew=attrs.get(
+                "crew", self.instance.crew.all() if self.instance else []
+            ),
+            departure_time=attrs["departure_time"],
+            arrival_time=attrs["arrival_time"],
+            flight_id=flight_id,
+            error_to_raise=serializers.ValidationError
+        )
+
+        return data
+
+
+class FlightScheduleSerializer(serializers.Serializer):
+    route = serializers.PrimaryKeyRelatedField(queryset=Route.objects.all())
+    airplane = serializers.PrimaryKeyRelatedField(
+        queryset=Airplane.objects.all()
+    )
+    weekdays = serializers.ListField(child=serializers.IntegerField())
+    departure_time = serializers.TimeField()
+    duration = serializers.DurationField()
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+
+    def validate(self, attrs):
+        data = super(FlightScheduleSerializer, self).validate(attrs)
+
+        validate_weekdays(
+            weekdays=attrs["weekdays"],
+            error_to_raise=serializers.ValidationError
+        )
+        validate_duration(
+            duration=attrs["duration"],
+            error_to_raise=serializers.ValidationError
+        )
+        validate_date_range(
+            date_from=attrs["date_from"],
+            date_to=attrs["date_to"],
+            max_days=SCHEDULE_MAX_DAYS,
+            error_to_raise=serializers.ValidationError
+        )
+
+        flights = build_scheduled_flights(**attrs)
+
+        if flights:
+            validate_date(
+                field_name="date_from",
+                date=flights[0].departure_time,
+                error_to_raise=serializers.ValidationError
+            )
+
+        existing = get_airplane_schedule(attrs["airplane"], flights)
+        new_flights, _ = split_scheduled_flights(
+            attrs["route"], flights, existing
+        )
+        validate_schedule_is_available(
+            conflicts=find_schedule_conflicts(
+                attrs["airplane"], new_flights, existing
+            ),
+            error_to_raise=serializers.ValidationError
+        )
+
         return data
 
 
@@ -385,6 +586,28 @@ class FlightDetailSerializer(FlightListSerializer):
         )
 
 
+class LoadedFlightListSerializer(FlightListSerializer):
+    """FlightListSerializer of flights with crew_names set by the view"""
+
+    crew = serializers.ListField(
+        child=serializers.CharField(), source="crew_names", read_only=True
+    )
+
+
+class LoadedFlightDetailSerializer(FlightDetailSerializer):
+    """
+    FlightDetailSerializer of a flight with loaded_crew
+    and loaded_taken_places set by the view
+    """
+
+    crew = CrewListSerializer(
+        source="loaded_crew", many=True, read_only=True
+    )
+    taken_places = TakenTicketsSerializer(
+        source="loaded_taken_places", many=True, read_only=True
+    )
+
+
 class MiniFlightDetailSerializer(FlightListSerializer):
     class Meta:
         model = Flight
@@ -422,6 +645,104 @@ class CrewDetailSerializer(CrewSerializer):
         fields = ("id", "first_name", "last_name", "flights")
 
 
+class FareClassSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = FareClass
+        fields = ("id", "airplane", "name", "first_row", "last_row")
+
+    def validate(self, attrs):
+        data = super(FareClassSerializer, self).validate(attrs)
+
+        other_classes = attrs["airplane"].fare_classes.all()
+
+        if self.instance:
+            other_classes = other_classes.exclude(id=self.instance.id)
+
+        validate_fare_class_rows(
+            first_row=attrs["first_row"],
+            last_row=attrs["last_row"],
+            rows=attrs["airplane"].rows,
+            other_classes=other_classes,
+            error_to_raise=serializers.ValidationError
+        )
+
+        return data
+
+
+class FareClassListSerializer(FareClassSerializer):
+    airplane = serializers.CharField(source="airplane.name", read_only=True)
+
+
+class FareSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Fare
+        fields = ("id", "flight", "fare_class", "price")
+
+    def validate(self, attrs):
+        data = super(FareSerializer, self).validate(attrs)
+
+        validate_fare_class_airplane(
+            fare_class=attrs["fare_class"],
+            flight=attrs["flight"],
+            error_to_raise=serializers.ValidationError
+        )
+        validate_price(
+            price=attrs["price"],
+            error_to_raise=serializers.ValidationError
+        )
+
+        return data
+
+
+class FareListSerializer(FareSerializer):
+    fare_class = serializers.CharField(
+        source="fare_class.name", read_only=True
+    )
+    first_row = serializers.IntegerField(
+        source="fare_class.first_row", read_only=True
+    )
+    last_row = serializers.IntegerField(
+        source="fare_class.last_row", read_only=True
+    )
+
+    class Meta:
+        model = Fare
+        fields = (
+            "id",
+            "flight",
+            "fare_class",
+            "first_row",
+            "last_row",
+            "price",
+        )
+
+
+class FareCalendarSerializer(serializers.Serializer):
+    def get_fields(self):
+        # "from" can't be declared as a class attribute
+        return {
+            "from": serializers.PrimaryKeyRelatedField(
+                queryset=City.objects.all()
+            ),
+            "to": serializers.PrimaryKeyRelatedField(
+                queryset=City.objects.all()
+            ),
+        }
+
+
+class FlightSearchSerializer(serializers.Serializer):
+    def get_fields(self):
+        # "from" can't be declared as a class attribute
+        return {
+            "from": serializers.IntegerField(),
+            "to": serializers.IntegerField(),
+            "departure_date": serializers.DateField(),
+            "ordering": serializers.ChoiceField(
+                choices=list(FLIGHT_ORDERING), required=False
+            ),
+        }
+
+
 class TicketSerializer(serializers.ModelSerializer):
     class Meta:
         model = Ticket
@@ -474,19 +795,36 @@ class OrderSerializer(serializers.ModelSerializer):
             tickets_data = validated_data.pop("tickets")
 
             order = Order.objects.create(**validated_data)
-
-            for ticket_data in tickets_data:
+            tickets = [
                 Ticket.objects.create(order=order, **ticket_data)
+                for ticket_data in tickets_data
+            ]
+            record_order_stats(tickets)
+            save_order_summaries(Order.objects.filter(pk=order.pk))
 
             return order
 
 
 class OrderListSerializer(OrderSerializer):
-    tickets = TicketListSerializer(many=True, read_only=True)
+    tickets_count = serializers.IntegerField(
+        source="summary.tickets_count", read_only=True
+    )
+    flights = serializers.JSONField(source="summary.flights", read_only=True)
+    first_departure = serializers.DateTimeField(
+        source="summary.first_departure", read_only=True
+    )
+    cities = serializers.JSONField(source="summary.cities", read_only=True)
 
     class Meta:
         model = Order
-        fields = ("id", "tickets", "created_at",)
+        fields = (
+            "id",
+            "created_at",
+            "tickets_count",
+            "flights",
+            "first_departure",
+            "cities",
+        )
 
 
 class OrderDetailSerializer(OrderSerializer):
@@ -0,0 +1,197 @@
+from django.db.models.signals import (
+    pre_save,
+    post_save,
+    pre_delete,
+    post_delete,
+    m2m_changed,
+)
+from django.dispatch import receiver
+
+from airport.analytics import refresh_route_stats_on_commit
+from airport.autocomplete import (
+    AUTOCOMPLETE_MODELS,
+    update_autocomplete_index,
+)
+from airport.fares import refresh_daily_lowest_fares
+from airport.flight_search import (
+    change_tickets_sold,
+    get_flight_search_entries,
+    get_flights_showing,
+    invalidate_flight_searches,
+)
+from airport.models import (
+    Country,
+    City,
+    Airport,
+    Route,
+    AirplaneType,
+    Airplane,
+    Crew,
+    Flight,
+    Order,
+    Ticket,
+    Fare,
+)
+from airport.orders import (
+    get_orders_showing,
+    refresh_order_summaries_on_commit,
+)
+from airport.search import invalidate_search_index
+from airport.spatial import invalidate_airport_index
+
+AUTOCOMPLETE_KINDS = {
+    model: kind for kind, model in AUTOCOMPLETE_MODELS.items()
+}
+
+
+@receiver(pre_save, sender=Airplane)
+def airplane_before_raw_save(sender, instance, raw, **kwargs):
+    # loaddata saves raw, without Airplane.save filling the capacity
+    if raw:
+        instance.set_airplane_capacity()
+
+
+@receiver(pre_save, sender=Flight)
+def flight_before_raw_save(sender, instance, raw, **kwargs):
+    # loaddata saves raw, without Flight.save filling the duration
+    if raw:
+        instance.set_flight_duration()
+
+
+@receiver(post_save, sender=Airport)
+@receiver(post_delete, sender=Airport)
+def airport_changed(sender, **kwargs):
+    invalidate_airport_index()
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+@receiver(post_save, sender=City)
+@receiver(post_delete, sender=City)
+@receiver(post_save, sender=Airport)
+@receiver(post_delete, sender=Airport)
+@receiver(post_save, sender=AirplaneType)
+@receiver(post_delete, sender=AirplaneType)
+@receiver(post_save, sender=Airplane)
+@receiver(post_delete, sender=Airplane)
+@receiver(post_save, sender=Crew)
+@receiver(post_delete, sender=Crew)
+def searchable_name_changed(sender, **kwargs):
+    invalidate_search_index(sender)
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_save, sender=City)
+@receiver(post_save, sender=Airport)
+def autocomplete_name_saved(sender, instance, **kwargs):
+    update_autocomplete_index(
+        AUTOCOMPLETE_KINDS[sender], instance.id, instance.name
+    )
+
+
+@receiver(post_delete, sender=Country)
+@receiver(post_delete, sender=City)
+@receiver(post_delete, sender=Airport)
+def autocomplete_name_deleted(sender, instance, **kwargs):
+    update_autocomplete_index(AUTOCOMPLETE_KINDS[sender], instance.id)
+
+
+@receiver(pre_save, sender=Flight)
+@receiver(post_save, sender=Flight)
+@receiver(pre_delete, sender=Flight)
+def flight_changed(sender, instance, **kwargs):
+    # before and after a save, so both the old and the new day are updated
+    if instance.pk:
+        flights = Flight.objects.filter(pk=instance.pk)
+        entries = get_flight_search_entries(flights)
+        invalidate_flight_searches(entries)
+        refresh_daily_lowest_fares(entries)
+        refresh_route_stats_on_commit(flights)
+
+
+@receiver(post_save, sender=Flight)
+def flight_saved(sender, instance, created, **kwargs):
+    if not created:
+        refresh_order_summaries_on_commit(
+            Order.objects.filter(tickets__flight=instance).distinct()
+        )
+
+
+@receiver(pre_save, sender=City)
+@receiver(post_save, sender=City)
+@receiver(pre_save, sender=Airport)
+@receiver(post_save, sender=Airport)
+@receiver(pre_save, sender=Route)
+@receiver(post_save, sender=Route)
+def flight_route_changed(sender, instance, **kwargs):
+    # before and after a save, so both the old and the new city pair
+    # of the flights are updated
+    if instance.pk and not kwargs.get("created"):
+        entries = get_flight_search_entries(get_flights_showing(instance))
+        invalidate_flight_searches(entries)
+        refresh_daily_lowest_fares(entries)
+
+
+@receiver(post_save, sender=Crew)
+def crew_saved(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_flight_searches(
+            get_flight_search_entries(get_flights_showing(instance))
+        )
+
+
+@receiver(post_save, sender=City)
+@receiver(post_save, sender=Airport)
+@receiver(post_save, sender=Route)
+def order_summary_name_saved(sender, instance, created, **kwargs):
+    # summaries keep the city names of the routes of their flights
+    if not created:
+        refresh_order_summaries_on_commit(get_orders_showing(instance))
+
+
+@receiver(m2m_changed, sender=Flight.crew.through)
+def flight_crew_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if not reverse:
+        flights = Flight.objects.filter(pk=instance.pk)
+    elif action == "pre_clear":
+        flights = Flight.objects.filter(crew=instance)
+    else:
+        flights = Flight.objects.filter(pk__in=pk_set)
+
+    invalidate_flight_searches(get_flight_search_entries(flights))
+
+
+@receiver(post_save, sender=Airplane)
+def airplane_changed(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_flight_searches(
+            get_flight_search_entries(instance.flights.all())
+        )
+
+
+@receiver(post_save, sender=Ticket)
+def ticket_created(sender, instance, created, **kwargs):
+    if created:
+        change_tickets_sold(instance.flight_id, 1)
+
+
+@receiver(post_delete, sender=Ticket)
+def ticket_deleted(sender, instance, **kwargs):
+    change_tickets_sold(instance.flight_id, -1)
+    refresh_order_summaries_on_commit(
+        Order.objects.filter(pk=instance.order_id)
+    )
+    refresh_route_stats_on_commit(
+        Flight.objects.filter(pk=instance.flight_id)
+    )
+
+
+@receiver(post_save, sender=Fare)
+@receiver(post_delete, sender=Fare)
+def fare_changed(sender, instance, **kwargs):
+    flights = Flight.objects.filter(pk=instance.flight_id)
+    refresh_daily_lowest_fares(get_flight_search_entries(flights))
+    refresh_route_stats_on_commit(flights)
@@ -0,0 +1,152 @@
+import heapq
+import math
+
+from airport.geo import (
+    to_unit_vector,
+    chord_to_distance,
+    distance_to_chord,
+    squared_chord,
+)
+from airport.models import Airport
+from airport_api_service.caches import VersionedIndex, shared_cache
+
+AIRPORT_INDEX_VERSION_KEY = "airport_index_version"
+CITY_AIRPORTS_TIMEOUT = 60 * 60 * 24
+
+
+class AirportIndex:
+    """
+    k-d tree over airports as points on the unit sphere,
+    chord length grows with great-circle distance,
+    so the nearest points in 3D are the nearest on Earth
+    """
+
+    def __init__(self, airports):
+        points = [
+            (to_unit_vector(latitude, longitude), airport_id)
+            for airport_id, latitude, longitude in airports
+        ]
+        self.root = self.build(points, depth=0)
+
+    def build(self, points: list, depth: int):
+        if not points:
+            return None
+
+        axis = depth % 3
+        points.sort(key=lambda point: point[0][axis])
+        median = len(points) // 2
+
+        return (
+            points[median],
+            axis,
+            self.build(points[:median], depth + 1),
+            self.build(points[median + 1:], depth + 1),
+        )
+
+    def nearest(self, latitude: float, longitude: float, limit: int):
+        target = to_unit_vector(latitude, longitude)
+        best = []
+
+        def visit(node):
+            if node is None:
+                return
+
+            (point, airport_id), axis, left, right = node
+            distance = squared_chord(point, target)
+
+            if len(best) < limit:
+                heapq.heappush(best, (-distance, airport_id))
+            elif distance < -best[0][0]:
+                heapq.heapreplace(best, (-distance, airport_id))
+
+            difference = target[axis] - point[axis]
+            near, far = (left, right) if difference < 0 else (right, left)
+
+            visit(near)
+
+            if len(best) < limit or difference ** 2 < -best[0][0]:
+                visit(far)
+
+        visit(self.root)
+
+        return [
+            (airport_id, chord_to_distance(math.sqrt(-distance)))
+            for distance, airport_id in sorted(best, reverse=True)
+        ]
+
+    def within(self, latitude: float, longitude: float, radius: float):
+        target = to_unit_vector(latitude, longitude)
+        max_distance = distance_to_chord(radius) ** 2
+        found = []
+
+        def visit(node):
+            if node is None:
+                return
+
+            (point, airport_id), axis, left, right = node
+
+            if squared_chord(point, target) <= max_distance:
+                found.append(airport_id)
+
+            difference = target[axis] - point[axis]
+            near, far = (left, right) if difference < 0 else (right, left)
+
+            visit(near)
+
+            if difference ** 2 <= max_distance:
+                visit(far)
+
+        visit(self.root)
+
+        return found
+
+
+def build_airport_index() -> AirportIndex:
+    return AirportIndex(
+        Airport.objects.filter(
+            latitude__isnull=False,
+            longitude__isnull=False,
+        ).values_list("id", "latitude", "longitude")
+    )
+
+
+_airport_index = VersionedIndex(AIRPORT_INDEX_VERSION_KEY, build_airport_index)
+
+
+def get_airport_index() -> AirportIndex:
+    return _airport_index.get()
+
+
+def invalidate_airport_index():
+    _airport_index.invalidate()
+
+
+def get_city_airport_ids(city_id: int, radius: int) -> list:
+    """
+    Airports of the city and all airports within radius km of them,
+    shared by the processes per airport index version,
+    so any Airport write drops them in all of them
+    """
+    key = (
+        f"city_airports:{_airport_index.get_version()}:{city_id}:{radius}"
+    )
+    airport_ids = shared_cache.get(key)
+
+    if airport_ids is None:
+        city_airports = Airport.objects.filter(
+            closest_big_city_id=city_id
+        ).values_list("id", "latitude", "longitude")
+        airport_ids = set()
+
+        for airport_id, latitude, longitude in city_airports:
+            airport_ids.add(airport_id)
+
+            if latitude is not None and longitude is not None:
+                airport_ids.update(
+                    get_airport_index().within(latitude, longitude, radius)
+                )
+
+        airport_ids = sorted(airport_ids)
+        shared_cache.set(key, airport_ids, CITY_AIRPORTS_TIMEOUT)
+
+    return airport_ids
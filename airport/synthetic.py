@@ -0,0 +1,526 @@
+import math
+import random
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+import numpy as np
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from airport.geo import great_circle_distance
+from airport.models import (
+    Country,
+    City,
+    Airport,
+    Route,
+    AirplaneType,
+    Airplane,
+    Crew,
+    Flight,
+    FareClass,
+    Fare,
+    Order,
+    Ticket,
+)
+
+SYNTHETIC_BATCH_SIZE = 5000
+
+SYLLABLES = (
+    "ka", "lo", "ri", "va", "ne", "to", "mi", "sa", "der", "bur",
+    "lin", "gor", "ve", "ta", "no", "ra", "ski", "mar", "el", "vin",
+)
+
+AIRPLANE_MODELS = (
+    ("Airbus A320", 30, 6),
+    ("Airbus A321", 36, 6),
+    ("Boeing 737", 32, 6),
+    ("Embraer E190", 25, 4),
+    ("Boeing 787", 40, 9),
+)
+
+# airports are placed in one region so that every route
+# fits into one slot of an airplane day
+LATITUDE_RANGE = (36.0, 60.0)
+LONGITUDE_RANGE = (-9.0, 40.0)
+CRUISE_SPEED_KM_H = 800
+SLOTS_PER_AIRPLANE_DAY = 3
+TURNAROUND = timedelta(minutes=45)
+CREW_PER_FLIGHT = 2
+BUSINESS_ROWS_SHARE = 0.2
+ECONOMY_PRICE_PER_KM = Decimal("0.08")
+ECONOMY_BASE_PRICE = Decimal("30")
+BUSINESS_PRICE_FACTOR = 3
+
+
+class SyntheticDataset:
+    """
+    Reproducible airline network generated from one seed,
+    written with bulk_create so millions of tickets take minutes
+    """
+
+    def __init__(
+            self,
+            seed: int = 0,
+            batch_size: int = SYNTHETIC_BATCH_SIZE,
+            log=None
+    ):
+        self.random = random.Random(seed)
+        self.numpy_random = np.random.default_rng(seed)
+        self.seed = seed
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+
+    def make_name(self, used: set, syllables: int = 3) -> str:
+        while True:
+            name = "".join(
+                self.random.choice(SYLLABLES) for _ in range(syllables)
+            ).title()
+
+            if name not in used:
+                used.add(name)
+
+                return name
+
+    def bulk_create(self, model, objects: list) -> list:
+        created = model.objects.bulk_create(
+            objects, batch_size=self.batch_size
+        )
+        self.log(f"{model._meta.verbose_name_plural}: {len(created)}")
+
+        return created
+
+    def create_countries(self, count: int) -> list:
+        existing = set(Country.objects.values_list("name", flat=True))
+        names = sorted(
+            name for name, _ in Country.COUNTRY_CHOICES
+            if name not in existing
+        )
+
+        if count > len(names):
+            raise ValueError(
+                f"Only {len(names)} more countries can be created"
+            )
+
+        return self.bulk_create(
+            Country,
+            [
+                Country(name=name.title().strip())
+                for name in self.random.sample(names, count)
+            ]
+        )
+
+    def create_cities(self, countries: list, count: int) -> list:
+        used = set()
+
+        return self.bulk_create(
+            City,
+            [
+                City(
+                    name=self.make_name(used),
+                    country=countries[index % len(countries)],
+                )
+                for index in range(count)
+            ]
+        )
+
+    def create_airports(self, cities: list, count: int) -> list:
+        used = set(Airport.objects.values_list("name", flat=True))
+        airports = []
+
+        for index in range(count):
+            city = cities[index % len(cities)]
+            name = f"{city.name} {self.make_name(set(), 2)}".title().strip()
+
+            while name in used:
+                name = f"{city.name} {self.make_name(set(), 3)}".title()
+
+            used.add(name)
+            airports.append(Airport(
+                name=name,
+                closest_big_city=city,
+                latitude=round(self.random.uniform(*LATITUDE_RANGE), 4),
+                longitude=round(self.random.uniform(*LONGITUDE_RANGE), 4),
+            ))
+
+        return self.bulk_create(Airport, airports)
+
+    def create_routes(self, airports: list, count: int) -> list:
+        pairs_count = len(airports) * (len(airports) - 1)
+
+        if count > pairs_count:
+            raise ValueError(f"Only {pairs_count} routes are possible")
+
+        pairs = set()
+
+        while len(pairs) < count:
+            source, destination = self.random.sample(airports, 2)
+            pairs.add((source, destination))
+
+        return self.bulk_create(
+            Route,
+            [
+                Route(
+                    source=source,
+                    destination=destination,
+                    distance=round(great_circle_distance(
+                        source.latitude,
+                        source.longitude,
+                        destination.latitude,
+                        destination.longitude,
+                    )),
+                )
+                for source, destination in sorted(
+                    pairs, key=lambda pair: (pair[0].id, pair[1].id)
+                )
+            ]
+        )
+
+    def create_airplanes(self, count: int) -> list:
+        airplane_types = {
+            airplane_type.name: airplane_type
+            for airplane_type in AirplaneType.objects.filter(
+                name__in=[name for name, _, _ in AIRPLANE_MODELS]
+            )
+        }
+        self.bulk_create(
+            AirplaneType,
+            [
+                AirplaneType(name=name)
+                for name, _, _ in AIRPLANE_MODELS
+                if name not in airplane_types
+            ]
+        )
+        airplane_types = {
+            airplane_type.name: airplane_type
+            for airplane_type in AirplaneType.objects.filter(
+                name__in=[name for name, _, _ in AIRPLANE_MODELS]
+            )
+        }
+
+        used = set(Airplane.objects.values_list("name", flat=True))
+        airplanes = []
+
+        for index in range(count):
+            model_name, rows, seats_in_row = self.random.choice(
+                AIRPLANE_MODELS
+            )
+            name = f"{self.make_name(used, 2)} {self.seed} {index}"
+            airplane = Airplane(
+                name=name.strip(),
+                rows=rows,
+                seats_in_row=seats_in_row,
+                airplane_type=airplane_types[model_name],
+            )
+            airplane.set_airplane_capacity()
+            airplanes.append(airplane)
+
+        return self.bulk_create(Airplane, airplanes)
+
+    def create_flights(
+            self,
+            routes: list,
+            airplanes: list,
+            flights_per_day: int,
+            days: int,
+            date_from=None
+    ) -> list:
+        """
+        Every airplane day is split into slots long enough
+        for the longest route, so the airplanes are never double booked
+        """
+        slot = timedelta(hours=24 / SLOTS_PER_AIRPLANE_DAY)
+
+        if flights_per_day > len(airplanes) * SLOTS_PER_AIRPLANE_DAY:
+            raise ValueError(
+                f"{len(airplanes)} airplanes fly at most "
+                f"{len(airplanes) * SLOTS_PER_AIRPLANE_DAY} flights a day"
+            )
+
+        date_from = date_from or timezone.localdate() + timedelta(days=1)
+        start = timezone.make_aware(datetime.combine(date_from, time.min))
+        slots = [
+            (airplane, slot_index)
+            for slot_index in range(SLOTS_PER_AIRPLANE_DAY)
+            for airplane in airplanes
+        ]
+        flights = []
+
+        for day in range(days):
+            day_start = start + timedelta(days=day)
+
+            for airplane, slot_index in slots[:flights_per_day]:
+                route = self.random.choice(routes)
+                duration = timedelta(
+                    hours=route.distance / CRUISE_SPEED_KM_H + 0.5
+                )
+                free_time = slot - duration - TURNAROUND
+                departure_time = (
+                    day_start + slot * slot_index
+                    + free_time * self.random.random()
+                ).replace(second=0, microsecond=0)
+
+                flight = Flight(
+                    route=route,
+                    airplane=airplane,
+                    departure_time=departure_time,
+                    arrival_time=departure_time + duration,
+                )
+                flight.set_flight_duration()
+                flights.append(flight)
+
+        return self.bulk_create(Flight, flights)
+
+    def create_crew(self, count: int) -> list:
+        used = set(Crew.objects.values_list("first_name", "last_name"))
+        crew = []
+
+        while len(crew) < count:
+            first_name = self.make_name(set(), 2).title().strip()
+            last_name = self.make_name(set(), 3).title().strip()
+
+            if (first_name, last_name) not in used:
+                used.add((first_name, last_name))
+                crew.append(Crew(first_name=first_name, last_name=last_name))
+
+        return self.bulk_create(Crew, crew)
+
+    def assign_crew(self, flights: list, airplanes: list, crew: list) -> int:
+        """
+        Every airplane gets its own team, teams fly only their airplane,
+        so crew members are never double booked either;
+        airplanes left without a team keep unstaffed flights
+        """
+        teams = {
+            airplane.id: crew[index:index + CREW_PER_FLIGHT]
+            for airplane, index in zip(
+                airplanes,
+                range(0, len(crew) - CREW_PER_FLIGHT + 1, CREW_PER_FLIGHT)
+            )
+        }
+        through = Flight.crew.through
+
+        return len(self.bulk_create(
+            through,
+            [
+                through(flight_id=flight.id, crew_id=member.id)
+                for flight in flights
+                for member in teams.get(flight.airplane.id, [])
+            ]
+        ))
+
+    def create_fares(self, airplanes: list, flights: list) -> int:
+        fare_classes = {}
+
+        for airplane in airplanes:
+            business_rows = max(1, round(airplane.rows * BUSINESS_ROWS_SHARE))
+            fare_classes[airplane.id] = (
+                FareClass(
+                    airplane=airplane,
+                    name=FareClass.BUSINESS,
+                    first_row=1,
+                    last_row=business_rows,
+                ),
+                FareClass(
+                    airplane=airplane,
+                    name=FareClass.ECONOMY,
+                    first_row=business_rows + 1,
+                    last_row=airplane.rows,
+                ),
+            )
+
+        self.bulk_create(
+            FareClass,
+            [
+                fare_class
+                for airplane_classes in fare_classes.values()
+                for fare_class in airplane_classes
+            ]
+        )
+        fares = []
+
+        for flight in flights:
+            business, economy = fare_classes[flight.airplane.id]
+            economy_price = (
+                ECONOMY_BASE_PRICE
+                + ECONOMY_PRICE_PER_KM * flight.route.distance
+            ) * Decimal(self.random.uniform(0.7, 1.5))
+            economy_price = economy_price.quantize(Decimal("0.01"))
+            fares.extend([
+                Fare(
+                    flight=flight,
+                    fare_class=economy,
+                    price=economy_price,
+                ),
+                Fare(
+                    flight=flight,
+                    fare_class=business,
+                    price=economy_price * BUSINESS_PRICE_FACTOR,
+                ),
+            ])
+
+        return len(self.bulk_create(Fare, fares))
+
+    def create_users(self, count: int) -> list:
+        password = make_password(f"synthetic{self.seed}")
+        user_model = get_user_model()
+
+        return self.bulk_create(
+            user_model,
+            [
+                user_model(
+                    email=f"synthetic{self.seed}.{index}@example.com",
+                    password=password,
+                )
+                for index in range(count)
+            ]
+        )
+
+    def create_tickets(
+            self,
+            flights: list,
+            users: list,
+            load_factor: float
+    ) -> int:
+        """
+        Sell about load_factor of every flight,
+        seats are drawn without repeats and grouped into orders of 1-4
+        """
+        tickets_count = 0
+        pending_count = 0
+        orders = []
+        tickets = []
+
+        def flush():
+            created_orders = Order.objects.bulk_create(
+                [order for order, _ in orders], batch_size=self.batch_size
+            )
+
+            for order, order_tickets in zip(
+                created_orders, [order_tickets for _, order_tickets in orders]
+            ):
+                for ticket in order_tickets:
+                    ticket.order = order
+                    tickets.append(ticket)
+
+            Ticket.objects.bulk_create(tickets, batch_size=self.batch_size)
+            orders.clear()
+            tickets.clear()
+
+        for flight in flights:
+            airplane = flight.airplane
+            sold = min(
+                airplane.airplane_capacity,
+                max(0, round(
+                    airplane.airplane_capacity
+                    * load_factor
+                    * self.random.uniform(0.8, 1.2)
+                ))
+            )
+            places = self.numpy_random.choice(
+                airplane.airplane_capacity, sold, replace=False
+            ).tolist()
+
+            start = 0
+
+            while start < sold:
+                order_places = places[start:start + self.random.randint(1, 4)]
+                start += len(order_places)
+                orders.append((
+                    Order(user=self.random.choice(users)),
+                    [
+                        Ticket(
+                            row=place // airplane.seats_in_row + 1,
+                            seat=place % airplane.seats_in_row + 1,
+                            flight=flight,
+                        )
+                        for place in order_places
+                    ]
+                ))
+                tickets_count += len(order_places)
+                pending_count += len(order_places)
+
+            if pending_count >= self.batch_size:
+                flush()
+                pending_count = 0
+
+        flush()
+        self.log(f"tickets: {tickets_count}")
+
+        return tickets_count
+
+    def generate(
+            self,
+            countries: int,
+            cities: int,
+            airports: int,
+            routes: int,
+            airplanes: int,
+            flights_per_day: int,
+            days: int,
+            users: int,
+            load_factor: float,
+            crew: int = 0,
+            fares: bool = False
+    ) -> dict:
+        with transaction.atomic():
+            created_countries = self.create_countries(countries)
+            created_cities = self.create_cities(created_countries, cities)
+            created_airports = self.create_airports(created_cities, airports)
+            created_routes = self.create_routes(created_airports, routes)
+            created_airplanes = self.create_airplanes(airplanes)
+            created_flights = self.create_flights(
+                created_routes, created_airplanes, flights_per_day, days
+            )
+            created_crew = self.create_crew(crew)
+            crew_assignments = self.assign_crew(
+                created_flights, created_airplanes, created_crew
+            )
+            fares_count = (
+                self.create_fares(created_airplanes, created_flights)
+                if fares else 0
+            )
+            created_users = self.create_users(users)
+            tickets_count = self.create_tickets(
+                created_flights, created_users, load_factor
+            )
+
+        return {
+            "countries": len(created_countries),
+            "cities": len(created_cities),
+            "airports": len(created_airports),
+            "routes": len(created_routes),
+            "airplanes": len(created_airplanes),
+            "flights": len(created_flights),
+            "crew": len(created_crew),
+            "crew_assignments": crew_assignments,
+            "fares": fares_count,
+            "users": len(created_users),
+            "tickets": tickets_count,
+        }
+
+
+def get_dataset_size(tickets: int, load_factor: float) -> dict:
+    """Network scaled so it sells about the given number of tickets"""
+    average_capacity = sum(
+        rows * seats_in_row for _, rows, seats_in_row in AIRPLANE_MODELS
+    ) / len(AIRPLANE_MODELS)
+    flights = max(1, math.ceil(tickets / (average_capacity * load_factor)))
+    days = min(365, max(1, math.ceil(flights / 100)))
+    flights_per_day = math.ceil(flights / days)
+    airports = max(4, min(500, flights_per_day))
+    airplanes = math.ceil(flights_per_day / SLOTS_PER_AIRPLANE_DAY)
+
+    return {
+        "countries": max(1, min(50, airports // 10)),
+        "cities": max(2, airports // 2),
+        "airports": airports,
+        "routes": min(airports * (airports - 1), airports * 4),
+        "airplanes": airplanes,
+        "crew": airplanes * CREW_PER_FLIGHT,
+        "flights_per_day": flights_per_day,
+        "days": days,
+        "users": max(1, tickets // 20),
+        "load_factor": load_factor,
+    }
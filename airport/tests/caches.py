@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.test import override_settings
+
+
+def clear_caches():
+    """Forget the local and shared cache entries of previous tests"""
+    for cache in caches.all():
+        cache.clear()
+
+
+def as_other_worker():
+    """
+    Settings of another worker process of the deployment:
+    its own local memory cache, the same shared cache
+    """
+    return override_settings(CACHES={
+        **settings.CACHES,
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "other-worker",
+        },
+    })
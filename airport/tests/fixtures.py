@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from airport.models import (
+    Country,
+    City,
+    Airport,
+    Route,
+    AirplaneType,
+    Airplane,
+)
+
+
+def create_user(email: str = "user@user.com", **extra_fields):
+    return get_user_model().objects.create_user(
+        email, "user123456", **extra_fields
+    )
+
+
+def get_client(user) -> APIClient:
+    client = APIClient()
+    client.force_authenticate(user)
+
+    return client
+
+
+def get_jwt_client(user) -> APIClient:
+    """Client authenticated the way real requests are, with an access token"""
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=(
+            f"Bearer {RefreshToken.for_user(user).access_token}"
+        )
+    )
+
+    return client
+
+
+def create_airports(*city_names: str) -> list:
+    """A "TestAirport<city>" airport in a new Ukrainian city per name"""
+    country = Country.objects.get_or_create(name="Ukraine")[0]
+
+    return [
+        Airport.objects.create(
+            name=f"TestAirport{name}",
+            closest_big_city=City.objects.create(name=name, country=country),
+        )
+        for name in city_names
+    ]
+
+
+def create_route(source: Airport, destination: Airport) -> Route:
+    return Route.objects.create(
+        source=source, destination=destination, distance=500
+    )
+
+
+def create_airplane() -> Airplane:
+    """Airplane of 40 seats, 10 rows of 4"""
+    return Airplane.objects.create(
+        name="TestAirplane",
+        rows=10,
+        seats_in_row=4,
+        airplane_type=AirplaneType.objects.get_or_create(name="TestType")[0],
+    )
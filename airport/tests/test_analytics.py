@@ -0,0 +1,178 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.models import (
+    Country,
+    City,
+    Airport,
+    Route,
+    AirplaneType,
+    Airplane,
+    Flight,
+    FareClass,
+    Fare,
+    DailyRouteStats,
+)
+
+ORDER_URL = reverse("airport:order-list")
+LOAD_FACTOR_URL = reverse("airport:analytics-load-factor")
+REVENUE_URL = reverse("airport:analytics-revenue")
+
+
+class AnalyticsTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = get_user_model().objects.create_user(
+            email="admin@admin.com",
+            password="admin123456",
+            is_staff=True,
+        )
+        self.client.force_authenticate(self.admin)
+
+        country = Country.objects.create(name="Ukraine")
+        self.route = Route.objects.create(
+            source=Airport.objects.create(
+                name="TestAirportKyiv",
+                closest_big_city=City.objects.create(
+                    name="Kyiv", country=country
+                ),
+            ),
+            destination=Airport.objects.create(
+                name="TestAirportLviv",
+                closest_big_city=City.objects.create(
+                    name="Lviv", country=country
+                ),
+            ),
+            distance=500,
+        )
+        self.airplane = Airplane.objects.create(
+            name="TestAirplane",
+            rows=10,
+            seats_in_row=4,
+            airplane_type=AirplaneType.objects.create(name="TestType"),
+        )
+        business = FareClass.objects.create(
+            airplane=self.airplane,
+            name=FareClass.BUSINESS,
+            first_row=1,
+            last_row=2,
+        )
+        economy = FareClass.objects.create(
+            airplane=self.airplane,
+            name=FareClass.ECONOMY,
+            first_row=3,
+            last_row=10,
+        )
+
+        self.day = timezone.localdate() + timedelta(days=3)
+        departure_time = timezone.now() + timedelta(days=3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.flight = Flight.objects.create(
+                route=self.route,
+                airplane=self.airplane,
+                departure_time=departure_time,
+                arrival_time=departure_time + timedelta(hours=2),
+            )
+            Fare.objects.create(
+                flight=self.flight, fare_class=business, price=300
+            )
+            Fare.objects.create(
+                flight=self.flight, fare_class=economy, price=100
+            )
+
+    def buy_tickets(self, *rows):
+        request = self.client.post(
+            ORDER_URL,
+            {
+                "tickets": [
+                    {"row": row, "seat": 1, "flight": self.flight.id}
+                    for row in rows
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_201_CREATED)
+
+    def get_stats(self, url: str, group_by: str = "route") -> list:
+        request = self.client.get(
+            url,
+            {
+                "date_from": f"{self.day}",
+                "date_to": f"{self.day}",
+                "group_by": group_by,
+            }
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+
+        return request.data
+
+    def test_order_updates_rollups(self):
+        self.buy_tickets(1, 5)
+
+        self.assertEqual(
+            self.get_stats(LOAD_FACTOR_URL),
+            [{
+                "route_id": self.route.id,
+                "flights": 1,
+                "seats": 40,
+                "tickets_sold": 2,
+                "load_factor": 0.05,
+            }]
+        )
+        self.assertEqual(
+            self.get_stats(REVENUE_URL, group_by="date"),
+            [{
+                "date": self.day,
+                "tickets_sold": 2,
+                "revenue": Decimal("400.00"),
+                "average_fare": Decimal("200.00"),
+            }]
+        )
+
+    def test_order_creates_missing_rollup(self):
+        DailyRouteStats.objects.all().delete()
+
+        self.buy_tickets(3)
+
+        stats = DailyRouteStats.objects.get()
+        self.assertEqual((stats.seats, stats.tickets_sold), (40, 1))
+        self.assertEqual(stats.revenue, Decimal("100.00"))
+
+    def test_refresh_route_stats_matches_incremental(self):
+        self.buy_tickets(1, 2, 7)
+        incremental = self.get_stats(REVENUE_URL, group_by="airplane_type")
+
+        DailyRouteStats.objects.all().delete()
+        call_command("refresh_route_stats", stdout=StringIO())
+
+        self.assertEqual(
+            self.get_stats(REVENUE_URL, group_by="airplane_type"),
+            incremental
+        )
+
+    def test_analytics_is_admin_only(self):
+        self.client.force_authenticate(
+            get_user_model().objects.create_user(
+                "user@user.com",
+                "user123456",
+            )
+        )
+
+        request = self.client.get(
+            LOAD_FACTOR_URL,
+            {"date_from": f"{self.day}", "date_to": f"{self.day}"}
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_403_FORBIDDEN)
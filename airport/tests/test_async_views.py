@@ -0,0 +1,161 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from airport.models import Crew, Flight, Order, Ticket
+from airport.tests.caches import clear_caches
+from airport.tests.fixtures import (
+    create_user,
+    get_jwt_client,
+    create_airports,
+    create_route,
+    create_airplane,
+)
+
+FLIGHT_URL = reverse("airport:flight-list")
+ASYNC_FLIGHT_URL = reverse("airport:async-flight-search")
+
+
+def flight_detail_url(flight_id: int, prefix: str = "") -> str:
+    return reverse(f"airport:{prefix}flight-detail", args=[flight_id])
+
+
+class AsyncFlightViewsTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.user = create_user()
+        self.client = get_jwt_client(self.user)
+
+        route = create_route(*create_airports("Kyiv", "Lviv"))
+        self.cities = [
+            route.source.closest_big_city,
+            route.destination.closest_big_city,
+        ]
+        airplane = create_airplane()
+        crew = [
+            Crew.objects.create(first_name="Amelia", last_name="Grant"),
+            Crew.objects.create(first_name="Olena", last_name="Bondar"),
+        ]
+        self.day = (timezone.now() + timedelta(days=2)).date()
+        departure_time = timezone.now().replace(
+            hour=6, minute=0, second=0, microsecond=0
+        ) + timedelta(days=2)
+        self.flights = []
+
+        for index in range(3):
+            flight = Flight.objects.create(
+                route=route,
+                airplane=airplane,
+                departure_time=departure_time + timedelta(hours=4 * index),
+                arrival_time=(
+                    departure_time + timedelta(hours=4 * index + index + 1)
+                ),
+            )
+            flight.crew.set(crew[:index])
+            self.flights.append(flight)
+
+        order = Order.objects.create(user=self.user)
+
+        for row, seat in ((1, 1), (2, 3)):
+            Ticket.objects.create(
+                row=row, seat=seat, flight=self.flights[0], order=order
+            )
+
+    def search(self, url: str, **params) -> dict:
+        request = self.client.get(
+            url,
+            {
+                "from": self.cities[0].id,
+                "to": self.cities[1].id,
+                "departure_date": f"{self.day}",
+                **params,
+            }
+        )
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+        clear_caches()
+
+        return request.json()
+
+    def test_search_matches_flight_view(self):
+        for params in ({}, {"page_size": 2}, {"ordering": "-duration"}):
+            found = self.search(ASYNC_FLIGHT_URL, **params)
+            expected = self.search(FLIGHT_URL, **params)
+
+            self.assertEqual(found["count"], expected["count"])
+            self.assertEqual(found["results"], expected["results"])
+
+    def test_search_reads_current_availability(self):
+        self.search(ASYNC_FLIGHT_URL)
+        order = Order.objects.create(user=self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Ticket.objects.create(
+                row=5, seat=1, flight=self.flights[1], order=order
+            )
+
+        request = self.client.get(
+            ASYNC_FLIGHT_URL,
+            {
+                "from": self.cities[0].id,
+                "to": self.cities[1].id,
+                "departure_date": f"{self.day}",
+            }
+        )
+
+        self.assertEqual(
+            [
+                flight["tickets_available"]
+                for flight in request.json()["results"]
+            ],
+            [38, 39]
+        )
+
+    def test_detail_matches_flight_view(self):
+        for flight in self.flights:
+            found = self.client.get(flight_detail_url(flight.id, "async-"))
+            expected = self.client.get(flight_detail_url(flight.id))
+
+            self.assertEqual(found.status_code, status.HTTP_200_OK)
+            self.assertEqual(found.json(), expected.json())
+
+    def test_search_shares_flight_view_limit(self):
+        params = {
+            "from": self.cities[0].id,
+            "to": self.cities[1].id,
+            "departure_date": f"{self.day}",
+        }
+
+        for url in (FLIGHT_URL, ASYNC_FLIGHT_URL) * 10:
+            self.assertEqual(
+                self.client.get(url, params).status_code, status.HTTP_200_OK
+            )
+
+        for url in (ASYNC_FLIGHT_URL, FLIGHT_URL):
+            request = self.client.get(url, params)
+
+            self.assertEqual(
+                request.status_code, status.HTTP_429_TOO_MANY_REQUESTS
+            )
+            self.assertIn("Retry-After", request.headers)
+
+    def test_errors(self):
+        self.assertEqual(
+            self.client.get(flight_detail_url(0, "async-")).status_code,
+            status.HTTP_404_NOT_FOUND
+        )
+        self.assertEqual(
+            self.client.get(ASYNC_FLIGHT_URL, {"from": 1}).status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+
+        self.client.credentials()
+
+        self.assertEqual(
+            self.client.get(flight_detail_url(1, "async-")).status_code,
+            status.HTTP_401_UNAUTHORIZED
+        )
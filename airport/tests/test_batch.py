@@ -0,0 +1,180 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from airport.batch import BATCH_MAX_IDS
+from airport.models import Route, Crew, Flight, Order, Ticket
+from airport.tests.caches import clear_caches
+from airport.tests.fixtures import (
+    create_user,
+    get_jwt_client,
+    create_airports,
+    create_airplane,
+)
+from airport.views import FlightView
+
+FLIGHT_BATCH_URL = reverse("airport:flight-batch")
+AIRPORT_BATCH_URL = reverse("airport:airport-batch")
+BATCH_URL = reverse("airport:batch")
+
+
+def flight_detail_url(flight_id: int) -> str:
+    return reverse("airport:flight-detail", args=[flight_id])
+
+
+class BatchApiTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.user = create_user()
+        self.client = get_jwt_client(self.user)
+
+        self.airports = create_airports("Kyiv", "Lviv", "Odesa")
+        airplane = create_airplane()
+        crew = Crew.objects.create(first_name="Amelia", last_name="Grant")
+        departure_time = timezone.now() + timedelta(days=2)
+        order = Order.objects.create(user=self.user)
+        self.flights = []
+
+        for index, destination in enumerate(self.airports[1:] * 2):
+            flight = Flight.objects.create(
+                route=Route.objects.get_or_create(
+                    source=self.airports[0],
+                    destination=destination,
+                    defaults={"distance": 500},
+                )[0],
+                airplane=airplane,
+                departure_time=departure_time + timedelta(hours=4 * index),
+                arrival_time=departure_time + timedelta(hours=4 * index + 2),
+            )
+            flight.crew.add(crew)
+            Ticket.objects.create(
+                row=1, seat=index + 1, flight=flight, order=order
+            )
+            self.flights.append(flight)
+
+    def get_ids(self, objects: list) -> str:
+        return ",".join(str(obj.id) for obj in objects)
+
+    def test_flight_batch_matches_retrieve_in_order(self):
+        flights = [self.flights[2], self.flights[0], self.flights[3]]
+
+        request = self.client.get(
+            FLIGHT_BATCH_URL, {"ids": self.get_ids(flights)}
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            request.json(),
+            [
+                self.client.get(flight_detail_url(flight.id)).json()
+                for flight in flights
+            ]
+        )
+
+    def test_flight_batch_queries_do_not_grow_with_ids(self):
+        self.client.get(FLIGHT_BATCH_URL, {"ids": self.flights[0].id})
+
+        with self.assertNumQueries(3):
+            self.client.get(
+                FLIGHT_BATCH_URL, {"ids": self.get_ids(self.flights[:1])}
+            )
+
+        with self.assertNumQueries(3):
+            self.client.get(
+                FLIGHT_BATCH_URL, {"ids": self.get_ids(self.flights)}
+            )
+
+    def test_airport_batch_skips_missing_ids(self):
+        request = self.client.get(
+            AIRPORT_BATCH_URL,
+            {"ids": f"{self.airports[1].id},0,{self.airports[0].id}"}
+        )
+
+        self.assertEqual(
+            [airport["id"] for airport in request.json()],
+            [self.airports[1].id, self.airports[0].id]
+        )
+
+    def test_batch_ids_are_validated(self):
+        too_many = ",".join(str(pk) for pk in range(BATCH_MAX_IDS + 1))
+
+        for ids in ("", "1,x", too_many):
+            request = self.client.get(FLIGHT_BATCH_URL, {"ids": ids})
+
+            self.assertEqual(
+                request.status_code, status.HTTP_400_BAD_REQUEST
+            )
+
+    def test_batch_requests(self):
+        urls = [
+            flight_detail_url(self.flights[1].id),
+            f"{AIRPORT_BATCH_URL}?ids={self.airports[2].id}",
+            flight_detail_url(0),
+            "/api/v1/unknown/",
+            BATCH_URL,
+        ]
+
+        request = self.client.post(
+            BATCH_URL, {"requests": urls}, format="json"
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(result["url"], result["status"]) for result in request.json()],
+            list(zip(urls, [200, 200, 404, 404, 404]))
+        )
+        self.assertEqual(
+            request.json()[0]["body"],
+            self.client.get(flight_detail_url(self.flights[1].id)).json()
+        )
+        self.assertEqual(
+            request.json()[1]["body"][0]["id"], self.airports[2].id
+        )
+
+    def test_batch_skips_non_api_urls(self):
+        urls = ["/admin/", reverse("schema"), reverse("swagger-ui")]
+
+        request = self.client.post(
+            BATCH_URL, {"requests": urls}, format="json"
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(result["status"], result["body"]) for result in request.json()],
+            [(404, {"detail": "Not found."})] * len(urls)
+        )
+
+    def test_batch_request_error_fails_only_its_response(self):
+        urls = [
+            flight_detail_url(self.flights[0].id),
+            f"{AIRPORT_BATCH_URL}?ids={self.airports[0].id}",
+        ]
+
+        with mock.patch.object(
+            FlightView, "retrieve", side_effect=RuntimeError
+        ), self.assertLogs("airport.batch", "ERROR"):
+            request = self.client.post(
+                BATCH_URL, {"requests": urls}, format="json"
+            )
+
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["status"] for result in request.json()], [500, 200]
+        )
+
+    def test_batch_requires_authentication(self):
+        self.client.credentials()
+
+        request = self.client.post(
+            BATCH_URL,
+            {"requests": [flight_detail_url(self.flights[0].id)]},
+            format="json"
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_401_UNAUTHORIZED)
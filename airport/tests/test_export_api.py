@@ -0,0 +1,117 @@
+import json
+from datetime import datetime, timedelta
+
+from django.urls import reverse
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+
+from airport.models import Flight, Order, Ticket
+from airport.tests.fixtures import (
+    create_user,
+    get_client,
+    create_airports,
+    create_route,
+    create_airplane,
+)
+
+TICKET_EXPORT_URL = reverse("airport:ticket-export")
+ORDER_EXPORT_URL = reverse("airport:order-export")
+
+
+def read_stream(response):
+    return b"".join(response.streaming_content).decode()
+
+
+class ExportApiTests(TestCase):
+    def setUp(self):
+        self.admin = create_user("admin@admin.com", is_staff=True)
+        self.client = get_client(self.admin)
+
+        route = create_route(*create_airports("Kyiv", "Lviv"))
+        airplane = create_airplane()
+        departure_time = datetime.now(tz=timezone.utc) + timedelta(days=1)
+        self.flight = Flight.objects.create(
+            route=route,
+            airplane=airplane,
+            departure_time=departure_time,
+            arrival_time=departure_time + timedelta(hours=1),
+        )
+
+        self.order = Order.objects.create(user=self.admin)
+
+        for seat in range(1, 4):
+            Ticket.objects.create(
+                row=1, seat=seat, flight=self.flight, order=self.order
+            )
+
+    def test_export_tickets_csv(self):
+        response = self.client.get(
+            TICKET_EXPORT_URL, {"flights": self.flight.id}
+        )
+
+        lines = read_stream(response).splitlines()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(
+            lines[0].split(",")[:4], ["id", "flight", "row", "seat"]
+        )
+        self.assertEqual(len(lines), 4)
+
+    def test_export_tickets_ndjson(self):
+        response = self.client.get(
+            TICKET_EXPORT_URL,
+            {"flights": self.flight.id, "export_format": "ndjson"}
+        )
+
+        rows = [
+            json.loads(line)
+            for line in read_stream(response).splitlines()
+        ]
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual([row["seat"] for row in rows], [1, 2, 3])
+        self.assertEqual(rows[0]["user"], self.admin.email)
+
+    def test_export_tickets_requires_flights(self):
+        response = self.client.get(TICKET_EXPORT_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_unknown_format(self):
+        response = self.client.get(
+            TICKET_EXPORT_URL,
+            {"flights": self.flight.id, "export_format": "xml"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_orders_by_date_range(self):
+        today = timezone.now().date()
+
+        response = self.client.get(
+            ORDER_EXPORT_URL,
+            {
+                "date_from": f"{today}",
+                "date_to": f"{today}",
+                "export_format": "ndjson",
+            }
+        )
+
+        rows = [
+            json.loads(line)
+            for line in read_stream(response).splitlines()
+        ]
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["tickets"], 3)
+
+    def test_export_forbidden_for_user(self):
+        self.client.force_authenticate(create_user())
+
+        response = self.client.get(
+            TICKET_EXPORT_URL, {"flights": self.flight.id}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,181 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.models import (
+    Country,
+    City,
+    Airport,
+    Route,
+    AirplaneType,
+    Airplane,
+    Flight,
+    FareClass,
+    Fare,
+    DailyLowestFare,
+)
+
+FARE_CLASS_URL = reverse("airport:fareclass-list")
+FARE_URL = reverse("airport:fare-list")
+FARE_CALENDAR_URL = reverse("airport:flight-fare-calendar")
+
+
+class FareTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = get_user_model().objects.create_user(
+            email="admin@admin.com",
+            password="admin123456",
+            is_staff=True,
+        )
+        self.client.force_authenticate(self.admin)
+
+        country = Country.objects.create(name="Ukraine")
+        self.cities = [
+            City.objects.create(name=name, country=country)
+            for name in ("Kyiv", "Lviv")
+        ]
+        route = Route.objects.create(
+            source=Airport.objects.create(
+                name="TestAirportKyiv", closest_big_city=self.cities[0]
+            ),
+            destination=Airport.objects.create(
+                name="TestAirportLviv", closest_big_city=self.cities[1]
+            ),
+            distance=500,
+        )
+        airplane_type = AirplaneType.objects.create(name="TestType")
+        self.airplanes = [
+            Airplane.objects.create(
+                name=f"TestAirplane {letter}",
+                rows=10,
+                seats_in_row=4,
+                airplane_type=airplane_type,
+            )
+            for letter in "ab"
+        ]
+        self.fare_classes = [
+            FareClass.objects.create(
+                airplane=airplane,
+                name=FareClass.ECONOMY,
+                first_row=3,
+                last_row=10,
+            )
+            for airplane in self.airplanes
+        ]
+
+        self.day = timezone.localdate() + timedelta(days=3)
+        departure_time = timezone.now() + timedelta(days=3)
+        self.flights = [
+            Flight.objects.create(
+                route=route,
+                airplane=airplane,
+                departure_time=departure_time,
+                arrival_time=departure_time + timedelta(hours=2),
+            )
+            for airplane in self.airplanes
+        ]
+
+    def create_fare(self, flight_index: int, price: str) -> Fare:
+        with self.captureOnCommitCallbacks(execute=True):
+            return Fare.objects.create(
+                flight=self.flights[flight_index],
+                fare_class=self.fare_classes[flight_index],
+                price=Decimal(price),
+            )
+
+    def get_calendar(self, to_city=None) -> list:
+        to_city = to_city or self.cities[1]
+        request = self.client.get(
+            FARE_CALENDAR_URL,
+            {"from": self.cities[0].id, "to": to_city.id}
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+
+        return [(day["date"], day["price"]) for day in request.data]
+
+    def test_fare_class_rows_should_not_overlap(self):
+        request = self.client.post(
+            FARE_CLASS_URL,
+            {
+                "airplane": self.airplanes[0].id,
+                "name": FareClass.BUSINESS,
+                "first_row": 1,
+                "last_row": 3,
+            }
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_fare_class_should_belong_to_flight_airplane(self):
+        request = self.client.post(
+            FARE_URL,
+            {
+                "flight": self.flights[0].id,
+                "fare_class": self.fare_classes[1].id,
+                "price": "100.00",
+            }
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_calendar_keeps_lowest_fare_of_the_day(self):
+        self.create_fare(0, "120.00")
+        cheapest = self.create_fare(1, "80.00")
+
+        self.assertEqual(self.get_calendar(), [(self.day, Decimal("80.00"))])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            cheapest.delete()
+
+        self.assertEqual(
+            self.get_calendar(), [(self.day, Decimal("120.00"))]
+        )
+
+    def test_calendar_follows_flight_departure(self):
+        self.create_fare(0, "120.00")
+        flight = self.flights[0]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            flight.departure_time += timedelta(days=1)
+            flight.arrival_time += timedelta(days=1)
+            flight.save()
+
+        self.assertEqual(
+            self.get_calendar(),
+            [(self.day + timedelta(days=1), Decimal("120.00"))]
+        )
+
+    def test_calendar_follows_airport_city(self):
+        self.create_fare(0, "120.00")
+        odesa = City.objects.create(
+            name="Odesa", country=self.cities[1].country
+        )
+        airport = self.flights[0].route.destination
+        airport.closest_big_city = odesa
+
+        with self.captureOnCommitCallbacks(execute=True):
+            airport.save()
+
+        self.assertEqual(self.get_calendar(), [])
+        self.assertEqual(
+            self.get_calendar(odesa), [(self.day, Decimal("120.00"))]
+        )
+
+    def test_refresh_lowest_fares_rebuilds_table(self):
+        self.create_fare(0, "120.00")
+        self.create_fare(1, "80.00")
+        DailyLowestFare.objects.all().delete()
+
+        call_command("refresh_lowest_fares", stdout=StringIO())
+
+        self.assertEqual(self.get_calendar(), [(self.day, Decimal("80.00"))])
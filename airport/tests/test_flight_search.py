@@ -0,0 +1,164 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+
+from airport.models import Flight, Order, Ticket
+from airport.schedules import create_scheduled_flights
+from airport.tests.caches import as_other_worker, clear_caches
+from airport.tests.fixtures import (
+    create_user,
+    get_client,
+    create_airports,
+    create_route,
+    create_airplane,
+)
+
+FLIGHT_URL = reverse("airport:flight-list")
+
+
+class FlightSearchCacheTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.user = create_user()
+        self.client = get_client(self.user)
+
+        self.route = create_route(*create_airports("Kyiv", "Lviv"))
+        self.cities = [
+            self.route.source.closest_big_city,
+            self.route.destination.closest_big_city,
+        ]
+        self.airplane = create_airplane()
+        self.departure_time = timezone.now().replace(
+            hour=8, minute=0, second=0, microsecond=0
+        ) + timedelta(days=2)
+        self.flight = Flight.objects.create(
+            route=self.route,
+            airplane=self.airplane,
+            departure_time=self.departure_time,
+            arrival_time=self.departure_time + timedelta(hours=2),
+        )
+
+    def search(self, day=None, to_city=None):
+        day = day or self.departure_time.date()
+        to_city = to_city or self.cities[1]
+        request = self.client.get(
+            FLIGHT_URL,
+            {
+                "from": self.cities[0].id,
+                "to": to_city.id,
+                "departure_date": f"{day}",
+            }
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+
+        return request.data["results"]
+
+    def test_repeated_search_does_not_hit_database(self):
+        flights = self.search()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.search(), flights)
+
+        self.assertEqual(flights[0]["id"], self.flight.id)
+        self.assertEqual(flights[0]["tickets_available"], 40)
+
+    def test_ticket_purchase_updates_availability(self):
+        self.search()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Ticket.objects.create(
+                row=1,
+                seat=1,
+                flight=self.flight,
+                order=Order.objects.create(user=self.user),
+            )
+
+        with self.assertNumQueries(0):
+            flights = self.search()
+
+        self.assertEqual(flights[0]["tickets_available"], 39)
+
+    def test_other_worker_purchase_updates_availability(self):
+        self.search()
+
+        with as_other_worker(), self.captureOnCommitCallbacks(execute=True):
+            Ticket.objects.create(
+                row=1,
+                seat=1,
+                flight=self.flight,
+                order=Order.objects.create(user=self.user),
+            )
+
+        self.assertEqual(self.search()[0]["tickets_available"], 39)
+
+    def test_other_worker_flight_update_drops_search(self):
+        self.search()
+
+        with as_other_worker(), self.captureOnCommitCallbacks(execute=True):
+            self.flight.departure_time += timedelta(days=1)
+            self.flight.arrival_time += timedelta(days=1)
+            self.flight.save()
+
+        self.assertEqual(self.search(), [])
+
+    def test_flight_update_drops_old_and_new_search(self):
+        next_day = self.departure_time.date() + timedelta(days=1)
+        self.search()
+        self.search(next_day)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.flight.departure_time += timedelta(days=1)
+            self.flight.arrival_time += timedelta(days=1)
+            self.flight.save()
+
+        self.assertEqual(self.search(), [])
+        self.assertEqual(self.search(next_day)[0]["id"], self.flight.id)
+
+    def test_route_update_drops_old_and_new_search(self):
+        airport = create_airports("Odesa")[0]
+        odesa = airport.closest_big_city
+        self.search()
+        self.search(to_city=odesa)
+        self.route.destination = airport
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.route.save()
+
+        self.assertEqual(self.search(), [])
+        self.assertEqual(
+            [flight["id"] for flight in self.search(to_city=odesa)],
+            [self.flight.id]
+        )
+
+    def test_city_rename_drops_search(self):
+        self.search()
+        self.cities[1].name = "Lemberg"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cities[1].save()
+
+        self.assertEqual(self.search()[0]["route"], "Kyiv - Lemberg")
+
+    def test_scheduled_flights_drop_search(self):
+        self.search()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_scheduled_flights(
+                route=self.route,
+                airplane=self.airplane,
+                weekdays=[self.departure_time.isoweekday()],
+                departure_time=(
+                    self.departure_time + timedelta(hours=4)
+                ).time(),
+                duration=timedelta(hours=2),
+                date_from=self.departure_time.date(),
+                date_to=self.departure_time.date(),
+            )
+
+        self.assertEqual(len(self.search()), 2)
@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
+from io import StringIO
 
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.urls import reverse
 from django.test import TestCase
 from django.utils import timezone
@@ -24,6 +26,8 @@ from airport.serializers import (
 )
 
 FLIGHT_URL = reverse("airport:flight-list")
+AIRPLANE_URL = reverse("airport:airplane-list")
+SCHEDULE_URL = reverse("airport:flight-schedule")
 
 
 def detail_url(flight_id):
@@ -98,13 +102,20 @@ class AuthenticatedFlightApiTests(TestCase):
             for letter in "abcde"
         ]
 
+        self.second_airplane = Airplane.objects.create(
+            name="SecondTestAirplane",
+            rows=30,
+            seats_in_row=6,
+            airplane_type=self.airplane_type
+        )
+
         self.departure_time_list = [
             datetime.now(tz=timezone.utc) + timedelta(hours=2),
-            datetime.now(tz=timezone.utc) + timedelta(hours=3),
+            datetime.now(tz=timezone.utc) + timedelta(hours=7),
         ]
         self.arrival_time_list = [
             datetime.now(tz=timezone.utc) + timedelta(hours=6),
-            datetime.now(tz=timezone.utc) + timedelta(hours=7),
+            datetime.now(tz=timezone.utc) + timedelta(hours=11),
         ]
 
         flights = [
@@ -205,7 +216,7 @@ class AuthenticatedFlightApiTests(TestCase):
 
         Flight.objects.create(
             route=self.route,
-            airplane=self.airplane,
+            airplane=self.second_airplane,
             departure_time=self.departure_time_list[0],
             arrival_time=self.arrival_time_list[0],
         )
@@ -249,7 +260,7 @@ class AuthenticatedFlightApiTests(TestCase):
 
         Flight.objects.create(
             route=self.route,
-            airplane=self.airplane,
+            airplane=self.second_airplane,
             departure_time=self.departure_time_list[0],
             arrival_time=self.arrival_time_list[0],
         )
@@ -302,6 +313,46 @@ class AuthenticatedFlightApiTests(TestCase):
                 request.data["crew"][i]
             ),
 
+    def test_order_flights_by_duration(self):
+        Flight.objects.create(
+            route=self.route,
+            airplane=self.second_airplane,
+            departure_time=self.departure_time_list[0],
+            arrival_time=self.departure_time_list[0] + timedelta(hours=1),
+        )
+
+        request = self.client.get(FLIGHT_URL, {"ordering": "duration"})
+        reversed_request = self.client.get(
+            FLIGHT_URL, {"ordering": "-duration"}
+        )
+
+        self.assertEqual(request.data["results"][0]["flight_duration"], 1)
+        self.assertEqual(request.data["count"], 3)
+        self.assertAlmostEqual(
+            reversed_request.data["results"][0]["flight_duration"], 4,
+            places=3
+        )
+
+    def test_filter_airplanes_by_capacity(self):
+        for params, airplane in (
+            ({"capacity_min": 200}, self.airplane),
+            ({"capacity_max": 200}, self.second_airplane),
+            ({"capacity": 180}, self.second_airplane),
+        ):
+            request = self.client.get(AIRPLANE_URL, params)
+
+            self.assertEqual(
+                [item["id"] for item in request.data["results"]],
+                [airplane.id]
+            )
+
+        for params in ({"capacity_min": "x"}, {"capacity_max": -1}):
+            request = self.client.get(AIRPLANE_URL, params)
+
+            self.assertEqual(
+                request.status_code, status.HTTP_400_BAD_REQUEST
+            )
+
     def test_create_flight_forbidden(self):
         payload = {
             "route": self.route,
@@ -465,3 +516,147 @@ class AdminApiTests(TestCase):
             request.status_code,
             status.HTTP_405_METHOD_NOT_ALLOWED
         )
+
+    def test_create_flight_schedule(self):
+        date_from = (timezone.now() + timedelta(days=1)).date()
+        date_to = date_from + timedelta(days=13)
+        payload = {
+            "route": self.route.id,
+            "airplane": self.airplane.id,
+            "weekdays": [1, 3, 5],
+            "departure_time": "08:30",
+            "duration": "02:15:00",
+            "date_from": f"{date_from}",
+            "date_to": f"{date_to}",
+        }
+
+        request = self.client.post(SCHEDULE_URL, payload, format="json")
+        repeated_request = self.client.post(
+            SCHEDULE_URL, payload, format="json"
+        )
+
+        flights = Flight.objects.filter(route=self.route)
+
+        self.assertEqual(request.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(request.data["created"], 6)
+        self.assertEqual(repeated_request.data["created"], 0)
+        self.assertEqual(repeated_request.data["skipped"], 6)
+        self.assertEqual(flights.count(), 6)
+
+        for flight in flights:
+            self.assertIn(flight.departure_time.isoweekday(), [1, 3, 5])
+            self.assertEqual(
+                flight.arrival_time - flight.departure_time,
+                timedelta(hours=2, minutes=15)
+            )
+
+    def test_create_flight_schedule_invalid_weekdays(self):
+        date_from = (timezone.now() + timedelta(days=1)).date()
+        payload = {
+            "route": self.route.id,
+            "airplane": self.airplane.id,
+            "weekdays": [0, 8],
+            "departure_time": "08:30",
+            "duration": "02:15:00",
+            "date_from": f"{date_from}",
+            "date_to": f"{date_from + timedelta(days=7)}",
+        }
+
+        request = self.client.post(SCHEDULE_URL, payload, format="json")
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Flight.objects.exists())
+
+    def test_create_flight_airplane_conflict(self):
+        flight = Flight.objects.create(
+            route=self.route,
+            airplane=self.airplane,
+            departure_time=self.departure_time,
+            arrival_time=self.arrival_time,
+        )
+        payload = {
+            "route": self.route.id,
+            "airplane": self.airplane.id,
+            "departure_time": self.departure_time + timedelta(hours=1),
+            "arrival_time": self.arrival_time + timedelta(hours=1),
+        }
+
+        request = self.client.post(FLIGHT_URL, payload)
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(str(flight.id), str(request.data["airplane"]))
+
+    def test_create_flight_crew_conflict(self):
+        airplane = Airplane.objects.create(
+            name="OtherTestAirplane",
+            rows=30,
+            seats_in_row=6,
+            airplane_type=self.airplane_type
+        )
+        flight = Flight.objects.create(
+            route=self.route,
+            airplane=airplane,
+            departure_time=self.departure_time,
+            arrival_time=self.arrival_time,
+        )
+        flight.crew.add(self.crew[0])
+        payload = {
+            "route": self.route.id,
+            "airplane": self.airplane.id,
+            "departure_time": self.departure_time + timedelta(hours=1),
+            "arrival_time": self.arrival_time + timedelta(hours=1),
+            "crew": [self.crew[0].id, self.crew[1].id],
+        }
+
+        request = self.client.post(FLIGHT_URL, payload)
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(request.data["crew"]), 1)
+
+    def test_create_flight_right_after_previous_flight(self):
+        Flight.objects.create(
+            route=self.route,
+            airplane=self.airplane,
+            departure_time=self.departure_time,
+            arrival_time=self.arrival_time,
+        )
+        payload = {
+            "route": self.route.id,
+            "airplane": self.airplane.id,
+            "departure_time": self.arrival_time,
+            "arrival_time": self.arrival_time + timedelta(hours=3),
+        }
+
+        request = self.client.post(FLIGHT_URL, payload)
+
+        self.assertEqual(request.status_code, status.HTTP_201_CREATED)
+
+    def test_audit_flight_conflicts(self):
+        airplane = Airplane.objects.create(
+            name="OtherTestAirplane",
+            rows=30,
+            seats_in_row=6,
+            airplane_type=self.airplane_type
+        )
+        flights = [
+            Flight.objects.create(
+                route=self.route,
+                airplane=flight_airplane,
+                departure_time=self.departure_time,
+                arrival_time=self.arrival_time,
+            )
+            for flight_airplane in (self.airplane, airplane)
+        ]
+
+        for flight in flights:
+            flight.crew.add(self.crew[0])
+
+        out = StringIO()
+        call_command("audit_flight_conflicts", stdout=out)
+
+        self.assertIn(
+            f"Crew member {self.crew[0].id}: "
+            f"flights {flights[0].id} and {flights[1].id} overlap",
+            out.getvalue()
+        )
+        self.assertIn("Found 1 conflicts", out.getvalue())
@@ -0,0 +1,291 @@
+import random
+from datetime import timedelta
+from io import StringIO
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.geo import great_circle_distance, great_circle_distances
+from airport.models import (
+    Country,
+    City,
+    Airport,
+    Route,
+    AirplaneType,
+    Airplane,
+    Flight,
+)
+from airport.spatial import AirportIndex
+from airport.tests.caches import as_other_worker, clear_caches
+
+NEAREST_URL = reverse("airport:airport-nearest")
+FLIGHT_URL = reverse("airport:flight-list")
+
+KYIV = (50.345, 30.8947)
+ROME = (41.8003, 12.2389)
+LVIV = (49.8125, 23.9561)
+
+
+class GreatCircleDistanceTests(TestCase):
+    def test_distance_between_airports(self):
+        distance = great_circle_distance(*KYIV, *ROME)
+
+        self.assertAlmostEqual(distance, 1717, delta=5)
+
+    def test_vectorized_distances_match_scalar(self):
+        generator = random.Random(28)
+        points = [
+            (
+                generator.uniform(-90, 90),
+                generator.uniform(-180, 180),
+                generator.uniform(-90, 90),
+                generator.uniform(-180, 180),
+            )
+            for _ in range(100)
+        ]
+
+        distances = great_circle_distances(*np.array(points).T)
+
+        for point, distance in zip(points, distances):
+            self.assertAlmostEqual(
+                great_circle_distance(*point), distance, places=6
+            )
+
+    def test_index_nearest_matches_brute_force(self):
+        generator = random.Random(28)
+        airports = [
+            (
+                airport_id,
+                generator.uniform(-90, 90),
+                generator.uniform(-180, 180)
+            )
+            for airport_id in range(500)
+        ]
+        index = AirportIndex(airports)
+
+        for _ in range(20):
+            latitude = generator.uniform(-90, 90)
+            longitude = generator.uniform(-180, 180)
+            expected = sorted(
+                airports,
+                key=lambda airport: great_circle_distance(
+                    latitude, longitude, airport[1], airport[2]
+                )
+            )[:5]
+
+            nearest = index.nearest(latitude, longitude, 5)
+
+            self.assertEqual(
+                [airport_id for airport_id, _ in nearest],
+                [airport[0] for airport in expected]
+            )
+
+            radius = nearest[-1][1] + 100
+            within = index.within(latitude, longitude, radius)
+
+            self.assertEqual(
+                sorted(within),
+                sorted(
+                    airport[0]
+                    for airport in airports
+                    if great_circle_distance(
+                        latitude, longitude, airport[1], airport[2]
+                    ) <= radius
+                )
+            )
+
+
+class AirportCoordinatesTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            "user@user.com",
+            "user123456",
+        )
+        self.client.force_authenticate(self.user)
+
+        country = Country.objects.create(name="Ukraine")
+        self.airports = [
+            Airport.objects.create(
+                name=f"TestAirport{name}",
+                closest_big_city=City.objects.create(
+                    name=name, country=country
+                ),
+                latitude=coordinates[0],
+                longitude=coordinates[1],
+            )
+            for name, coordinates in (
+                ("Kyiv", KYIV), ("Rome", ROME), ("Lviv", LVIV)
+            )
+        ]
+
+    def test_route_distance_is_computed_on_save(self):
+        route = Route.objects.create(
+            source=self.airports[0],
+            destination=self.airports[1],
+            distance=1,
+        )
+
+        self.assertEqual(
+            route.distance, round(great_circle_distance(*KYIV, *ROME))
+        )
+
+    def test_recompute_route_distances(self):
+        route = Route.objects.create(
+            source=self.airports[0],
+            destination=self.airports[2],
+        )
+        Route.objects.filter(id=route.id).update(distance=1)
+
+        call_command("recompute_route_distances", stdout=StringIO())
+        route.refresh_from_db()
+
+        self.assertEqual(
+            route.distance, round(great_circle_distance(*KYIV, *LVIV))
+        )
+
+    def test_nearest_airports(self):
+        request = self.client.get(
+            NEAREST_URL, {"lat": 50.45, "lon": 30.52, "limit": 2}
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [airport["id"] for airport in request.data],
+            [self.airports[0].id, self.airports[2].id]
+        )
+
+    def test_nearest_airports_refreshed_on_airport_write(self):
+        self.client.get(NEAREST_URL, {"lat": 41.9, "lon": 12.5})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.airports[1].delete()
+
+        request = self.client.get(
+            NEAREST_URL, {"lat": 41.9, "lon": 12.5, "limit": 1}
+        )
+
+        self.assertEqual(request.data[0]["id"], self.airports[2].id)
+
+    def test_nearest_airports_refreshed_on_other_worker_write(self):
+        self.client.get(NEAREST_URL, {"lat": 41.9, "lon": 12.5})
+
+        with as_other_worker(), self.captureOnCommitCallbacks(execute=True):
+            self.airports[1].delete()
+
+        request = self.client.get(
+            NEAREST_URL, {"lat": 41.9, "lon": 12.5, "limit": 1}
+        )
+
+        self.assertEqual(request.data[0]["id"], self.airports[2].id)
+
+    def test_nearest_airports_invalid_latitude(self):
+        request = self.client.get(NEAREST_URL, {"lat": 91, "lon": 0})
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class CityRadiusSearchTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            "user@user.com",
+            "user123456",
+        )
+        self.client.force_authenticate(self.user)
+
+        country = Country.objects.create(name="Ukraine")
+        self.cities = {}
+        self.airports = {}
+
+        for name, coordinates in (
+            ("Kyiv", KYIV), ("Rome", ROME), ("Lviv", LVIV)
+        ):
+            self.cities[name] = City.objects.create(
+                name=name, country=country
+            )
+            self.airports[name] = Airport.objects.create(
+                name=f"TestAirport{name}",
+                closest_big_city=self.cities[name],
+                latitude=coordinates[0],
+                longitude=coordinates[1],
+            )
+
+        airplane = Airplane.objects.create(
+            name="TestAirplane",
+            rows=10,
+            seats_in_row=4,
+            airplane_type=AirplaneType.objects.create(name="TestType"),
+        )
+        departure_time = timezone.now() + timedelta(days=1)
+        self.flights = {
+            source: Flight.objects.create(
+                route=Route.objects.create(
+                    source=self.airports[source],
+                    destination=self.airports["Rome"],
+                ),
+                airplane=airplane,
+                departure_time=departure_time + timedelta(hours=hour),
+                arrival_time=departure_time + timedelta(hours=hour + 3),
+            )
+            for source, hour in (("Kyiv", 0), ("Lviv", 4))
+        }
+
+    def search(self, radius: int) -> list:
+        request = self.client.get(
+            FLIGHT_URL,
+            {"from": self.cities["Kyiv"].id, "radius": radius}
+        )
+
+        return sorted(flight["id"] for flight in request.data["results"])
+
+    def test_search_expands_city_to_nearby_airports(self):
+        self.assertEqual(self.search(100), [self.flights["Kyiv"].id])
+        self.assertEqual(
+            self.search(600),
+            sorted(flight.id for flight in self.flights.values())
+        )
+
+    def test_nearby_airports_refreshed_on_airport_write(self):
+        self.search(600)
+
+        self.airports["Lviv"].latitude = ROME[0]
+        self.airports["Lviv"].longitude = ROME[1]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.airports["Lviv"].save()
+
+        self.assertEqual(self.search(600), [self.flights["Kyiv"].id])
+
+    def test_nearby_airports_refreshed_on_other_worker_write(self):
+        self.search(600)
+
+        with as_other_worker():
+            self.assertEqual(len(self.search(600)), 2)
+
+            self.airports["Lviv"].latitude = ROME[0]
+            self.airports["Lviv"].longitude = ROME[1]
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self.airports["Lviv"].save()
+
+        self.assertEqual(self.search(600), [self.flights["Kyiv"].id])
+
+    def test_search_invalid_radius(self):
+        request = self.client.get(
+            FLIGHT_URL, {"from": self.cities["Kyiv"].id, "radius": -1}
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
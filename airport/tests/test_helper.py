@@ -0,0 +1,93 @@
+from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldError
+from django.db.utils import ConnectionHandler
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import serializers, status
+from rest_framework.test import APIClient
+
+from airport.helper import ID_MAX_VALUE, get_ids, filter_by_ids
+from airport.models import Country, City, Ticket
+
+CITY_URL = reverse("airport:city-list")
+FLIGHT_BATCH_URL = reverse("airport:flight-batch")
+
+
+class GetIdsTests(TestCase):
+    def test_ids_are_unique_integers_in_order(self):
+        self.assertEqual(get_ids("3, 1,3,,2,"), [3, 1, 2])
+
+    def test_invalid_ids(self):
+        self.assertEqual(get_ids(f"{ID_MAX_VALUE}"), [ID_MAX_VALUE])
+
+        for value in ("1,a", "1,-2", "1.5", "١", f"{ID_MAX_VALUE + 1}"):
+            with self.assertRaises(serializers.ValidationError) as error:
+                get_ids(value, "flights")
+
+            self.assertIn("flights", error.exception.detail)
+
+    def test_max_length(self):
+        self.assertEqual(get_ids("1,2,2,1", max_length=2), [1, 2])
+
+        with self.assertRaises(serializers.ValidationError):
+            get_ids("1,2,3", max_length=2)
+
+    def test_filter_by_ids(self):
+        country = Country.objects.create(name="Ukraine")
+        cities = [
+            City.objects.create(name=name, country=country)
+            for name in ("Kyiv", "Lviv", "Odesa")
+        ]
+        ids = [cities[2].id, cities[0].id, *range(10_000, 10_200)]
+
+        self.assertEqual(
+            set(filter_by_ids(City.objects.all(), "pk", ids)),
+            {cities[0], cities[2]}
+        )
+
+    def test_in_array_sql_on_postgresql(self):
+        connection = ConnectionHandler({
+            "default": {"ENGINE": "django.db.backends.postgresql"}
+        })["default"]
+        queryset = Ticket.objects.filter(flight__in_array=[3, 1]).values("id")
+
+        self.assertEqual(
+            queryset.query.get_compiler(connection=connection).as_sql(),
+            (
+                'SELECT "airport_ticket"."id" FROM "airport_ticket" '
+                'WHERE "airport_ticket"."flight_id" '
+                "IN (SELECT UNNEST(%s::bigint[]))",
+                ([3, 1],)
+            )
+        )
+
+    def test_in_array_only_on_integer_fields(self):
+        with self.assertRaises(FieldError):
+            City.objects.filter(name__in_array=["Kyiv"])
+
+
+class IdsQueryParamTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(
+            get_user_model().objects.create_user(
+                "user@user.com",
+                "user123456",
+            )
+        )
+
+    def test_invalid_ids_are_bad_requests(self):
+        request = self.client.get(CITY_URL, {"countries": "1,x"})
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            request.json(), {"countries": "x is not a valid id"}
+        )
+
+    def test_ids_out_of_bigint_range_are_bad_requests(self):
+        for url, param in ((CITY_URL, "countries"), (FLIGHT_BATCH_URL, "ids")):
+            request = self.client.get(url, {param: "99999999999999999999999"})
+
+            self.assertEqual(
+                request.status_code, status.HTTP_400_BAD_REQUEST
+            )
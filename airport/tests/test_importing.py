@@ -0,0 +1,163 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from airport.importing import iterate_fixture_objects
+from airport.models import (
+    Country,
+    City,
+    Airplane,
+    Crew,
+    Flight,
+    Ticket,
+    ImportedFixture,
+)
+from user.models import User
+
+FIXTURES = ("fixtures/user_data", "fixtures/airport_data")
+
+
+class FixtureStreamTests(TestCase):
+    def test_json_array_and_ndjson(self):
+        with open("fixtures/airport_data.json") as file:
+            objects = json.load(file)
+
+        with open("fixtures/airport_data.json") as file:
+            self.assertEqual(
+                list(iterate_fixture_objects(file, read_size=7)), objects
+            )
+
+        ndjson = StringIO("\n".join(json.dumps(item) for item in objects))
+        self.assertEqual(
+            list(iterate_fixture_objects(ndjson, read_size=64)), objects
+        )
+
+    def test_truncated_fixture(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(iterate_fixture_objects(StringIO('[{"model": "a'), 4))
+
+
+class ImportFixturesTests(TestCase):
+    def import_fixtures(self, *fixtures, **options) -> str:
+        out = StringIO()
+        call_command("import_fixtures", *fixtures, stdout=out, **options)
+
+        return out.getvalue()
+
+    def write_fixture(self, objects: list) -> str:
+        file = tempfile.NamedTemporaryFile(
+            "w", suffix=".ndjson", delete=False
+        )
+        self.addCleanup(os.remove, file.name)
+
+        with file:
+            file.write("\n".join(json.dumps(item) for item in objects))
+
+        return file.name
+
+    def test_import_fixtures(self):
+        self.import_fixtures(*FIXTURES)
+
+        with open("fixtures/airport_data.json") as file:
+            objects = json.load(file)
+
+        fields = {
+            (item["model"], item["pk"]): item["fields"] for item in objects
+        }
+
+        self.assertEqual(User.objects.count(), 2)
+        self.assertEqual(
+            Ticket.objects.count(),
+            sum(item["model"] == "airport.ticket" for item in objects)
+        )
+
+        for airplane in Airplane.objects.all():
+            airplane_fields = fields[("airport.airplane", airplane.id)]
+            self.assertEqual(
+                airplane.airplane_capacity,
+                airplane_fields["rows"] * airplane_fields["seats_in_row"]
+            )
+
+        for flight in Flight.objects.prefetch_related("crew"):
+            flight_fields = fields[("airport.flight", flight.id)]
+            self.assertEqual(
+                flight.flight_duration,
+                (flight.arrival_time - flight.departure_time).total_seconds()
+                / 3600
+            )
+            self.assertEqual(
+                sorted(member.id for member in flight.crew.all()),
+                sorted(flight_fields["crew"])
+            )
+
+    def test_repeated_import_is_skipped(self):
+        self.import_fixtures(*FIXTURES)
+
+        tickets_count = Ticket.objects.count()
+        out = self.import_fixtures(*FIXTURES)
+
+        self.assertIn("already imported", out)
+        self.assertEqual(Ticket.objects.count(), tickets_count)
+        self.assertEqual(ImportedFixture.objects.count(), 2)
+
+    def test_names_are_normalized(self):
+        path = self.write_fixture([
+            {"model": "airport.country", "pk": 1, "fields": {
+                "name": " ukraine "
+            }},
+            {"model": "airport.city", "pk": 1, "fields": {
+                "name": " Kyiv ", "country": 1
+            }},
+            {"model": "airport.crew", "pk": 1, "fields": {
+                "first_name": "amelia ", "last_name": " grant"
+            }},
+        ])
+
+        self.import_fixtures(path)
+
+        self.assertEqual(Country.objects.get().name, "Ukraine")
+        self.assertEqual(City.objects.get().name, "Kyiv")
+        self.assertEqual(
+            Crew.objects.values_list("first_name", "last_name").get(),
+            ("Amelia", "Grant")
+        )
+
+    def test_changed_fixture_adds_only_new_rows(self):
+        country = {"model": "airport.country", "pk": 1, "fields": {
+            "name": "Ukraine"
+        }}
+        self.import_fixtures(self.write_fixture([country]))
+        Country.objects.filter(pk=1).update(name="Poland")
+
+        self.import_fixtures(self.write_fixture([
+            country,
+            {"model": "airport.country", "pk": 2, "fields": {
+                "name": "Italy"
+            }},
+        ]))
+
+        self.assertEqual(
+            dict(Country.objects.values_list("id", "name")),
+            {1: "Poland", 2: "Italy"}
+        )
+        self.assertEqual(Country.objects.create(name="Spain").id, 3)
+
+    def test_loaddata_fills_stored_fields(self):
+        call_command("loaddata", *FIXTURES, verbosity=0)
+
+        for airplane in Airplane.objects.all():
+            self.assertEqual(
+                airplane.airplane_capacity,
+                airplane.rows * airplane.seats_in_row
+            )
+
+        for flight in Flight.objects.all():
+            self.assertEqual(
+                flight.flight_duration,
+                (flight.arrival_time - flight.departure_time).total_seconds()
+                / 3600
+            )
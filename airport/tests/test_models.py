@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from django.contrib.auth import get_user_model
 from django.test import TestCase
@@ -101,6 +101,21 @@ class AirplaneModelTests(TestCase):
 
         self.assertEqual(airplane.name, str(airplane))
 
+    def test_airplane_capacity_is_stored(self):
+        airplane = Airplane.objects.create(
+            name="Test Airplane 28",
+            airplane_type=self.airplane_type,
+            rows=10,
+            seats_in_row=5,
+        )
+        airplane.rows = 20
+        airplane.save()
+
+        self.assertEqual(
+            Airplane.objects.filter(airplane_capacity=100).get(),
+            airplane
+        )
+
 
 class CrewModelTests(TestCase):
 
@@ -188,3 +203,16 @@ class FlightTicketOrderModelTests(TestCase):
             f"{flight.route} ({flight.departure_time})",
             str(flight)
         )
+
+    def test_flight_duration_is_stored(self):
+        flight = Flight.objects.create(
+            route=self.route,
+            airplane=self.airplane,
+            departure_time=self.departure_time,
+            arrival_time=self.arrival_time + timedelta(minutes=30)
+        )
+
+        self.assertEqual(
+            Flight.objects.filter(flight_duration=2.5).get(),
+            flight
+        )
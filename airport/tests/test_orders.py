@@ -0,0 +1,257 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from airport.models import City, Flight, Order, OrderSummary
+from airport.orders import save_order_summaries
+from airport.tests.caches import clear_caches
+from airport.tests.fixtures import (
+    create_user,
+    get_client,
+    create_airports,
+    create_route,
+    create_airplane,
+)
+
+ORDER_URL = reverse("airport:order-list")
+
+
+def order_detail_url(order_id: int) -> str:
+    return reverse("airport:order-detail", args=[order_id])
+
+
+class OrderSummaryTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.user = create_user()
+        self.client = get_client(self.user)
+
+        kyiv, lviv, odesa = create_airports("Kyiv", "Lviv", "Odesa")
+        airplane = create_airplane()
+        departure_time = timezone.now().replace(microsecond=0) + timedelta(
+            days=3
+        )
+        self.flights = [
+            Flight.objects.create(
+                route=create_route(source, destination),
+                airplane=airplane,
+                departure_time=departure_time + timedelta(hours=hours),
+                arrival_time=departure_time + timedelta(hours=hours + 2),
+            )
+            for source, destination, hours in (
+                (lviv, odesa, 6),
+                (kyiv, lviv, 0),
+            )
+        ]
+
+    def buy_tickets(self, *flights, row: int = 1) -> int:
+        request = self.client.post(
+            ORDER_URL,
+            {
+                "tickets": [
+                    {"row": row, "seat": seat, "flight": flight.id}
+                    for seat, flight in enumerate(flights, start=1)
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_201_CREATED)
+
+        return request.data["id"]
+
+    def test_summary_is_written_at_order_creation(self):
+        order_id = self.buy_tickets(
+            self.flights[0], self.flights[1], self.flights[0]
+        )
+        summary = OrderSummary.objects.get(order_id=order_id)
+
+        self.assertEqual(summary.tickets_count, 3)
+        self.assertEqual(
+            [flight["id"] for flight in summary.flights],
+            [self.flights[1].id, self.flights[0].id]
+        )
+        self.assertEqual(summary.flights[0]["route"], "Kyiv - Lviv")
+        self.assertEqual(
+            summary.first_departure, self.flights[1].departure_time
+        )
+        self.assertEqual(summary.cities, ["Kyiv", "Lviv", "Odesa"])
+
+    def test_list_reads_summaries_in_one_query(self):
+        for row in range(1, 4):
+            self.buy_tickets(*self.flights, row=row)
+
+        with self.assertNumQueries(1):
+            request = self.client.get(ORDER_URL)
+
+        self.assertEqual(len(request.data["results"]), 3)
+        self.assertEqual(
+            set(request.data["results"][0]),
+            {
+                "id",
+                "created_at",
+                "tickets_count",
+                "flights",
+                "first_departure",
+                "cities",
+            }
+        )
+        self.assertEqual(
+            request.data["results"][0]["flights"][0]["departure_time"],
+            self.client.get(
+                reverse("airport:flight-detail", args=[self.flights[1].id])
+            ).data["departure_time"]
+        )
+
+    def test_retrieve_keeps_tickets(self):
+        order_id = self.buy_tickets(*self.flights)
+
+        request = self.client.get(order_detail_url(order_id))
+
+        self.assertEqual(
+            [ticket["flight"]["id"] for ticket in request.data["tickets"]],
+            [flight.id for flight in self.flights]
+        )
+
+    def test_summary_follows_flight_changes(self):
+        order_id = self.buy_tickets(*self.flights)
+        flight = self.flights[1]
+        flight.departure_time += timedelta(days=1)
+        flight.arrival_time += timedelta(days=1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            flight.save()
+
+        self.assertEqual(
+            OrderSummary.objects.get(order_id=order_id).cities,
+            ["Lviv", "Odesa", "Kyiv", "Lviv"]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            flight.tickets.all().delete()
+
+        self.assertEqual(
+            OrderSummary.objects.get(order_id=order_id).tickets_count, 1
+        )
+
+    def test_summary_follows_city_and_airport_changes(self):
+        order_id = self.buy_tickets(*self.flights)
+        kyiv = self.flights[1].route.source
+        kyiv.closest_big_city = City.objects.create(
+            name="Boryspil", country=kyiv.closest_big_city.country
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            kyiv.save()
+
+        summary = OrderSummary.objects.get(order_id=order_id)
+        self.assertEqual(summary.flights[0]["route"], "Boryspil - Lviv")
+        self.assertEqual(summary.cities, ["Boryspil", "Lviv", "Odesa"])
+
+        odesa = self.flights[0].route.destination.closest_big_city
+        odesa.name = "Odessa"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            odesa.save()
+
+        self.assertEqual(
+            OrderSummary.objects.get(order_id=order_id).cities,
+            ["Boryspil", "Lviv", "Odessa"]
+        )
+
+    def test_save_order_summaries_replaces_summaries(self):
+        order_id = self.buy_tickets(*self.flights)
+        OrderSummary.objects.filter(order_id=order_id).update(
+            tickets_count=0, cities=[]
+        )
+
+        save_order_summaries(Order.objects.all())
+
+        self.assertEqual(
+            OrderSummary.objects.get(order_id=order_id).tickets_count, 2
+        )
+        self.assertEqual(OrderSummary.objects.count(), 1)
+
+
+class OrderHistoryTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.user = create_user()
+        self.client = get_client(self.user)
+        other_user = create_user("other@user.com")
+        now = timezone.now()
+        self.orders = []
+
+        for days in range(5, 0, -1):
+            order = Order.objects.create(user=self.user)
+            order.created_at = now - timedelta(days=days)
+            order.save()
+            self.orders.append(order)
+
+        Order.objects.create(user=other_user)
+        save_order_summaries(Order.objects.all())
+
+    def get_order_ids(self, params: dict) -> list:
+        request = self.client.get(ORDER_URL, params)
+
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+
+        return [order["id"] for order in request.data["results"]]
+
+    def test_history_is_newest_first_and_paged_by_cursor(self):
+        request = self.client.get(ORDER_URL, {"page_size": 2})
+        order_ids = [order["id"] for order in request.data["results"]]
+
+        while request.data["next"]:
+            request = self.client.get(request.data["next"])
+            order_ids += [order["id"] for order in request.data["results"]]
+
+        self.assertEqual(
+            order_ids, [order.id for order in reversed(self.orders)]
+        )
+
+    def test_filter_by_date_range(self):
+        days = [
+            timezone.localdate(order.created_at).isoformat()
+            for order in self.orders
+        ]
+
+        self.assertEqual(
+            self.get_order_ids({"date_from": days[1], "date_to": days[3]}),
+            [self.orders[3].id, self.orders[2].id, self.orders[1].id]
+        )
+        self.assertEqual(
+            self.get_order_ids({"date_from": days[4]}), [self.orders[4].id]
+        )
+        self.assertEqual(
+            self.get_order_ids({"date": days[2]}), [self.orders[2].id]
+        )
+
+    def test_invalid_date_is_bad_request(self):
+        request = self.client.get(ORDER_URL, {"date_to": "2024-13-01"})
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("date_to", request.data)
+
+        request = self.client.get(ORDER_URL, {"date": "2024-13-01"})
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(request.data), {"date"})
+
+    def test_date_with_date_range_is_bad_request(self):
+        day = timezone.localdate(self.orders[2].created_at).isoformat()
+
+        for params in ({"date_from": day}, {"date_to": day}):
+            request = self.client.get(ORDER_URL, {"date": day, **params})
+
+            self.assertEqual(
+                request.status_code, status.HTTP_400_BAD_REQUEST
+            )
+            self.assertIn("date", request.data)
@@ -0,0 +1,93 @@
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from airport.models import Order
+from airport.synthetic import SyntheticDataset
+from airport.views import (
+    CountryView,
+    CityView,
+    AirportView,
+    RouteView,
+    AirplaneTypeView,
+    AirplaneView,
+    CrewView,
+    FlightView,
+    FareClassView,
+    FareView,
+    OrderView,
+    TicketView,
+)
+
+PLANNED_VIEWS = (
+    CountryView,
+    CityView,
+    AirportView,
+    RouteView,
+    AirplaneTypeView,
+    AirplaneView,
+    CrewView,
+    FlightView,
+    FareClassView,
+    FareView,
+    OrderView,
+    TicketView,
+)
+
+
+class QuerysetPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        SyntheticDataset(seed=48).generate(
+            countries=2,
+            cities=4,
+            airports=6,
+            routes=8,
+            airplanes=3,
+            flights_per_day=4,
+            days=2,
+            users=3,
+            load_factor=0.3,
+            crew=6,
+            fares=True,
+        )
+        cls.user = Order.objects.first().user
+
+    def get_view(self, view_class, action: str):
+        request = Request(APIRequestFactory().get("/"))
+        request.user = self.user
+
+        return view_class(
+            action=action, request=request, format_kwarg=None, kwargs={}
+        )
+
+    def test_plans_load_every_serializer_field(self):
+        for view_class in PLANNED_VIEWS:
+            for action in view_class.queryset_plans:
+                with self.subTest(view=view_class.__name__, action=action):
+                    view = self.get_view(view_class, action)
+                    objects = list(view.get_queryset()[:5])
+
+                    self.assertGreater(len(objects), 1)
+
+                    with self.assertNumQueries(0):
+                        view.get_serializer(objects, many=True).data
+
+    def test_list_loads_less_than_retrieve(self):
+        for view_class, list_queries, retrieve_queries in (
+            (CountryView, 2, 3),
+            (CrewView, 1, 2),
+        ):
+            with self.subTest(view=view_class.__name__):
+                with self.assertNumQueries(list_queries):
+                    list(self.get_view(view_class, "list").get_queryset())
+
+                with self.assertNumQueries(retrieve_queries):
+                    list(self.get_view(view_class, "retrieve").get_queryset())
+
+    def test_actions_without_plan_get_plain_queryset(self):
+        queryset = self.get_view(FlightView, "destroy").get_queryset()
+
+        self.assertFalse(queryset.query.select_related)
+        self.assertFalse(queryset._prefetch_related_lookups)
+        self.assertNotIn("tickets_available", queryset.query.annotations)
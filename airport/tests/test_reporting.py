@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from airport.conflicts import audit_airplane_conflicts
+from airport.models import Flight, Ticket
+from airport.reporting import (
+    REPORT_GROUPS,
+    build_flight_report,
+    build_flight_report_naive,
+)
+from airport.synthetic import SyntheticDataset
+
+
+class ReportingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.dataset = SyntheticDataset(seed=28).generate(
+            countries=2,
+            cities=4,
+            airports=6,
+            routes=10,
+            airplanes=4,
+            flights_per_day=10,
+            days=3,
+            users=5,
+            load_factor=0.5,
+        )
+        cls.date_from = timezone.localdate() + timedelta(days=1)
+        cls.date_to = cls.date_from + timedelta(days=2)
+
+    def test_synthetic_dataset(self):
+        self.assertEqual(self.dataset["flights"], 30)
+        self.assertEqual(Flight.objects.count(), 30)
+        self.assertEqual(Ticket.objects.count(), self.dataset["tickets"])
+        self.assertEqual(list(audit_airplane_conflicts()), [])
+
+    def test_vectorized_report_matches_naive(self):
+        for group_by in REPORT_GROUPS:
+            report = build_flight_report(
+                self.date_from, self.date_to, group_by, chunk_size=100
+            )
+
+            self.assertEqual(
+                report,
+                build_flight_report_naive(
+                    self.date_from, self.date_to, group_by
+                )
+            )
+            self.assertEqual(
+                sum(row["tickets_sold"] for row in report),
+                self.dataset["tickets"]
+            )
+
+    def test_report_of_empty_period(self):
+        day = self.date_to + timedelta(days=10)
+
+        self.assertEqual(build_flight_report(day, day, "route"), [])
@@ -0,0 +1,174 @@
+from datetime import datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.models import (
+    Country,
+    City,
+    Airport,
+    Route,
+    AirplaneType,
+    Airplane,
+    Crew,
+    Flight,
+)
+from airport.rosters import plan_roster
+
+ROSTER_URL = reverse("airport:crew-roster")
+
+
+class RosterTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = get_user_model().objects.create_user(
+            email="admin@admin.com",
+            password="admin123456",
+            is_staff=True,
+        )
+        self.client.force_authenticate(self.admin)
+
+        country = Country.objects.create(name="Ukraine")
+        airports = [
+            Airport.objects.create(
+                name=f"TestAirport{name}",
+                closest_big_city=City.objects.create(
+                    name=name, country=country
+                )
+            )
+            for name in ("Kyiv", "Lviv")
+        ]
+        self.route = Route.objects.create(
+            source=airports[0],
+            destination=airports[1],
+            distance=500
+        )
+        self.airplane = Airplane.objects.create(
+            name="TestAirplane",
+            rows=10,
+            seats_in_row=4,
+            airplane_type=AirplaneType.objects.create(name="TestType"),
+        )
+        self.crew = [
+            Crew.objects.create(first_name=f"Test {letter}", last_name="Last")
+            for letter in "abc"
+        ]
+
+        self.day = (timezone.now() + timedelta(days=2)).date()
+        self.start = timezone.make_aware(
+            datetime.combine(self.day, datetime.min.time())
+        )
+
+    def create_flight(self, departure_hour: int, hours: int = 2):
+        departure_time = self.start + timedelta(hours=departure_hour)
+
+        return Flight.objects.create(
+            route=self.route,
+            airplane=self.airplane,
+            departure_time=departure_time,
+            arrival_time=departure_time + timedelta(hours=hours),
+        )
+
+    def test_roster_respects_min_rest(self):
+        flights = [
+            self.create_flight(8),
+            self.create_flight(11),
+            self.create_flight(33),
+        ]
+
+        assignments, unstaffed = plan_roster(
+            date_from=self.day,
+            date_to=self.day + timedelta(days=1),
+            crew_per_flight=1,
+            min_rest=timedelta(hours=10),
+            max_duty=timedelta(hours=60),
+            duty_window=timedelta(days=7),
+        )
+        crew_by_flight = dict(assignments)
+
+        self.assertEqual(unstaffed, [])
+        self.assertNotEqual(
+            crew_by_flight[flights[0].id], crew_by_flight[flights[1].id]
+        )
+        self.assertEqual(len(crew_by_flight[flights[2].id]), 1)
+
+    def test_roster_respects_max_duty(self):
+        flights = [
+            self.create_flight(8 + day * 24)
+            for day in range(4)
+        ]
+
+        assignments, unstaffed = plan_roster(
+            date_from=self.day,
+            date_to=self.day + timedelta(days=3),
+            crew_per_flight=1,
+            min_rest=timedelta(hours=10),
+            max_duty=timedelta(hours=3),
+            duty_window=timedelta(days=7),
+        )
+
+        self.assertEqual(len(assignments), 3)
+        self.assertEqual(unstaffed, [flights[-1].id])
+
+    def test_roster_skips_staffed_flights(self):
+        staffed = self.create_flight(8)
+        staffed.crew.add(self.crew[0])
+        unstaffed_flight = self.create_flight(12)
+
+        assignments, _ = plan_roster(
+            date_from=self.day,
+            date_to=self.day,
+            crew_per_flight=1,
+            min_rest=timedelta(hours=10),
+            max_duty=timedelta(hours=60),
+            duty_window=timedelta(days=7),
+        )
+
+        self.assertEqual(len(assignments), 1)
+        self.assertEqual(assignments[0][0], unstaffed_flight.id)
+        self.assertNotEqual(assignments[0][1], [self.crew[0].id])
+
+    def test_roster_endpoint_saves_assignments(self):
+        flights = [self.create_flight(8), self.create_flight(15)]
+        payload = {
+            "date_from": f"{self.day}",
+            "date_to": f"{self.day}",
+            "crew_per_flight": 2,
+        }
+
+        dry_run = self.client.post(
+            ROSTER_URL, {**payload, "dry_run": True}, format="json"
+        )
+
+        self.assertEqual(dry_run.status_code, status.HTTP_200_OK)
+        self.assertFalse(Flight.crew.through.objects.exists())
+
+        request = self.client.post(ROSTER_URL, payload, format="json")
+
+        self.assertEqual(request.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(request.data["assigned"], 1)
+        self.assertEqual(request.data["unstaffed"], [flights[1].id])
+        self.assertEqual(flights[0].crew.count(), 2)
+
+    def test_roster_rejects_negative_min_rest(self):
+        self.create_flight(8)
+        self.create_flight(9)
+
+        request = self.client.post(
+            ROSTER_URL,
+            {
+                "date_from": f"{self.day}",
+                "date_to": f"{self.day}",
+                "crew_per_flight": 1,
+                "min_rest": "-3:00:00",
+            },
+            format="json"
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("min_rest", request.data)
+        self.assertFalse(Flight.crew.through.objects.exists())
@@ -0,0 +1,187 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from airport.autocomplete import AutocompleteIndex
+from airport.models import Country, City, Airport, Crew
+from airport.search import NameTrie, trigram_similarity
+from airport.tests.caches import as_other_worker, clear_caches
+
+AIRPORT_URL = reverse("airport:airport-list")
+CREW_URL = reverse("airport:crew-list")
+AUTOCOMPLETE_URL = reverse("airport:autocomplete")
+
+
+class NameTrieTests(TestCase):
+    def test_find_matches_substrings_case_insensitively(self):
+        trie = NameTrie(
+            [(1, "Boryspil International"), (2, "Lviv Danylo Halytskyi")]
+        )
+
+        self.assertEqual(trie.find("INTER"), {1})
+        self.assertEqual(trie.find("y"), {1, 2})
+        self.assertEqual(trie.find("kyiv"), set())
+
+    def test_trigram_similarity(self):
+        self.assertEqual(trigram_similarity("Kyiv", "kyiv"), 1.0)
+        self.assertGreater(
+            trigram_similarity("Kyiv", "Kyi"),
+            trigram_similarity("Kyiv Zhuliany", "Kyi"),
+        )
+        self.assertEqual(trigram_similarity("Kyiv", ""), 0.0)
+
+
+class NameSearchTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            "user@user.com",
+            "user123456",
+        )
+        self.client.force_authenticate(self.user)
+
+        city = City.objects.create(
+            name="Kyiv", country=Country.objects.create(name="Ukraine")
+        )
+        self.airports = [
+            Airport.objects.create(name=name, closest_big_city=city)
+            for name in ("Kyiv Zhuliany", "Kyiv", "Boryspil")
+        ]
+
+    def search_airports(self, name: str) -> list:
+        request = self.client.get(AIRPORT_URL, {"name": name})
+
+        return [airport["id"] for airport in request.data["results"]]
+
+    def test_search_orders_by_similarity(self):
+        self.assertEqual(
+            self.search_airports("kyiv"),
+            [self.airports[1].id, self.airports[0].id]
+        )
+
+    def test_search_sees_airport_writes(self):
+        self.search_airports("kyiv")
+
+        self.airports[2].name = "Kyiv Boryspil"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.airports[2].save()
+
+        self.assertIn(self.airports[2].id, self.search_airports("kyiv"))
+
+    def test_search_sees_other_worker_writes(self):
+        self.search_airports("kyiv")
+        self.airports[2].name = "Kyiv Boryspil"
+
+        with as_other_worker(), self.captureOnCommitCallbacks(execute=True):
+            self.airports[2].save()
+
+        self.assertIn(self.airports[2].id, self.search_airports("kyiv"))
+
+    def test_search_combines_terms(self):
+        crew = [
+            Crew.objects.create(first_name=first_name, last_name=last_name)
+            for first_name, last_name in (
+                ("Olena", "Shevchenko"),
+                ("Olena", "Kovalenko"),
+                ("Taras", "Shevchenko"),
+            )
+        ]
+
+        request = self.client.get(
+            CREW_URL, {"first_name": "olen", "last_name": "shev"}
+        )
+
+        self.assertEqual(
+            [member["id"] for member in request.data["results"]],
+            [crew[0].id]
+        )
+
+
+class AutocompleteTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            "user@user.com",
+            "user123456",
+        )
+        self.client.force_authenticate(self.user)
+
+        self.country = Country.objects.create(name="Ukraine")
+        self.city = City.objects.create(name="Kyiv", country=self.country)
+        self.airport = Airport.objects.create(
+            name="Kyiv Zhuliany", closest_big_city=self.city
+        )
+
+    def autocomplete(self, query: str, **params) -> list:
+        request = self.client.get(AUTOCOMPLETE_URL, {"q": query, **params})
+
+        return [(match["type"], match["id"]) for match in request.data]
+
+    def test_index_matches_every_word_once(self):
+        index = AutocompleteIndex(
+            [("airport", 1, "Kyiv Zhuliany"), ("city", 1, "Kyiv")]
+        )
+
+        self.assertEqual(
+            [match["type"] for match in index.search("KY", limit=10)],
+            ["city", "airport"]
+        )
+        self.assertEqual(
+            index.search("zhul", limit=10),
+            [{"id": 1, "type": "airport", "name": "Kyiv Zhuliany"}]
+        )
+
+        index.remove("airport", 1)
+
+        self.assertEqual(index.search("zhul", limit=10), [])
+
+    def test_autocomplete_does_not_hit_database(self):
+        self.autocomplete("kyi")
+
+        with self.assertNumQueries(0):
+            matches = self.autocomplete("kyi")
+
+        self.assertEqual(
+            matches, [("city", self.city.id), ("airport", self.airport.id)]
+        )
+
+    def test_autocomplete_follows_writes(self):
+        self.autocomplete("kyi")
+
+        self.airport.name = "Boryspil"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.airport.save()
+            City.objects.create(name="Kyivska", country=self.country)
+
+        self.assertEqual(
+            self.autocomplete("bor"), [("airport", self.airport.id)]
+        )
+        self.assertEqual(len(self.autocomplete("kyi", types="city")), 2)
+
+    def test_autocomplete_follows_other_worker_writes(self):
+        self.autocomplete("kyi")
+        self.airport.name = "Boryspil"
+
+        with as_other_worker(), self.captureOnCommitCallbacks(execute=True):
+            self.airport.save()
+
+        self.assertEqual(
+            self.autocomplete("bor"), [("airport", self.airport.id)]
+        )
+
+    def test_autocomplete_invalid_type(self):
+        request = self.client.get(
+            AUTOCOMPLETE_URL, {"q": "kyi", "types": "planet"}
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,66 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+
+from airport.conflicts import audit_airplane_conflicts, audit_crew_conflicts
+from airport.models import (
+    Crew,
+    Flight,
+    Fare,
+    Ticket,
+    DailyLowestFare,
+    DailyRouteStats,
+)
+
+SEED_OPTIONS = {
+    "tickets": 500,
+    "countries": 2,
+    "cities": 4,
+    "airports": 6,
+    "routes": 10,
+    "airplanes": 4,
+    "flights_per_day": 6,
+    "days": 2,
+    "users": 5,
+    "seed": 39,
+}
+
+
+class SeedDataTests(TestCase):
+    def seed(self, **options) -> list:
+        call_command("seed_data", stdout=StringIO(), **options)
+
+        return list(
+            Ticket.objects.order_by("id").values_list(
+                "flight__route__distance",
+                "flight__departure_time",
+                "row",
+                "seat",
+            )
+        )
+
+    def test_seed_data(self):
+        self.seed(**SEED_OPTIONS)
+
+        self.assertEqual(Flight.objects.count(), 12)
+        self.assertEqual(Crew.objects.count(), 8)
+        self.assertEqual(Fare.objects.count(), 24)
+        self.assertFalse(Flight.objects.filter(crew__isnull=True).exists())
+        self.assertEqual(list(audit_airplane_conflicts()), [])
+        self.assertEqual(list(audit_crew_conflicts()), [])
+        self.assertTrue(DailyLowestFare.objects.exists())
+        self.assertEqual(
+            sum(
+                DailyRouteStats.objects.values_list("tickets_sold", flat=True)
+            ),
+            Ticket.objects.count()
+        )
+
+    def test_seed_data_is_reproducible(self):
+        with transaction.atomic():
+            tickets = self.seed(**SEED_OPTIONS)
+            transaction.set_rollback(True)
+
+        self.assertEqual(self.seed(**SEED_OPTIONS), tickets)
@@ -1,7 +1,11 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+from airport.async_views import AsyncFlightSearchView, AsyncFlightDetailView
 from airport.views import (
+    AnalyticsView,
+    AutocompleteView,
+    BatchView,
     CountryView,
     CityView,
     AirportView,
@@ -10,6 +14,8 @@ from airport.views import (
     AirplaneView,
     CrewView,
     FlightView,
+    FareClassView,
+    FareView,
     OrderView,
     TicketView,
 )
@@ -24,12 +30,35 @@ router.register("airplane_types", AirplaneTypeView)
 router.register("airplanes", AirplaneView)
 router.register("crew", CrewView)
 router.register("flights", FlightView)
+router.register("fare_classes", FareClassView)
+router.register("fares", FareView)
 router.register("orders", OrderView)
 router.register("tickets", TicketView)
+router.register("analytics", AnalyticsView, basename="analytics")
 
 
 urlpatterns = [
-    path("", include(router.urls))
+    path("", include(router.urls)),
+    path(
+        "autocomplete/",
+        AutocompleteView.as_view(),
+        name="autocomplete"
+    ),
+    path(
+        "batch/",
+        BatchView.as_view(),
+        name="batch"
+    ),
+    path(
+        "async/flights/",
+        AsyncFlightSearchView.as_view(),
+        name="async-flight-search"
+    ),
+    path(
+        "async/flights/<int:pk>/",
+        AsyncFlightDetailView.as_view(),
+        name="async-flight-detail"
+    ),
 ]
 
 app_name = "airport"
@@ -1,8 +1,9 @@
 import re
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 from django.utils import timezone
 
+from airport.conflicts import get_airplane_conflicts, get_crew_conflicts
 from airport.helper import WeatherAPI
 
 NAME_PATTERN = r"^(?=.*[a-zA-Z])[a-zA-Z\s]+$"
@@ -130,3 +131,174 @@ def validate_seat_or_row(
                 f"{seat_or_row} must be "
                 f"in range (1, {seats_or_rows})"
         })
+
+
+def validate_date_range(
+        date_from: date,
+        date_to: date,
+        max_days: int,
+        error_to_raise
+):
+    if date_from > date_to:
+        raise error_to_raise({
+            "date_from": "date_from should not be later than date_to",
+        })
+
+    if (date_to - date_from).days >= max_days:
+        raise error_to_raise({
+            "date_to": f"date range should not be longer than {max_days} days",
+        })
+
+
+def validate_weekdays(weekdays: list, error_to_raise):
+    if not weekdays or any(day not in range(1, 8) for day in weekdays):
+        raise error_to_raise({
+            "weekdays": "weekdays should contain numbers "
+                        "from 1 (Monday) to 7 (Sunday)",
+        })
+
+
+def validate_duration(
+        duration: timedelta,
+        error_to_raise,
+        field_name: str = "duration"
+):
+    if duration <= timedelta(0):
+        raise error_to_raise({
+            f"{field_name}": f"{field_name} should be positive",
+        })
+
+
+def validate_airplane_is_available(
+        airplane,
+        departure_time: datetime,
+        arrival_time: datetime,
+        error_to_raise,
+        flight_id: int = None
+):
+    conflicts = get_airplane_conflicts(
+        airplane, departure_time, arrival_time, flight_id
+    ).values_list("id", flat=True)[:1]
+
+    if conflicts:
+        raise error_to_raise({
+            "airplane": f"{airplane} is already assigned to "
+                        f"flight {conflicts[0]} at this time",
+        })
+
+
+def validate_crew_is_available(
+        crew: list,
+        departure_time: datetime,
+        arrival_time: datetime,
+        error_to_raise,
+        flight_id: int = None
+):
+    if not crew:
+        return
+
+    conflicts = get_crew_conflicts(
+        crew, departure_time, arrival_time, flight_id
+    ).values_list("crew_id", "flight_id")
+
+    if conflicts:
+        raise error_to_raise({
+            "crew": [
+                f"crew member {crew_id} is already assigned to "
+                f"flight {flight_id} at this time"
+                for crew_id, flight_id in conflicts
+            ],
+        })
+
+
+def validate_schedule_is_available(conflicts: list, error_to_raise):
+    if not conflicts:
+        return
+
+    flight_ids = sorted({
+        flight_id
+        for pair in conflicts
+        for flight_id in pair
+        if flight_id is not None
+    })
+
+    raise error_to_raise({
+        "airplane": (
+            f"airplane is already assigned to flights {flight_ids} "
+            f"at the scheduled time"
+            if flight_ids
+            else "scheduled flights overlap each other"
+        ),
+    })
+
+
+def validate_coordinates(
+        latitude: float,
+        longitude: float,
+        error_to_raise
+):
+    if (latitude is None) != (longitude is None):
+        raise error_to_raise({
+            "latitude": "latitude and longitude should be set together",
+            "longitude": "latitude and longitude should be set together",
+        })
+
+    if latitude is not None and not -90 <= latitude <= 90:
+        raise error_to_raise({
+            "latitude": f"{latitude} must be in range (-90, 90)",
+        })
+
+    if longitude is not None and not -180 <= longitude <= 180:
+        raise error_to_raise({
+            "longitude": f"{longitude} must be in range (-180, 180)",
+        })
+
+
+def validate_route_distance(
+        distance: int,
+        has_coordinates: bool,
+        error_to_raise
+):
+    if distance is None and not has_coordinates:
+        raise error_to_raise({
+            "distance": "distance is required when source or destination "
+                        "airport has no coordinates",
+        })
+
+
+def validate_fare_class_rows(
+        first_row: int,
+        last_row: int,
+        rows: int,
+        other_classes: list,
+        error_to_raise
+):
+    if not 1 <= first_row <= last_row <= rows:
+        raise error_to_raise({
+            "last_row": f"rows should be in range (1, {rows}) "
+                        f"and first_row should not be after last_row",
+        })
+
+    for other_class in other_classes:
+        if (
+            first_row <= other_class.last_row
+            and other_class.first_row <= last_row
+        ):
+            raise error_to_raise({
+                "first_row": f"rows overlap with {other_class}",
+            })
+
+
+def validate_fare_class_airplane(fare_class, flight, error_to_raise):
+    if fare_class.airplane_id != flight.airplane_id:
+        raise error_to_raise({
+            "fare_class": f"{fare_class} is not a class "
+                          f"of the flight airplane",
+        })
+
+
+def validate_price(price, error_to_raise):
+    if price <= 0:
+        raise error_to_raise({
+            "price": "price should be positive",
+        })
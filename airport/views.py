@@ -1,11 +1,39 @@
-from datetime import datetime
-
-from django.db.models import F, Count
-from drf_spectacular.utils import extend_schema, OpenApiParameter
-from rest_framework import viewsets, mixins
-from rest_framework.permissions import IsAuthenticated
-
-from airport.helper import get_ids
+from datetime import datetime, timedelta
+
+from django.db.models import F, Count, Prefetch
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    extend_schema,
+    inline_serializer,
+    OpenApiParameter,
+)
+from rest_framework import viewsets, mixins, serializers, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from airport.analytics import (
+    ANALYTICS_GROUPS,
+    get_load_factors,
+    get_revenue,
+)
+from airport.autocomplete import AUTOCOMPLETE_MODELS, get_autocomplete_index
+from airport.batch import BATCH_MAX_REQUESTS, BatchRetrieveMixin, run_batch
+from airport.exports import (
+    stream_export,
+    TICKET_EXPORT_FIELDS,
+    ORDER_EXPORT_FIELDS,
+)
+from airport.fares import FARE_CALENDAR_DAYS, get_fare_calendar
+from airport.flight_search import (
+    FLIGHT_ORDERING,
+    filter_flights,
+    get_flight_search_key,
+    get_cached_flight_search,
+    with_tickets_available,
+)
+from airport.helper import filter_by_ids, get_ids, get_day_start
 from airport.models import (
     Country,
     City,
@@ -17,6 +45,8 @@ from airport.models import (
     Flight,
     Order,
     Ticket,
+    FareClass,
+    Fare,
 )
 from airport.serializers import (
     CountrySerializer,
@@ -33,6 +63,15 @@ from airport.serializers import (
     CityDetailSerializer,
     AirportDetailSerializer,
     AirportListSerializer,
+    NearestAirportsSerializer,
+    AutocompleteSerializer,
+    BatchSerializer,
+    FareClassSerializer,
+    FareClassListSerializer,
+    FareSerializer,
+    FareListSerializer,
+    FareCalendarSerializer,
+    AnalyticsSerializer,
     RouteListSerializer,
     RouteDetailSerializer,
     AirplaneListSerializer,
@@ -41,6 +80,8 @@ from airport.serializers import (
     CrewDetailSerializer,
     FlightListSerializer,
     FlightDetailSerializer,
+    FlightScheduleSerializer,
+    RosterSerializer,
     TicketListSerializer,
     TicketDetailSerializer,
     OrderListSerializer,
@@ -53,14 +94,51 @@ from airport.serializers import (
 )
 
 from airport.paginations import (
+    OrderHistoryPagination,
     TwoSizePagination,
     FiveSizePagination,
     TenSizePagination
 )
+from airport.querysets import QuerysetPlan, QuerysetPlanMixin
+from airport.rosters import plan_roster, save_roster
+from airport.schedules import create_scheduled_flights
+from airport.search import search_by_name
+from airport.spatial import get_airport_index
+from user.authentication import get_request_user
 from user.permissions import IsAdminOrIfAuthenticatedReadOnly
 
+TICKETS_AVAILABLE = F("airplane__airplane_capacity") - Count("tickets")
+TICKET_FLIGHT_RELATED_FIELDS = [
+    "flight__route__source__closest_big_city",
+    "flight__route__destination__closest_big_city",
+]
+# MiniFlightDetailSerializer reads the route name
+MINI_FLIGHT_QUERYSET = Flight.objects.select_related(
+    "route__source__closest_big_city",
+    "route__destination__closest_big_city",
+)
+
+AIRPORT_DETAIL_PLAN = QuerysetPlan(
+    select_related=["closest_big_city__country"],
+)
+FLIGHT_DETAIL_PLAN = QuerysetPlan(
+    select_related=[
+        "route__source__closest_big_city",
+        "route__destination__closest_big_city",
+        "airplane__airplane_type",
+    ],
+    prefetch_related=[
+        "crew",
+        Prefetch(
+            "tickets", queryset=Ticket.objects.only("row", "seat", "flight")
+        ),
+    ],
+    annotations={"tickets_available": TICKETS_AVAILABLE},
+)
+
 
 class CountryView(
+    QuerysetPlanMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -70,17 +148,41 @@ class CountryView(
     serializer_class = CountrySerializer
     pagination_class = FiveSizePagination
     permission_classes = [IsAdminOrIfAuthenticatedReadOnly]
+    queryset_plans = {
+        "list": QuerysetPlan(
+            prefetch_related=[
+                Prefetch(
+                    "cities",
+                    queryset=City.objects.only("name", "country"),
+                ),
+            ],
+        ),
+        "retrieve": QuerysetPlan(
+            prefetch_related=[
+                Prefetch(
+                    "cities",
+                    queryset=City.objects.only(
+                        "name", "country"
+                    ).prefetch_related(
+                        Prefetch(
+                            "airports",
+                            queryset=Airport.objects.only(
+                                "name", "closest_big_city"
+                            ),
+                        ),
+                    ),
+                ),
+            ],
+        ),
+    }
 
     def get_queryset(self):
-        queryset = self.queryset
+        queryset = self.get_planned_queryset()
 
         name = self.request.query_params.get("name")
 
-        if self.action != "destroy":
-            queryset = Country.objects.prefetch_related("cities")
-
         if name:
-            queryset = queryset.filter(name__icontains=name)
+            queryset = search_by_name(queryset, name=name)
 
         return queryset
 
@@ -109,6 +211,7 @@ class CountryView(
 
 
 class CityView(
+    QuerysetPlanMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -119,21 +222,35 @@ class CityView(
     pagination_class = FiveSizePagination
     permission_classes = [IsAdminOrIfAuthenticatedReadOnly, ]
 
+    queryset_plans = {
+        "list": QuerysetPlan(
+            select_related=["country"],
+            only=["name", "country__name"],
+        ),
+        "retrieve": QuerysetPlan(
+            select_related=["country"],
+            prefetch_related=[
+                Prefetch(
+                    "airports",
+                    queryset=Airport.objects.only("name", "closest_big_city"),
+                ),
+            ],
+        ),
+    }
+
     def get_queryset(self):
-        queryset = self.queryset
+        queryset = self.get_planned_queryset()
 
         name = self.request.query_params.get("name")
         country_ids = self.request.query_params.get("countries")
 
-        if self.action != "destroy":
-            queryset = City.objects.select_related("country")
-
         if name:
-            queryset = queryset.filter(name__icontains=name)
+            queryset = search_by_name(queryset, name=name)
 
         if country_ids:
-            country_ids = get_ids(country_ids)
-            queryset = queryset.filter(country__in=country_ids)
+            queryset = filter_by_ids(
+                queryset, "country", get_ids(country_ids, "countries")
+            )
 
         return queryset
 
@@ -168,6 +285,8 @@ class CityView(
 
 
 class AirportView(
+    QuerysetPlanMixin,
+    BatchRetrieveMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -178,28 +297,40 @@ class AirportView(
     pagination_class = FiveSizePagination
     permission_classes = [IsAdminOrIfAuthenticatedReadOnly, ]
 
+    queryset_plans = {
+        "list": QuerysetPlan(
+            select_related=["closest_big_city__country"],
+            only=[
+                "name",
+                "closest_big_city__name",
+                "closest_big_city__country__name",
+            ],
+        ),
+        "retrieve": AIRPORT_DETAIL_PLAN,
+        "batch": AIRPORT_DETAIL_PLAN,
+    }
+
     def get_queryset(self):
-        queryset = self.queryset
+        queryset = self.get_planned_queryset()
 
         name = self.request.query_params.get("name")
         country_ids = self.request.query_params.get("countries")
         city_ids = self.request.query_params.get("cities")
 
-        if self.action != "destroy":
-            queryset = Airport.objects.select_related(
-                "closest_big_city__country"
-            )
-
         if name:
-            queryset = queryset.filter(name__icontains=name)
+            queryset = search_by_name(queryset, name=name)
 
         if country_ids:
-            country_ids = get_ids(country_ids)
-            queryset = queryset.filter(closest_big_city__country__in=country_ids)
+            queryset = filter_by_ids(
+                queryset,
+                "closest_big_city__country",
+                get_ids(country_ids, "countries"),
+            )
 
         if city_ids:
-            city_ids = get_ids(city_ids)
-            queryset = queryset.filter(closest_big_city__in=city_ids)
+            queryset = filter_by_ids(
+                queryset, "closest_big_city", get_ids(city_ids, "cities")
+            )
 
         return queryset
 
@@ -208,7 +339,7 @@ class AirportView(
 
         if self.action == "list":
             serializer_class = AirportListSerializer
-        elif self.action == "retrieve":
+        elif self.action in ("retrieve", "batch"):
             serializer_class = AirportDetailSerializer
 
         return serializer_class
@@ -238,8 +369,124 @@ class AirportView(
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "lat",
+                type=float,
+                description="Latitude of the point (ex. ?lat=50.45)",
+                required=True,
+            ),
+            OpenApiParameter(
+                "lon",
+                type=float,
+                description="Longitude of the point (ex. ?lon=30.52)",
+                required=True,
+            ),
+            OpenApiParameter(
+                "limit",
+                type=int,
+                description="Number of airports, 5 by default "
+                            "(ex. ?limit=10)",
+                required=False,
+            ),
+        ]
+    )
+    @action(detail=False, methods=["GET"], url_path="nearest")
+    def nearest(self, request):
+        serializer = NearestAirportsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        nearest = get_airport_index().nearest(
+            latitude=serializer.validated_data["lat"],
+            longitude=serializer.validated_data["lon"],
+            limit=serializer.validated_data["limit"],
+        )
+        airports = Airport.objects.select_related(
+            "closest_big_city__country"
+        ).in_bulk([airport_id for airport_id, _ in nearest])
+
+        return Response([
+            {
+                **AirportListSerializer(airports[airport_id]).data,
+                "distance": round(distance, 1),
+            }
+            for airport_id, distance in nearest
+            if airport_id in airports
+        ])
+
+
+class AutocompleteView(APIView):
+    permission_classes = [IsAdminOrIfAuthenticatedReadOnly, ]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "q",
+                type=str,
+                description="Beginning of an airport, city or country name "
+                            "or of any word in it (ex. ?q=kyi)",
+                required=True,
+            ),
+            OpenApiParameter(
+                "limit",
+                type=int,
+                description="Number of matches, 10 by default "
+                            "(ex. ?limit=5)",
+                required=False,
+            ),
+            OpenApiParameter(
+                "types",
+                type={"type": "list", "items": {"type": "string"}},
+                description="Filter by types of matches "
+                            "(ex. ?types=airport,city)",
+                required=False,
+            ),
+        ],
+        responses=inline_serializer(
+            name="AutocompleteMatch",
+            fields={
+                "id": serializers.IntegerField(),
+                "type": serializers.ChoiceField(choices=AUTOCOMPLETE_MODELS),
+                "name": serializers.CharField(),
+            },
+            many=True,
+        ),
+    )
+    def get(self, request):
+        serializer = AutocompleteSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        return Response(
+            get_autocomplete_index().search(
+                query=serializer.validated_data["q"],
+                limit=serializer.validated_data["limit"],
+                kinds=serializer.validated_data.get("types"),
+            )
+        )
+
+
+class BatchView(APIView):
+    permission_classes = [IsAuthenticated, ]
+
+    @extend_schema(
+        request=BatchSerializer,
+        responses=OpenApiTypes.OBJECT,
+        description=f"Responses of up to {BATCH_MAX_REQUESTS} GET requests "
+                    f"of API urls, ex. "
+                    f"{{\"requests\": [\"/api/v1/airport/flights/1/\"]}}",
+    )
+    def post(self, request):
+        serializer = BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        return Response(
+            run_batch(request, serializer.validated_data["requests"])
+        )
+
 
 class RouteView(
+    QuerysetPlanMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -251,24 +498,32 @@ class RouteView(
     pagination_class = FiveSizePagination
     permission_classes = [IsAdminOrIfAuthenticatedReadOnly, ]
 
+    queryset_plans = {
+        "list": QuerysetPlan(
+            select_related=[
+                "source__closest_big_city",
+                "destination__closest_big_city",
+            ],
+        ),
+        "retrieve": QuerysetPlan(
+            select_related=[
+                "source__closest_big_city__country",
+                "destination__closest_big_city__country",
+            ],
+        ),
+    }
+
     def get_queryset(self):
-        queryset = self.queryset
+        queryset = self.get_planned_queryset()
 
         source = self.request.query_params.get("source")
         destination = self.request.query_params.get("destination")
 
-        if self.action != "destroy":
-            queryset = Route.objects.select_related(
-                "source__closest_big_city__country",
-                "destination__closest_big_city__country",
-            )
-        if source:
-            queryset = queryset.filter(source__name__icontains=source)
-
-        if destination:
-            queryset = queryset.filter(
-                destination__name__icontains=destination
-            )
+        queryset = search_by_name(
+            queryset,
+            source__name=source,
+            destination__name=destination,
+        )
 
         return queryset
 
@@ -303,6 +558,7 @@ class RouteView(
 
 
 class AirplaneTypeView(
+    QuerysetPlanMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -313,20 +569,29 @@ class AirplaneTypeView(
     pagination_class = FiveSizePagination
     permission_classes = [IsAdminOrIfAuthenticatedReadOnly, ]
 
+    queryset_plans = {
+        "list": QuerysetPlan(
+            prefetch_related=[
+                Prefetch(
+                    "airplanes",
+                    queryset=Airplane.objects.only("name", "airplane_type"),
+                ),
+            ],
+            annotations={"airplane_count": Count("airplanes")},
+        ),
+        "retrieve": QuerysetPlan(
+            prefetch_related=["airplanes"],
+            annotations={"airplane_count": Count("airplanes")},
+        ),
+    }
+
     def get_queryset(self):
-        queryset = self.queryset
+        queryset = self.get_planned_queryset()
 
         name = self.request.query_params.get("name")
 
-        if self.action != "destroy":
-            queryset = AirplaneType.objects.prefetch_related(
-                "airplanes"
-            ).annotate(
-                airplane_count=Count("airplanes")
-            )
-
         if name:
-            queryset = queryset.filter(name__icontains=name)
+            queryset = search_by_name(queryset, name=name)
 
         return queryset
 
@@ -355,6 +620,7 @@ class AirplaneTypeView(
 
 
 class AirplaneView(
+    QuerysetPlanMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -366,28 +632,51 @@ class AirplaneView(
     pagination_class = FiveSizePagination
     permission_classes = [IsAdminOrIfAuthenticatedReadOnly, ]
 
+    queryset_plans = {
+        "list": QuerysetPlan(select_related=["airplane_type"]),
+        "retrieve": QuerysetPlan(
+            select_related=["airplane_type"],
+            prefetch_related=[
+                Prefetch("flights", queryset=MINI_FLIGHT_QUERYSET),
+            ],
+        ),
+    }
+
     def get_queryset(self):
-        queryset = self.queryset
+        queryset = self.get_planned_queryset()
 
         name = self.request.query_params.get("name")
         airplane_type = self.request.query_params.get("airplane_type")
         capacity = self.request.query_params.get("capacity")
+        capacity_min = self.request.query_params.get("capacity_min")
+        capacity_max = self.request.query_params.get("capacity_max")
 
-        if self.action != "destroy":
-            queryset = Airplane.objects.select_related("airplane_type",)
+        queryset = search_by_name(
+            queryset,
+            name=name,
+            airplane_type__name=airplane_type,
+        )
 
-        if name:
-            queryset = queryset.filter(name__icontains=name)
+        capacity_field = serializers.IntegerField(min_value=0)
 
-        if airplane_type:
+        if capacity:
             queryset = queryset.filter(
-                airplane_type__name__icontains=airplane_type
+                airplane_capacity=capacity_field.run_validation(capacity)
             )
 
-        if capacity:
-            queryset = queryset.annotate(
-                capacity=F("rows") * F("seats_in_row")
-            ).filter(capacity=capacity)
+        if capacity_min:
+            queryset = queryset.filter(
+                airplane_capacity__gte=capacity_field.run_validation(
+                    capacity_min
+                )
+            )
+
+        if capacity_max:
+            queryset = queryset.filter(
+                airplane_capacity__lte=capacity_field.run_validation(
+                    capacity_max
+                )
+            )
 
         return queryset
 
@@ -421,7 +710,21 @@ class AirplaneView(
                 type=int,
                 description="Filter by capacity (ex. ?capacity=500)",
                 required=False,
-            )
+            ),
+            OpenApiParameter(
+                "capacity_min",
+                type=int,
+                description="Filter by minimal capacity "
+                            "(ex. ?capacity_min=100)",
+                required=False,
+            ),
+            OpenApiParameter(
+                "capacity_max",
+                type=int,
+                description="Filter by maximal capacity "
+                            "(ex. ?capacity_max=300)",
+                required=False,
+            ),
         ]
     )
     def list(self, request, *args, **kwargs):
@@ -429,6 +732,7 @@ class AirplaneView(
 
 
 class CrewView(
+    QuerysetPlanMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -440,20 +744,25 @@ class CrewView(
     pagination_class = TenSizePagination
     permission_classes = [IsAdminOrIfAuthenticatedReadOnly, ]
 
+    queryset_plans = {
+        "retrieve": QuerysetPlan(
+            prefetch_related=[
+                Prefetch("flights", queryset=MINI_FLIGHT_QUERYSET),
+            ],
+        ),
+    }
+
     def get_queryset(self):
-        queryset = self.queryset
+        queryset = self.get_planned_queryset()
 
         first_name = self.request.query_params.get("first_name")
         last_name = self.request.query_params.get("last_name")
 
-        if self.action != "destroy":
-            queryset = Crew.objects.prefetch_related("flights",)
-
-        if first_name:
-            queryset = queryset.filter(first_name__icontains=first_name)
-
-        if last_name:
-            queryset = queryset.filter(last_name__icontains=last_name)
+        queryset = search_by_name(
+            queryset,
+            first_name=first_name,
+            last_name=last_name,
+        )
 
         return queryset
 
@@ -464,6 +773,8 @@ class CrewView(
             serializer_class = CrewListSerializer
         elif self.action == "retrieve":
             serializer_class = CrewDetailSerializer
+        elif self.action == "roster":
+            serializer_class = RosterSerializer
 
         return serializer_class
 
@@ -486,8 +797,34 @@ class CrewView(
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
+    @action(detail=False, methods=["POST"], url_path="roster")
+    def roster(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        dry_run = serializer.validated_data.pop("dry_run")
+        assignments, unstaffed = plan_roster(**serializer.validated_data)
+
+        if not dry_run:
+            save_roster(assignments)
+
+        return Response(
+            {
+                "assigned": len(assignments),
+                "assignments": [
+                    {"flight": flight_id, "crew": crew_ids}
+                    for flight_id, crew_ids in assignments
+                ],
+                "unstaffed": unstaffed,
+                "dry_run": dry_run,
+            },
+            status=status.HTTP_200_OK if dry_run else status.HTTP_201_CREATED
+        )
+
 
 class FlightView(
+    QuerysetPlanMixin,
+    BatchRetrieveMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -498,50 +835,36 @@ class FlightView(
     serializer_class = FlightSerializer
     pagination_class = TwoSizePagination
     permission_classes = [IsAdminOrIfAuthenticatedReadOnly, ]
+    throttle_scopes = {"list": "flight_search"}
+
+    queryset_plans = {
+        "list": QuerysetPlan(
+            select_related=[
+                "route__source__closest_big_city",
+                "route__destination__closest_big_city",
+                "airplane",
+            ],
+            prefetch_related=["crew"],
+            annotations={"tickets_available": TICKETS_AVAILABLE},
+        ),
+        "retrieve": FLIGHT_DETAIL_PLAN,
+        "batch": FLIGHT_DETAIL_PLAN,
+    }
 
     def get_queryset(self):
-        queryset = self.queryset
-
-        departure_date = self.request.query_params.get("departure_date")
-        arrival_date = self.request.query_params.get("arrival_date")
-        to_city = self.request.query_params.get("to")
-        from_city = self.request.query_params.get("from")
-
-        if self.action != "destroy":
-            queryset = Flight.objects.prefetch_related("crew").select_related(
-                "route__destination__closest_big_city__country",
-                "route__source__closest_big_city__country",
-                "airplane__airplane_type").annotate(
-                tickets_available=(F("airplane__rows")
-                                   * F("airplane__seats_in_row")
-                                   - Count("tickets"))
-            )
-
-        if departure_date:
-            queryset = queryset.filter(departure_time__date=departure_date)
-
-        if arrival_date:
-            queryset = queryset.filter(arrival_time__date=arrival_date)
-
-        if to_city:
-            queryset = queryset.filter(
-                route__destination__closest_big_city_id=to_city
-            )
-
-        if from_city:
-            queryset = queryset.filter(
-                route__source__closest_big_city_id=from_city
-            )
+        queryset = self.get_planned_queryset()
 
-        return queryset
+        return filter_flights(queryset, self.request.query_params)
 
     def get_serializer_class(self):
         serializer_class = self.serializer_class
 
         if self.action == "list":
             serializer_class = FlightListSerializer
-        elif self.action == "retrieve":
+        elif self.action in ("retrieve", "batch"):
             serializer_class = FlightDetailSerializer
+        elif self.action == "schedule":
+            serializer_class = FlightScheduleSerializer
 
         return serializer_class
 
@@ -573,6 +896,184 @@ class FlightView(
                 description="Filter by source city (ex. ?from=1)",
                 required=False,
             ),
+            OpenApiParameter(
+                "radius",
+                type=int,
+                description="Include airports within radius km "
+                            "of the from/to city airports (ex. ?radius=150)",
+                required=False,
+            ),
+            OpenApiParameter(
+                "ordering",
+                type=str,
+                enum=list(FLIGHT_ORDERING),
+                description="Sort flights (ex. ?ordering=-duration)",
+                required=False,
+            ),
+        ]
+    )
+    def list(self, request, *args, **kwargs):
+        search_key = get_flight_search_key(
+            request.query_params, self.paginator.page_query_param
+        )
+
+        if search_key is None:
+            return super().list(request, *args, **kwargs)
+
+        flights = get_cached_flight_search(
+            search_key,
+            lambda: self.get_serializer(
+                self.filter_queryset(self.get_queryset()), many=True
+            ).data
+        )
+        page = self.paginate_queryset(flights)
+
+        return self.get_paginated_response(with_tickets_available(page))
+
+    @extend_schema(
+        description=f"Lowest fare per day for the next "
+                    f"{FARE_CALENDAR_DAYS} days, days without "
+                    f"fares are skipped",
+        parameters=[
+            OpenApiParameter(
+                "from",
+                type=int,
+                description="Source city (ex. ?from=1)",
+                required=True,
+            ),
+            OpenApiParameter(
+                "to",
+                type=int,
+                description="Destination city (ex. ?to=2)",
+                required=True,
+            ),
+        ]
+    )
+    @action(detail=False, methods=["GET"], url_path="fare_calendar")
+    def fare_calendar(self, request):
+        serializer = FareCalendarSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        return Response(
+            get_fare_calendar(
+                from_city=serializer.validated_data["from"].id,
+                to_city=serializer.validated_data["to"].id,
+            )
+        )
+
+    @action(detail=False, methods=["POST"], url_path="schedule")
+    def schedule(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        flights, skipped = create_scheduled_flights(
+            **serializer.validated_data
+        )
+
+        return Response(
+            {"created": len(flights), "skipped": skipped},
+            status=status.HTTP_201_CREATED
+        )
+
+
+class FareClassView(
+    QuerysetPlanMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.CreateModelMixin,
+    mixins.UpdateModelMixin,
+    viewsets.GenericViewSet,
+):
+    queryset = FareClass.objects.all()
+    serializer_class = FareClassSerializer
+    pagination_class = TenSizePagination
+    permission_classes = [IsAdminOrIfAuthenticatedReadOnly, ]
+
+    queryset_plans = {
+        "list": QuerysetPlan(select_related=["airplane"]),
+        "retrieve": QuerysetPlan(select_related=["airplane"]),
+    }
+
+    def get_queryset(self):
+        queryset = self.get_planned_queryset()
+
+        airplane_ids = self.request.query_params.get("airplanes")
+
+        if airplane_ids:
+            queryset = filter_by_ids(
+                queryset, "airplane", get_ids(airplane_ids, "airplanes")
+            )
+
+        return queryset
+
+    def get_serializer_class(self):
+        serializer_class = self.serializer_class
+
+        if self.action in ("list", "retrieve"):
+            serializer_class = FareClassListSerializer
+
+        return serializer_class
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "airplanes",
+                type={"type": "list", "items": {"type": "number"}},
+                description="Filter by airplanes id (ex. ?airplanes=1,2)",
+                required=False,
+            ),
+        ]
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+class FareView(
+    QuerysetPlanMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.CreateModelMixin,
+    mixins.UpdateModelMixin,
+    viewsets.GenericViewSet,
+):
+    queryset = Fare.objects.all()
+    serializer_class = FareSerializer
+    pagination_class = TenSizePagination
+    permission_classes = [IsAdminOrIfAuthenticatedReadOnly, ]
+
+    queryset_plans = {
+        "list": QuerysetPlan(select_related=["fare_class"]),
+        "retrieve": QuerysetPlan(select_related=["fare_class"]),
+    }
+
+    def get_queryset(self):
+        queryset = self.get_planned_queryset()
+
+        flight_ids = self.request.query_params.get("flights")
+
+        if flight_ids:
+            queryset = filter_by_ids(
+                queryset, "flight", get_ids(flight_ids, "flights")
+            )
+
+        return queryset
+
+    def get_serializer_class(self):
+        serializer_class = self.serializer_class
+
+        if self.action in ("list", "retrieve"):
+            serializer_class = FareListSerializer
+
+        return serializer_class
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "flights",
+                type={"type": "list", "items": {"type": "number"}},
+                description="Filter by flights id (ex. ?flights=1,3)",
+                required=False,
+            ),
         ]
     )
     def list(self, request, *args, **kwargs):
@@ -580,6 +1081,7 @@ class FlightView(
 
 
 class OrderView(
+    QuerysetPlanMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -587,8 +1089,22 @@ class OrderView(
 ):
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
-    pagination_class = TwoSizePagination
+    pagination_class = OrderHistoryPagination
     permission_classes = [IsAuthenticated, ]
+    throttle_scopes = {"create": "orders"}
+    queryset_plans = {
+        "list": QuerysetPlan(select_related=["summary"]),
+        "retrieve": QuerysetPlan(
+            prefetch_related=[
+                Prefetch(
+                    "tickets",
+                    queryset=Ticket.objects.select_related(
+                        *TICKET_FLIGHT_RELATED_FIELDS
+                    ),
+                ),
+            ],
+        ),
+    }
 
     def get_serializer_class(self):
         serializer_class = self.serializer_class
@@ -601,43 +1117,125 @@ class OrderView(
         return serializer_class
 
     def get_queryset(self):
-        queryset = self.queryset
+        queryset = self.get_planned_queryset()
 
+        date_from = self.request.query_params.get("date_from")
+        date_to = self.request.query_params.get("date_to")
         created_at_date = self.request.query_params.get("date")
 
-        if self.action != "destroy":
-            queryset = Order.objects.prefetch_related(
-                "tickets__flight__route__destination"
-                "__closest_big_city__country",
-                "tickets__flight__route__source"
-                "__closest_big_city__country",
-                "tickets__flight__airplane__airplane_type"
-            )
+        if created_at_date and (date_from or date_to):
+            raise serializers.ValidationError({
+                "date": "date can't be combined with date_from or date_to"
+            })
 
+        # day boundaries instead of created_at__date keep the
+        # (user, created_at) index usable
         if created_at_date:
-            queryset = queryset.filter(created_at__date=created_at_date)
+            day_start = get_day_start("date", created_at_date)
+            queryset = queryset.filter(
+                created_at__gte=day_start,
+                created_at__lt=day_start + timedelta(days=1),
+            )
+
+        if date_from:
+            queryset = queryset.filter(
+                created_at__gte=get_day_start("date_from", date_from)
+            )
 
-        return queryset.filter(user=self.request.user)
+        if date_to:
+            queryset = queryset.filter(
+                created_at__lt=get_day_start("date_to", date_to)
+                + timedelta(days=1)
+            )
+
+        return queryset.filter(user_id=self.request.user.id)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        serializer.save(user=get_request_user(self.request))
 
     @extend_schema(
         parameters=[
             OpenApiParameter(
                 "date",
                 type=datetime,
-                description="Filter by created date "
+                description="Filter by created date, not combined with "
+                            "date_from and date_to "
                             "(ex. ?date=year-month-day)",
                 required=False,
             ),
+            OpenApiParameter(
+                "date_from",
+                type=datetime,
+                description="Filter by orders created from date "
+                            "(ex. ?date_from=year-month-day)",
+                required=False,
+            ),
+            OpenApiParameter(
+                "date_to",
+                type=datetime,
+                description="Filter by orders created to date inclusive "
+                            "(ex. ?date_to=year-month-day)",
+                required=False,
+            ),
         ]
     )
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "date_from",
+                type=datetime,
+                description="Export orders created from date "
+                            "(ex. ?date_from=year-month-day)",
+                required=True,
+            ),
+            OpenApiParameter(
+                "date_to",
+                type=datetime,
+                description="Export orders created to date inclusive "
+                            "(ex. ?date_to=year-month-day)",
+                required=True,
+            ),
+            OpenApiParameter(
+                "export_format",
+                type=str,
+                description="Export format: csv or ndjson "
+                            "(ex. ?export_format=ndjson)",
+                required=False,
+            ),
+        ]
+    )
+    @action(
+        detail=False,
+        methods=["GET"],
+        url_path="export",
+        permission_classes=[IsAdminUser],
+    )
+    def export(self, request):
+        date_from = get_day_start(
+            "date_from", request.query_params.get("date_from")
+        )
+        date_to = get_day_start(
+            "date_to", request.query_params.get("date_to")
+        ) + timedelta(days=1)
+
+        queryset = Order.objects.filter(
+            created_at__gte=date_from,
+            created_at__lt=date_to,
+        ).annotate(tickets_count=Count("tickets"))
+
+        return stream_export(
+            queryset=queryset,
+            fields=ORDER_EXPORT_FIELDS,
+            export_format=request.query_params.get("export_format", "csv"),
+            filename="orders",
+        )
+
 
 class TicketView(
+    QuerysetPlanMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -648,22 +1246,22 @@ class TicketView(
     pagination_class = FiveSizePagination
     permission_classes = [IsAuthenticated, ]
 
+    queryset_plans = {
+        "list": QuerysetPlan(select_related=TICKET_FLIGHT_RELATED_FIELDS),
+        "retrieve": QuerysetPlan(
+            select_related=TICKET_FLIGHT_RELATED_FIELDS
+        ),
+    }
+
     def get_queryset(self):
-        queryset = self.queryset
+        queryset = self.get_planned_queryset()
 
         flight_ids = self.request.query_params.get("flights")
 
-        if self.action != "destroy":
-            queryset = Ticket.objects.select_related(
-                "order",
-                "flight__route__destination__closest_big_city__country",
-                "flight__route__source__closest_big_city__country",
-                "flight__airplane__airplane_type"
-            )
-
         if flight_ids:
-            flight_ids = get_ids(flight_ids)
-            queryset = queryset.filter(flight__in=flight_ids)
+            queryset = filter_by_ids(
+                queryset, "flight", get_ids(flight_ids, "flights")
+            )
 
         return queryset
 
@@ -690,7 +1288,121 @@ class TicketView(
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "flights",
+                type={"type": "list", "items": {"type": "number"}},
+                description="Export tickets of flights id "
+                            "(ex. ?flights=1,3)",
+                required=True,
+            ),
+            OpenApiParameter(
+                "export_format",
+                type=str,
+                description="Export format: csv or ndjson "
+                            "(ex. ?export_format=ndjson)",
+                required=False,
+            ),
+        ]
+    )
+    @action(
+        detail=False,
+        methods=["GET"],
+        url_path="export",
+        permission_classes=[IsAdminUser],
+    )
+    def export(self, request):
+        flight_ids = request.query_params.get("flights")
+
+        if not flight_ids:
+            raise serializers.ValidationError({
+                "flights": "At least one flight id is required"
+            })
+
+        queryset = filter_by_ids(
+            Ticket.objects.all(), "flight", get_ids(flight_ids, "flights")
+        ).order_by("flight_id", "row", "seat")
+
+        return stream_export(
+            queryset=queryset,
+            fields=TICKET_EXPORT_FIELDS,
+            export_format=request.query_params.get("export_format", "csv"),
+            filename="tickets",
+        )
+
 
 class TakenTicketsView(viewsets.ModelViewSet):
     queryset = Ticket.objects.filter(order__isnull=False)
     serializer_class = TakenTicketsSerializer
+
+
+class AnalyticsView(viewsets.GenericViewSet):
+    serializer_class = AnalyticsSerializer
+    permission_classes = [IsAdminUser, ]
+
+    def get_stats(self, request, get_stats_rows):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        return Response(get_stats_rows(**serializer.validated_data))
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "date_from",
+                type=datetime,
+                description="First departure day "
+                            "(ex. ?date_from=year-month-day)",
+                required=True,
+            ),
+            OpenApiParameter(
+                "date_to",
+                type=datetime,
+                description="Last departure day "
+                            "(ex. ?date_to=year-month-day)",
+                required=True,
+            ),
+            OpenApiParameter(
+                "group_by",
+                type=str,
+                enum=list(ANALYTICS_GROUPS),
+                description="Group by route, airplane type or date, "
+                            "route by default (ex. ?group_by=date)",
+                required=False,
+            ),
+        ]
+    )
+    @action(detail=False, methods=["GET"], url_path="load_factor")
+    def load_factor(self, request):
+        return self.get_stats(request, get_load_factors)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "date_from",
+                type=datetime,
+                description="First departure day "
+                            "(ex. ?date_from=year-month-day)",
+                required=True,
+            ),
+            OpenApiParameter(
+                "date_to",
+                type=datetime,
+                description="Last departure day "
+                            "(ex. ?date_to=year-month-day)",
+                required=True,
+            ),
+            OpenApiParameter(
+                "group_by",
+                type=str,
+                enum=list(ANALYTICS_GROUPS),
+                description="Group by route, airplane type or date, "
+                            "route by default (ex. ?group_by=date)",
+                required=False,
+            ),
+        ]
+    )
+    @action(detail=False, methods=["GET"], url_path="revenue")
+    def revenue(self, request):
+        return self.get_stats(request, get_revenue)
@@ -0,0 +1,66 @@
+import uuid
+
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.connection import ConnectionProxy
+
+SHARED_CACHE_ALIAS = "shared"
+
+# the cache every worker process sees, see SHARED_CACHE in settings
+shared_cache = ConnectionProxy(caches, SHARED_CACHE_ALIAS)
+
+
+class VersionedIndex:
+    """
+    Index built in each process from the database,
+    built again when its version in the shared cache changes
+    """
+
+    def __init__(self, version_key: str, build):
+        self.version_key = version_key
+        self.build = build
+        self.index = None
+        self.version = None
+
+    def get_version(self) -> str:
+        return shared_cache.get_or_set(
+            self.version_key, lambda: uuid.uuid4().hex, None
+        )
+
+    def set_version(self) -> str:
+        version = uuid.uuid4().hex
+        shared_cache.set(self.version_key, version, None)
+
+        return version
+
+    def get(self):
+        version = self.get_version()
+
+        if self.index is None or self.version != version:
+            self.index = self.build()
+            self.version = version
+
+        return self.index
+
+    def invalidate(self):
+        # once committed, so no process rebuilds from the rows being written
+        transaction.on_commit(self.set_version)
+
+    def update(self, change):
+        """
+        Once committed, apply the change to the index of this process
+        and make the other processes build theirs again
+        """
+
+        def update():
+            is_current = (
+                self.index is not None
+                and self.version == self.get_version()
+            )
+            version = self.set_version()
+
+            if is_current:
+                change(self.index)
+                self.version = version
+
+        transaction.on_commit(update)
@@ -32,6 +32,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 
     "debug_toolbar",
     "rest_framework",
@@ -85,6 +86,24 @@ DATABASES = {
     }
 }
 
+# the first hasher makes new hashes, the others still verify old ones
+PASSWORD_HASHERS = [
+    "user.hashers.TunedArgon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
+
+if os.environ.get("PASSWORD_HASHER") == "pbkdf2":
+    PASSWORD_HASHERS.insert(0, PASSWORD_HASHERS.pop(1))
+
+ARGON2_TIME_COST = int(os.environ.get("ARGON2_TIME_COST", 2))
+ARGON2_MEMORY_COST = int(os.environ.get("ARGON2_MEMORY_COST", 19 * 1024))
+ARGON2_PARALLELISM = int(os.environ.get("ARGON2_PARALLELISM", 1))
+
+# "thread" or "process" hashes passwords in a pool of that many workers
+PASSWORD_HASHING_POOL = os.environ.get("PASSWORD_HASHING_POOL", "")
+PASSWORD_HASHING_WORKERS = int(os.environ.get("PASSWORD_HASHING_WORKERS", 0))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -100,6 +119,26 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# state every worker reads and writes (index versions, counters...),
+# without REDIS_URL it stays in memory, right only for a single process
+if os.environ.get("REDIS_URL"):
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ["REDIS_URL"],
+    }
+else:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "shared",
+    }
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "shared": SHARED_CACHE,
+}
+
 AUTH_USER_MODEL = "user.User"
 
 LANGUAGE_CODE = "en-us"
@@ -123,16 +162,19 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "user.authentication.CachedProfileJWTAuthentication",
     ),
 
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle"
+        "user.throttling.AnonSlidingWindowThrottle",
+        "user.throttling.UserSlidingWindowThrottle",
+        "user.throttling.ActionScopedSlidingWindowThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": "10/minute",
-        "user": "30/minute"
+        "user": "30/minute",
+        "flight_search": "20/minute",
+        "orders": "10/minute",
     }
 }
 
@@ -140,4 +182,8 @@ SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "ROTATE_REFRESH_TOKENS": True,
+    "TOKEN_OBTAIN_SERIALIZER": (
+        "user.serializers.TokenObtainPairWithClaimsSerializer"
+    ),
+    "TOKEN_USER_CLASS": "user.authentication.ClaimsTokenUser",
 }
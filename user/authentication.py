@@ -0,0 +1,98 @@
+from django.contrib.auth import get_user_model
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import (
+    JWTStatelessUserAuthentication,
+)
+from rest_framework_simplejwt.models import TokenUser
+
+from user.profiles import aget_user_profile, get_user_profile
+
+
+class ClaimsTokenUser(TokenUser):
+    """
+    User built from the id, email and is_staff claims of the token,
+    once its profile is set, from the profile, which sees role changes
+    made after the token was issued
+    """
+
+    profile = None
+
+    def get_field(self, name: str, default):
+        if self.profile is not None:
+            return self.profile[name]
+
+        return self.token.get(name, default)
+
+    @cached_property
+    def email(self) -> str:
+        return self.get_field("email", "")
+
+    @cached_property
+    def is_staff(self) -> bool:
+        return self.get_field("is_staff", False)
+
+    @cached_property
+    def is_superuser(self) -> bool:
+        return self.get_field("is_superuser", False)
+
+
+def set_user_profile(token_user, profile) -> ClaimsTokenUser:
+    if profile is None:
+        raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+    if not profile["is_active"]:
+        raise AuthenticationFailed(
+            _("User is inactive"), code="user_inactive"
+        )
+
+    token_user.profile = profile
+
+    return token_user
+
+
+class CachedProfileJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    The claims token user of JWTStatelessUserAuthentication
+    checked against the cached profile of the user,
+    authenticated requests make no user query
+    """
+
+    def get_user(self, validated_token):
+        token_user = super().get_user(validated_token)
+
+        return set_user_profile(token_user, get_user_profile(token_user.id))
+
+    async def aauthenticate(self, request):
+        """authenticate for async Django views"""
+        header = self.get_header(request)
+        raw_token = self.get_raw_token(header) if header else None
+
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        token_user = super().get_user(validated_token)
+        profile = await aget_user_profile(token_user.id)
+
+        return set_user_profile(token_user, profile), validated_token
+
+
+class CachedProfileJWTScheme(SimpleJWTScheme):
+    target_class = CachedProfileJWTAuthentication
+
+
+def get_request_user(request):
+    """The User row of the request user, loaded once per request"""
+    if isinstance(request.user, TokenUser):
+        try:
+            request.user = get_user_model().objects.get(pk=request.user.id)
+        except get_user_model().DoesNotExist:
+            # deleted after its profile was read
+            raise AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            )
+
+    return request.user
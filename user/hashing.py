@@ -0,0 +1,72 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    check_password,
+    get_hasher,
+    identify_hasher,
+    make_password,
+)
+
+HASHING_POOLS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+_executors = {}
+
+
+def get_hashing_executor():
+    """
+    Pool of the PASSWORD_HASHING_POOL setting, None to hash in the
+    request thread; its workers bound the CPUs a signup burst can take
+    """
+    pool = settings.PASSWORD_HASHING_POOL
+
+    if not pool:
+        return None
+
+    workers = settings.PASSWORD_HASHING_WORKERS or os.cpu_count()
+
+    if (pool, workers) not in _executors:
+        _executors[pool, workers] = HASHING_POOLS[pool](max_workers=workers)
+
+    return _executors[pool, workers]
+
+
+def run_hashing(function, *args):
+    executor = get_hashing_executor()
+
+    if executor is None:
+        return function(*args)
+
+    return executor.submit(function, *args).result()
+
+
+def hash_password(password: str) -> str:
+    return run_hashing(make_password, password)
+
+
+def password_must_update(encoded: str) -> bool:
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+
+    preferred = get_hasher()
+
+    return (
+        hasher.algorithm != preferred.algorithm
+        or preferred.must_update(encoded)
+    )
+
+
+def verify_password(password: str, encoded: str, setter=None) -> bool:
+    """check_password with the hashing done by the pool"""
+    is_correct = run_hashing(check_password, password, encoded)
+
+    if setter and is_correct and password_must_update(encoded):
+        setter(password)
+
+    return is_correct
@@ -0,0 +1,70 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.utils.module_loading import import_string
+
+BENCHMARK_PASSWORD = "benchmark-password-123"
+
+
+def count_logins(hasher_path: str, encoded: str, seconds: float) -> int:
+    """Password checks of one hash a single core makes in the given time"""
+    hasher = import_string(hasher_path)()
+    logins = 0
+    deadline = time.perf_counter() + seconds
+
+    while time.perf_counter() < deadline:
+        hasher.verify(BENCHMARK_PASSWORD, encoded)
+        logins += 1
+
+    return logins
+
+
+class Command(BaseCommand):
+    """Django command to measure the logins per second of each hasher"""
+
+    help = "Time password checks of the configured hashers per core and pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seconds", type=float, default=3)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Processes checking passwords at once",
+        )
+        parser.add_argument(
+            "--hashers",
+            nargs="+",
+            default=settings.PASSWORD_HASHERS,
+            help="Hasher class paths, PASSWORD_HASHERS by default",
+        )
+
+    def handle(self, *args, **options):
+        seconds = options["seconds"]
+        workers = options["workers"]
+
+        for hasher_path in options["hashers"]:
+            hasher = import_string(hasher_path)()
+            encoded = hasher.encode(BENCHMARK_PASSWORD, hasher.salt())
+            per_core = count_logins(hasher_path, encoded, seconds) / seconds
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                total = sum(executor.map(
+                    count_logins,
+                    [hasher_path] * workers,
+                    [encoded] * workers,
+                    [seconds] * workers,
+                )) / seconds
+
+            preferred = (
+                " (preferred)"
+                if hasher_path == settings.PASSWORD_HASHERS[0] else ""
+            )
+            self.stdout.write(
+                f"{hasher_path}{preferred}: "
+                f"{per_core:.1f} logins/s on one core, "
+                f"{total:.1f} logins/s on {workers} workers"
+            )
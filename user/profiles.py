@@ -0,0 +1,54 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from airport_api_service.caches import shared_cache
+
+USER_PROFILE_KEY = "user_profile:{user_id}"
+USER_PROFILE_TIMEOUT = 60 * 5
+
+USER_PROFILE_FIELDS = ("id", "email", "is_staff", "is_superuser", "is_active")
+
+
+def get_user_profile_queryset(user_id: int):
+    return get_user_model().objects.filter(id=user_id).values(
+        *USER_PROFILE_FIELDS
+    )
+
+
+def get_user_profile(user_id: int):
+    """
+    Fields the auth and permission checks read, None for unknown users,
+    cached for all processes, unknown users as False
+    """
+    key = USER_PROFILE_KEY.format(user_id=user_id)
+    profile = shared_cache.get(key)
+
+    if profile is None:
+        profile = get_user_profile_queryset(user_id).first() or False
+        # add, so a profile stored by a committed user write wins
+        shared_cache.add(key, profile, USER_PROFILE_TIMEOUT)
+
+    return profile or None
+
+
+async def aget_user_profile(user_id: int):
+    """get_user_profile for async views"""
+    key = USER_PROFILE_KEY.format(user_id=user_id)
+    profile = await shared_cache.aget(key)
+
+    if profile is None:
+        profile = await get_user_profile_queryset(user_id).afirst() or False
+        await shared_cache.aadd(key, profile, USER_PROFILE_TIMEOUT)
+
+    return profile or None
+
+
+def invalidate_user_profile(user_id: int):
+    """Once the user write commits, store its profile for all processes"""
+    key = USER_PROFILE_KEY.format(user_id=user_id)
+
+    def store():
+        profile = get_user_profile_queryset(user_id).first() or False
+        shared_cache.set(key, profile, USER_PROFILE_TIMEOUT)
+
+    transaction.on_commit(store)
@@ -0,0 +1,140 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from airport.models import Country
+from airport.tests.caches import as_other_worker, clear_caches
+
+TOKEN_URL = reverse("user:token_obtain_pair")
+TOKEN_REFRESH_URL = reverse("user:token_refresh")
+MANAGE_URL = reverse("user:manage")
+COUNTRY_URL = reverse("airport:country-list")
+ORDER_URL = reverse("airport:order-list")
+
+
+class CachedProfileJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="user@user.com",
+            password="user123456",
+        )
+        Country.objects.create(name="Ukraine")
+
+    def authenticate(self, email: str, password: str) -> dict:
+        request = self.client.post(
+            TOKEN_URL, {"email": email, "password": password}
+        )
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {request.data['access']}"
+        )
+
+        return request.data
+
+    def get_user_queries(self, method, url: str) -> tuple:
+        with CaptureQueriesContext(connection) as queries:
+            request = method(url)
+
+        return request, [
+            query["sql"] for query in queries.captured_queries
+            if get_user_model()._meta.db_table in query["sql"]
+        ]
+
+    def test_authenticated_requests_skip_user_query(self):
+        self.authenticate("user@user.com", "user123456")
+        self.client.get(COUNTRY_URL)
+
+        for method, url in (
+            (self.client.get, COUNTRY_URL),
+            (self.client.get, MANAGE_URL),
+            (self.client.post, ORDER_URL),
+        ):
+            request, user_queries = self.get_user_queries(method, url)
+
+            self.assertNotEqual(
+                request.status_code, status.HTTP_401_UNAUTHORIZED
+            )
+            self.assertEqual(user_queries, [])
+
+    def test_deactivated_user_is_rejected(self):
+        self.authenticate("user@user.com", "user123456")
+        self.client.get(COUNTRY_URL)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        self.assertEqual(
+            self.client.get(COUNTRY_URL).status_code,
+            status.HTTP_401_UNAUTHORIZED
+        )
+
+    def test_deactivation_applies_in_other_workers(self):
+        self.authenticate("user@user.com", "user123456")
+        self.client.get(COUNTRY_URL)
+
+        with as_other_worker(), self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        self.assertEqual(
+            self.client.get(COUNTRY_URL).status_code,
+            status.HTTP_401_UNAUTHORIZED
+        )
+
+    def test_user_deleted_after_profile_read_is_rejected(self):
+        self.authenticate("user@user.com", "user123456")
+        self.client.get(MANAGE_URL)
+
+        # the profile stays cached until the delete commits
+        self.user.delete()
+
+        self.assertEqual(
+            self.client.patch(MANAGE_URL, {"email": "new@user.com"}).status_code,
+            status.HTTP_401_UNAUTHORIZED
+        )
+
+    def test_staff_change_applies_to_issued_token(self):
+        self.authenticate("user@user.com", "user123456")
+
+        self.assertEqual(
+            self.client.post(COUNTRY_URL, {"name": "Italy"}).status_code,
+            status.HTTP_403_FORBIDDEN
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_staff = True
+            self.user.save()
+
+        self.assertEqual(
+            self.client.post(COUNTRY_URL, {"name": "Italy"}).status_code,
+            status.HTTP_201_CREATED
+        )
+
+    def test_refreshed_token_user(self):
+        tokens = self.authenticate("user@user.com", "user123456")
+        request = self.client.post(
+            TOKEN_REFRESH_URL, {"refresh": tokens["refresh"]}
+        )
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {request.data['access']}"
+        )
+
+        request = self.client.get(MANAGE_URL)
+
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            (request.data["id"], request.data["email"]),
+            (self.user.id, "user@user.com")
+        )
+        self.assertEqual(
+            self.client.get(ORDER_URL).status_code, status.HTTP_200_OK
+        )
@@ -0,0 +1,88 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from airport.tests.caches import clear_caches
+from user.hashing import get_hashing_executor
+
+REGISTER_URL = reverse("user:create")
+TOKEN_URL = reverse("user:token_obtain_pair")
+
+
+class PasswordHashingTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+        self.client = APIClient()
+
+    def register_and_login(self, email: str) -> str:
+        request = self.client.post(
+            REGISTER_URL, {"email": email, "password": "user123456"}
+        )
+        self.assertEqual(request.status_code, status.HTTP_201_CREATED)
+
+        request = self.client.post(
+            TOKEN_URL, {"email": email, "password": "user123456"}
+        )
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+
+        return get_user_model().objects.get(email=email).password
+
+    def test_new_passwords_use_tuned_argon2(self):
+        encoded = self.register_and_login("user@user.com")
+
+        self.assertTrue(encoded.startswith("argon2$argon2id$"))
+        self.assertIn("m=19456,t=2,p=1", encoded)
+
+    def test_pbkdf2_password_is_upgraded_on_login(self):
+        user = get_user_model().objects.create(
+            email="user@user.com",
+            password=make_password(
+                "user123456",
+                hasher="pbkdf2_sha256",
+            ),
+        )
+
+        request = self.client.post(
+            TOKEN_URL, {"email": "user@user.com", "password": "user123456"}
+        )
+
+        self.assertEqual(request.status_code, status.HTTP_200_OK)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith("argon2$"))
+        self.assertTrue(user.check_password("user123456"))
+
+    @override_settings(
+        PASSWORD_HASHING_POOL="thread", PASSWORD_HASHING_WORKERS=2
+    )
+    def test_hashing_in_pool(self):
+        self.assertIsNotNone(get_hashing_executor())
+
+        encoded = self.register_and_login("user@user.com")
+
+        self.assertTrue(encoded.startswith("argon2$"))
+        self.assertEqual(
+            self.client.post(
+                TOKEN_URL, {"email": "user@user.com", "password": "wrong"}
+            ).status_code,
+            status.HTTP_401_UNAUTHORIZED
+        )
+
+    def test_benchmark_hashers(self):
+        out = StringIO()
+
+        call_command(
+            "benchmark_hashers",
+            seconds=0.05,
+            workers=1,
+            hashers=["user.hashers.TunedArgon2PasswordHasher"],
+            stdout=out,
+        )
+
+        self.assertIn("logins/s on one core", out.getvalue())
@@ -0,0 +1,88 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory
+
+from airport.tests.caches import as_other_worker, clear_caches
+from user.throttling import UserSlidingWindowThrottle
+
+ORDER_URL = reverse("airport:order-list")
+FLIGHT_URL = reverse("airport:flight-list")
+
+
+class SlidingWindowThrottleTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+        self.request = APIRequestFactory().get("/")
+        self.request.user = get_user_model().objects.create_user(
+            email="user@user.com",
+            password="user123456",
+        )
+
+    def allow_at(self, now: float) -> bool:
+        throttle = UserSlidingWindowThrottle()
+        throttle.num_requests, throttle.duration = 4, 60
+
+        with mock.patch.object(throttle, "timer", return_value=now):
+            return throttle.allow_request(self.request, None)
+
+    def test_limit_within_window(self):
+        self.assertEqual(
+            [self.allow_at(60 + second) for second in range(5)],
+            [True, True, True, True, False]
+        )
+
+    def test_previous_window_is_weighted(self):
+        for _ in range(4):
+            self.allow_at(60)
+
+        # a quarter into the next window 3 of the previous 4 still count
+        self.assertEqual(
+            [self.allow_at(135), self.allow_at(135)],
+            [True, False]
+        )
+        # three quarters in only 1 counts
+        self.assertTrue(self.allow_at(165))
+
+    def test_workers_share_counts_without_queries(self):
+        with self.assertNumQueries(0):
+            for _ in range(2):
+                self.allow_at(60)
+
+        with as_other_worker():
+            for _ in range(2):
+                self.allow_at(60)
+
+        self.assertFalse(self.allow_at(60))
+
+
+class ActionScopedThrottleTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.addCleanup(clear_caches)
+        self.client = APIClient()
+        self.client.force_authenticate(
+            get_user_model().objects.create_user(
+                email="user@user.com",
+                password="user123456",
+            )
+        )
+
+    def test_order_creation_has_own_limit(self):
+        statuses = [
+            self.client.post(ORDER_URL, {}, format="json").status_code
+            for _ in range(11)
+        ]
+
+        self.assertEqual(
+            statuses,
+            [status.HTTP_400_BAD_REQUEST] * 10
+            + [status.HTTP_429_TOO_MANY_REQUESTS]
+        )
+        self.assertEqual(
+            self.client.get(FLIGHT_URL).status_code, status.HTTP_200_OK
+        )
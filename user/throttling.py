@@ -0,0 +1,104 @@
+from rest_framework.throttling import SimpleRateThrottle
+
+from airport_api_service.caches import shared_cache
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Counts requests of the current and previous fixed windows,
+    the previous count weighted by how much of it the sliding window
+    still covers; one read and one increment per request
+    """
+
+    cache_format = "throttle_%(scope)s_%(ident)s"
+
+    # counted by all workers, incr and add are atomic on RedisCache
+    cache = shared_cache
+
+    def get_window_keys(self, window: int) -> tuple:
+        return f"{self.key}:{window}", f"{self.key}:{window - 1}"
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window, elapsed = divmod(self.now, self.duration)
+        current_key, previous_key = self.get_window_keys(int(window))
+        counts = self.cache.get_many([current_key, previous_key])
+        estimated = (
+            counts.get(previous_key, 0) * (1 - elapsed / self.duration)
+            + counts.get(current_key, 0)
+        )
+
+        if estimated >= self.num_requests:
+            self.wait_seconds = self.duration - elapsed
+
+            return self.throttle_failure()
+
+        # the previous window is read during the whole next one
+        if not self.cache.add(current_key, 1, self.duration * 2):
+            try:
+                self.cache.incr(current_key)
+            except ValueError:
+                self.cache.set(current_key, 1, self.duration * 2)
+
+        return True
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class AnonSlidingWindowThrottle(SlidingWindowRateThrottle):
+    scope = "anon"
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return None
+
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class UserSlidingWindowThrottle(SlidingWindowRateThrottle):
+    scope = "user"
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
+
+class ActionScopedSlidingWindowThrottle(UserSlidingWindowThrottle):
+    """
+    Limits the actions listed in the throttle_scopes of the view,
+    ex. throttle_scopes = {"create": "orders"},
+    with the rate of the scope in DEFAULT_THROTTLE_RATES
+    """
+
+    def __init__(self):
+        # the rate is known only once the view is, see ScopedRateThrottle
+        pass
+
+    def allow_request(self, request, view):
+        self.scope = getattr(view, "throttle_scopes", {}).get(
+            getattr(view, "action", None)
+        )
+
+        if not self.scope:
+            return True
+
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+
+        return super().allow_request(request, view)